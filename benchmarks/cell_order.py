@@ -0,0 +1,58 @@
+"""
+Compares search node counts and solving time of row-major and minimum
+remaining values cell selection on the grids from the test data.
+
+Run from the project's root directory:
+    python -m benchmarks.cell_order
+"""
+import time
+from copy import deepcopy
+
+from sudoku_solver.bitmask import (
+    BitmaskSolver, MINIMUM_REMAINING_VALUES, ROW_MAJOR
+)
+from tests.test_data import sudoku_grids
+
+
+GRIDS = (
+    'grid1',
+    'grid2',
+    'difficult_case_grid',
+    'adversarial_grid',
+    'zeros',
+)
+
+
+def measure(grid, cell_order):
+    """
+    Solves copy of the grid with the given cell selection strategy.
+
+    Args:
+        grid (list): Partially filled-in sudoku grid.
+        cell_order (str): Cell selection strategy.
+
+    Returns:
+        tuple: Number of search nodes and solving time in milliseconds.
+    """
+    solver = BitmaskSolver(deepcopy(grid), cell_order=cell_order)
+    start = time.perf_counter()
+    solver.solve()
+    return solver.nodes, (time.perf_counter() - start) * 1000
+
+
+def main():
+    header = f'{"grid":<22}{"row-major nodes":>17}{"mrv nodes":>12}'
+    header += f'{"row-major ms":>15}{"mrv ms":>10}'
+    print(header)
+    for name in GRIDS:
+        grid = getattr(sudoku_grids, name)
+        row_major_nodes, row_major_ms = measure(grid, ROW_MAJOR)
+        mrv_nodes, mrv_ms = measure(grid, MINIMUM_REMAINING_VALUES)
+        print(
+            f'{name:<22}{row_major_nodes:>17}{mrv_nodes:>12}'
+            f'{row_major_ms:>15.2f}{mrv_ms:>10.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
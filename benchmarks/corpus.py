@@ -0,0 +1,268 @@
+"""
+Benchmark corpus of sudokus bucketed by difficulty, one sudoku's string per
+line in ``benchmarks/corpus/<bucket>.txt``:
+
+- easy: unique sudokus with 36 givens,
+- hard: minimal unique sudokus (no given can be removed) needing at least
+  `HARD_MIN_NODES` search nodes, found by local search (see `harden`),
+- seventeen: distinct known 17-clue sudokus (the fewest givens of a unique
+  sudoku),
+- adversarial: known grids expensive for backtracking solvers.
+
+The files are checked in, so results are comparable across commits. They
+are generated with a fixed seed, regenerate them (only when the corpus has
+to change) from the project's root directory, the hard bucket takes tens
+of minutes:
+    python -m benchmarks.corpus
+"""
+import os
+import random
+
+from sudoku_solver.canonical import Transform
+from sudoku_solver.solver import (
+    DLX, create_solver, grid_to_sudoku_str, is_unique, solve_sudoku,
+    sudoku_str_to_grid
+)
+from tests.test_data.sudoku_grids import adversarial_grid, difficult_case_grid
+
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), 'corpus')
+BUCKETS = ('easy', 'hard', 'seventeen', 'adversarial')
+SEED = 2022
+PUZZLES_PER_BUCKET = 20
+EASY_GIVENS = 36
+# Random minimal sudokus rarely need more than 100 nodes, known hard ones
+# (e.g. Easter Monster) need about 300
+HARD_MIN_NODES = 300
+# Steps of `harden` before it gives up and starts from a new solution
+HARDEN_STEPS = 3000
+# `harden` accepts changes keeping at least this fraction of nodes, so it
+# can leave local maxima
+HARDEN_ACCEPT = 0.8
+
+# Distinct (not equivalent) 17-clue sudokus from Gordon Royle's collection
+SEVENTEEN_CLUE_SUDOKUS = (
+    '.......1.4.........2...........5.4.7..8...3....1.9....3..4..2...5.1'
+    '........8.6...',
+    '.......1.4.........2...........5.6.4..8...3....1.9....3..4..2...5.1'
+    '........8.7...',
+    '.......12....35......6...7.7.....3.....4..8..1...........12.....8..'
+    '...4..5....6..',
+    '.......12..8.3...........4.12.5..........47...6.......5.7...3.....6'
+    '2.......1.....',
+    '.......12.4..5.........9....7.6..4.....1............5.....875..6.1.'
+    '..3..2........',
+    '.......12.5.4............3.7..6..4....1..........8....92....8.....5'
+    '1.7.......3...',
+    '.......123......6.....4....9.....5.......1.7..2..........35.4....14'
+    '..8...6.......',
+    '.......124...9...........5..7.2.....6.....4.....1.8....18..........'
+    '3.7..5.2......',
+    '.......125....8......7.....6..12....7.....45.....3.....3....8.....5'
+    '..7...2.......',
+    '.......127...6...........5..8.2.....6.....4.....1.9....19..........'
+    '3.8..5.2......',
+    '.......128...4...........6..9.2.....7.....4.....5.1....15..........'
+    '3.9..6.2......',
+    '.......1298..........6.....1..7...8.4.2.........3..6...7....3...5..'
+    '4........1....',
+    '.......13....3..8..7..........2.6....3....9......1....6..5..2.4...4'
+    '..7..1........',
+    '.......13...2............8....76.2....8...4...1.......2.....75.6..3'
+    '4.........8...',
+    '.......13...5...7....8.2......4..9..1.7............2..89.....5..4..'
+    '..6......1....',
+    '.......13...7...6....5.8......4..8..1.6............2..74.....5..2..'
+    '..4......1....',
+    '.......13...8...7....5.2......4..9..1.7............2..89.....5..4..'
+    '..6......1....',
+    '.......13.2.5..............1.3....7....8.2.....4.........34.5..67..'
+    '..2......1....',
+    '.......13.4.....8.2...6....6.9...4.....8........3......3.1..5......'
+    '4.7.6.........',
+    '.......13.4.....8.2...6....9.6...4.....8........3......3.1..5......'
+    '4.7.6.........',
+)
+# Few givens in the top rows, the first one also has the solution's first
+# row in descending order which is the worst case of naive backtracking
+ADVERSARIAL_SUDOKUS = (
+    '..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1'
+    '........4...9',
+    grid_to_sudoku_str(adversarial_grid),
+    grid_to_sudoku_str(difficult_case_grid),
+)
+
+
+def load(bucket):
+    """
+    Reads sudoku's strings of the bucket.
+
+    Args:
+        bucket (str): Name of the bucket from `BUCKETS`.
+
+    Returns:
+        list: Sudoku's strings.
+    """
+    with open(os.path.join(CORPUS_DIR, f'{bucket}.txt')) as file:
+        return [line.strip() for line in file if line.strip()]
+
+
+def random_transform(rng):
+    """Returns random symmetry of sudoku (see `Transform`)."""
+    def line_order():
+        groups = rng.sample(range(3), 3)
+        return [
+            group * 3 + line
+            for group in groups
+            for line in rng.sample(range(3), 3)
+        ]
+    digits = [0] + rng.sample(range(1, 10), 9)
+    return Transform(rng.random() < 0.5, line_order(), line_order(), digits)
+
+
+def random_solution(rng):
+    """Returns random solved grid."""
+    grid = [[0] * 9 for _ in range(9)]
+    # Random digits of the first row lead to a different solution
+    grid[0] = rng.sample(range(1, 10), 9)
+    solve_sudoku(grid)
+    return random_transform(rng).apply(grid)
+
+
+def unique(grid):
+    """
+    Checks whether the sudoku has one solution. Uses DLX engine, the fastest
+    one on the sudokus `harden` goes through.
+    """
+    return is_unique(grid, DLX)
+
+
+def remove_givens(grid, rng, givens=None):
+    """
+    Removes givens in random order as long as the solution stays unique.
+
+    Args:
+        grid (list): Solved grid, it is not modified.
+        rng (random.Random): Random numbers generator.
+        givens (int): Stop at this number of givens. Defaults to None
+            (until no given can be removed).
+
+    Returns:
+        list: Unique sudoku.
+    """
+    grid = [row[:] for row in grid]
+    cells = rng.sample(range(81), 81)
+    left = 81
+    for cell in cells:
+        if givens is not None and left <= givens:
+            break
+        row, column = divmod(cell, 9)
+        value, grid[row][column] = grid[row][column], 0
+        if not unique(grid):
+            grid[row][column] = value
+        else:
+            left -= 1
+    return grid
+
+
+def nodes(sudoku_str):
+    """Returns number of search nodes of the default engine."""
+    solver = create_solver(sudoku_str_to_grid(sudoku_str))
+    solver.solve()
+    return solver.nodes
+
+
+def harden(solution, rng):
+    """
+    Looks for a minimal unique sudoku of the solution needing at least
+    `HARD_MIN_NODES` nodes. Starts from a random minimal sudoku and changes
+    it step by step - removes a given, moves a given to an empty cell or
+    transforms the sudoku (the engine's cell order makes equivalent sudokus
+    differ in nodes) - keeping changes which do not lose many nodes.
+
+    Args:
+        solution (list): Solved grid, it is not modified.
+        rng (random.Random): Random numbers generator.
+
+    Returns:
+        list: Hard sudoku or None when not found in `HARDEN_STEPS` steps.
+    """
+    sudoku = remove_givens(solution, rng)
+    current = nodes(grid_to_sudoku_str(sudoku))
+    for _ in range(HARDEN_STEPS):
+        if current >= HARD_MIN_NODES:
+            # Moving givens may leave removable ones
+            sudoku = remove_givens(sudoku, rng)
+            current = nodes(grid_to_sudoku_str(sudoku))
+            if current >= HARD_MIN_NODES:
+                return sudoku
+
+        candidate, candidate_solution = [row[:] for row in sudoku], solution
+        move = rng.random()
+        if move < 0.2:
+            transform = random_transform(rng)
+            candidate = transform.apply(candidate)
+            candidate_solution = transform.apply(solution)
+        else:
+            cells = [divmod(cell, 9) for cell in range(81)]
+            row, column = rng.choice([
+                (row, column) for row, column in cells
+                if candidate[row][column]
+            ])
+            candidate[row][column] = 0
+            if move < 0.9:
+                row, column = rng.choice([
+                    (row, column) for row, column in cells
+                    if not candidate[row][column]
+                ])
+                candidate[row][column] = solution[row][column]
+            if not unique(candidate):
+                continue
+        candidate_nodes = nodes(grid_to_sudoku_str(candidate))
+        if candidate_nodes >= current * HARDEN_ACCEPT:
+            sudoku, solution = candidate, candidate_solution
+            current = candidate_nodes
+    return None
+
+
+def generate(bucket, rng):
+    """
+    Generates sudoku's strings of the bucket.
+
+    Args:
+        bucket (str): Name of the bucket from `BUCKETS`.
+        rng (random.Random): Random numbers generator.
+
+    Returns:
+        list: Sudoku's strings.
+    """
+    if bucket == 'adversarial':
+        return list(ADVERSARIAL_SUDOKUS)
+    if bucket == 'seventeen':
+        return list(SEVENTEEN_CLUE_SUDOKUS)
+
+    sudokus = []
+    while len(sudokus) < PUZZLES_PER_BUCKET:
+        solution = random_solution(rng)
+        if bucket == 'easy':
+            sudoku = remove_givens(solution, rng, EASY_GIVENS)
+        else:
+            sudoku = harden(solution, rng)
+            if sudoku is None:
+                continue
+        sudokus.append(grid_to_sudoku_str(sudoku))
+    return sudokus
+
+
+def main():
+    rng = random.Random(SEED)
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    for bucket in BUCKETS:
+        sudokus = generate(bucket, rng)
+        with open(os.path.join(CORPUS_DIR, f'{bucket}.txt'), 'w') as file:
+            file.writelines(f'{sudoku}\n' for sudoku in sudokus)
+        print(f'{bucket:<12}{len(sudokus):>4} sudokus')
+
+
+if __name__ == '__main__':
+    main()
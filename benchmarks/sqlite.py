@@ -0,0 +1,129 @@
+"""
+Compares throughput of concurrent reads and writes of users in SQLite with
+its default settings and with the performance pragmas (WAL journal,
+``synchronous=NORMAL``, memory mapping, bigger page cache and busy timeout)
+set by `fastapi_server.db.session.set_sqlite_pragmas`.
+
+Reader and writer threads use sessions and CRUD operations of the API on a
+temporary database file, a write is a lookup, update and commit of a user.
+
+Run from the project's root directory:
+    python -m benchmarks.sqlite
+"""
+import os
+import random
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from fastapi_server import crud
+from fastapi_server.db.base import Base
+from fastapi_server.db.session import set_sqlite_pragmas
+from fastapi_server.models import User
+
+
+USERS = 100
+READERS = 4
+WRITERS = 2
+DURATION = 3.0
+MODES = (
+    ('default', {}),
+    (
+        'performance',
+        {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'mmap_size': 64 * 1024 * 1024,
+            'cache_size': -16000,
+            'busy_timeout': 5000,
+        },
+    ),
+)
+
+
+def prepare(path, pragmas):
+    """Creates the database with users, returns its session factory."""
+    engine = create_engine(
+        f'sqlite:///{path}', connect_args={'check_same_thread': False}
+    )
+    set_sqlite_pragmas(engine, pragmas)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with Session() as db:
+        db.add_all(
+            User(email=f'user{id}@example.com', hashed_password='-')
+            for id in range(1, USERS + 1)
+        )
+        db.commit()
+    return engine, Session
+
+
+def work(Session, write, deadline, counts, lock):
+    """Reads or updates random users until the deadline."""
+    rng = random.Random()
+    operations = errors = 0
+    while time.perf_counter() < deadline:
+        try:
+            with Session() as db:
+                user = crud.user.get(db, rng.randint(1, USERS))
+                if write:
+                    crud.user.update(
+                        db, user_db=user,
+                        user_in={'first_name': str(rng.random())}
+                    )
+            operations += 1
+        except OperationalError:
+            # `database is locked`
+            errors += 1
+    with lock:
+        counts['writes' if write else 'reads'] += operations
+        counts['errors'] += errors
+
+
+def measure(pragmas):
+    """
+    Runs readers and writers for `DURATION` seconds.
+
+    Returns:
+        dict: Reads and writes per second and number of failed operations.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        engine, Session = prepare(os.path.join(directory, 'users.db'), pragmas)
+        counts = {'reads': 0, 'writes': 0, 'errors': 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + DURATION
+        threads = [
+            threading.Thread(
+                target=work, args=(Session, write, deadline, counts, lock)
+            )
+            for write in [False] * READERS + [True] * WRITERS
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+    return {
+        'reads_per_second': counts['reads'] / DURATION,
+        'writes_per_second': counts['writes'] / DURATION,
+        'errors': counts['errors'],
+    }
+
+
+def main():
+    print(f'{READERS} readers, {WRITERS} writers, {DURATION} s')
+    print(f'{"mode":<14}{"reads/s":>10}{"writes/s":>10}{"errors":>8}')
+    for name, pragmas in MODES:
+        result = measure(pragmas)
+        print(
+            f'{name:<14}{result["reads_per_second"]:>10.1f}'
+            f'{result["writes_per_second"]:>10.1f}{result["errors"]:>8}'
+        )
+
+
+if __name__ == '__main__':
+    main()
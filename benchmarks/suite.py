@@ -0,0 +1,200 @@
+"""
+Benchmark suite of the solving engines on the difficulty-bucketed corpus
+(see `benchmarks.corpus`). For every engine and bucket it reports solved
+puzzles per second, p50 and p99 latency and search nodes.
+
+Results can be saved as JSON and compared with results of another commit -
+the command fails (exit status 1) when throughput drops, latency or search
+nodes grow more than `--threshold` relative to the baseline.
+
+Run from the project's root directory:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --threshold 0.2
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+
+from benchmarks.corpus import BUCKETS, load
+from sudoku_solver.pipeline import parse_cells
+from sudoku_solver.solver import ENGINES, create_solver
+
+
+# Compared metrics -> whether higher value is better
+METRICS = {
+    'puzzles_per_second': True,
+    'p50_ms': False,
+    'p99_ms': False,
+    'mean_nodes': False,
+}
+
+
+def percentile(values, fraction):
+    """
+    Computes percentile with the nearest-rank method.
+
+    Args:
+        values (list): Sorted values.
+        fraction (float): Percentile as a fraction, e.g. 0.99.
+
+    Returns:
+        float: The smallest value not less than `fraction` of values.
+    """
+    rank = max(math.ceil(fraction * len(values)), 1)
+    return values[rank - 1]
+
+
+def measure(sudokus, engine, repeat=1):
+    """
+    Solves every sudoku `repeat` times with the engine.
+
+    Args:
+        sudokus (list): Sudoku's strings.
+        engine (str): Name of the engine from `ENGINES`.
+        repeat (int): Number of solves of every sudoku, the fastest one is
+            taken. Defaults to 1.
+
+    Returns:
+        dict: Number of puzzles, puzzles per second, p50 and p99 latency in
+            milliseconds and the mean and the highest number of search
+            nodes.
+    """
+    latencies = []
+    nodes = []
+    for sudoku in sudokus:
+        best = float('inf')
+        for _ in range(repeat):
+            cells = parse_cells(sudoku)
+            start = time.perf_counter()
+            solver = create_solver(cells, engine)
+            solver.solve()
+            best = min(best, time.perf_counter() - start)
+        latencies.append(best * 1000)
+        nodes.append(solver.nodes)
+    latencies.sort()
+    return {
+        'puzzles': len(sudokus),
+        'puzzles_per_second': round(len(sudokus) * 1000 / sum(latencies), 1),
+        'p50_ms': round(percentile(latencies, 0.5), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'mean_nodes': round(sum(nodes) / len(nodes), 1),
+        'max_nodes': max(nodes),
+    }
+
+
+def run(engines, buckets, repeat=1):
+    """
+    Measures engines on buckets of the corpus.
+
+    Returns:
+        dict: Environment and results - engine -> bucket -> metrics (see
+            `measure`).
+    """
+    results = {
+        engine: {
+            bucket: measure(load(bucket), engine, repeat)
+            for bucket in buckets
+        }
+        for engine in engines
+    }
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Finds metrics worse than the baseline by more than the threshold.
+
+    Args:
+        results (dict): Current results (see `run`).
+        baseline (dict): Results to compare with.
+        threshold (float): Allowed relative change, e.g. 0.2 is 20%.
+
+    Returns:
+        list: Descriptions of regressions.
+    """
+    regressions = []
+    for engine, buckets in results['results'].items():
+        for bucket, metrics in buckets.items():
+            base = baseline['results'].get(engine, {}).get(bucket)
+            if base is None:
+                continue
+            for metric, higher_is_better in METRICS.items():
+                value, base_value = metrics[metric], base[metric]
+                if higher_is_better:
+                    worse = value < base_value * (1 - threshold)
+                else:
+                    worse = value > base_value * (1 + threshold)
+                if worse:
+                    regressions.append(
+                        f'{engine}/{bucket}: {metric} {value} '
+                        f'(baseline {base_value})'
+                    )
+    return regressions
+
+
+def print_table(results):
+    header = f'{"engine":<10}{"bucket":<13}{"puzzles/s":>11}{"p50 ms":>10}'
+    header += f'{"p99 ms":>10}{"mean nodes":>12}{"max nodes":>11}'
+    print(header)
+    for engine, buckets in results['results'].items():
+        for bucket, metrics in buckets.items():
+            print(
+                f'{engine:<10}{bucket:<13}'
+                f'{metrics["puzzles_per_second"]:>11.1f}'
+                f'{metrics["p50_ms"]:>10.3f}{metrics["p99_ms"]:>10.3f}'
+                f'{metrics["mean_nodes"]:>12.1f}{metrics["max_nodes"]:>11}'
+            )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--engines', nargs='+', choices=sorted(ENGINES),
+        default=sorted(ENGINES), help='Engines to measure (default: all).'
+    )
+    parser.add_argument(
+        '--buckets', nargs='+', choices=BUCKETS, default=list(BUCKETS),
+        help='Buckets of the corpus (default: all).'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='Solves of every sudoku, the fastest counts (default: 3).'
+    )
+    parser.add_argument('--output', help='Save results as JSON.')
+    parser.add_argument('--baseline', help='JSON results to compare with.')
+    parser.add_argument(
+        '--threshold', type=float, default=0.2,
+        help='Allowed relative regression against the baseline '
+             '(default: 0.2).'
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run(args.engines, args.buckets, args.repeat)
+    print_table(results)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'Regression: {regression}', file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
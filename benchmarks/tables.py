@@ -0,0 +1,107 @@
+"""
+Compares per-call time of validation routines re-deriving units on every call
+(the previous implementations, copied below) and the ones using precomputed
+unit and peer tables of `sudoku_solver.tables`.
+
+Run from the project's root directory:
+    python -m benchmarks.tables
+"""
+import timeit
+
+from sudoku_solver.solver import is_safe, is_valid_boxes, is_valid_column
+from tests.test_data.sudoku_grids import difficult_case_grid, grid1
+
+
+REPEAT = 5
+NUMBER = 20000
+
+
+def recomputed_is_safe(grid, row, column, number):
+    for x in range(9):
+        if grid[row][x] == number:
+            return False
+    for x in range(9):
+        if grid[x][column] == number:
+            return False
+    start_row = row - row % 3
+    start_column = column - column % 3
+    for x in range(3):
+        for y in range(3):
+            if grid[x + start_row][y + start_column] == number:
+                return False
+    return True
+
+
+def recomputed_is_valid_column(grid, column_number):
+    column = list(filter(
+        lambda value: value != 0, [row[column_number] for row in grid]
+    ))
+    return len(column) == len(set(column))
+
+
+def recomputed_is_valid_boxes(grid):
+    for row in range(0, 9, 3):
+        for col in range(0, 9, 3):
+            box = []
+            for x in range(row, row+3):
+                for y in range(col, col+3):
+                    if grid[x][y] != 0:
+                        box.append(grid[x][y])
+            if len(box) != len(set(box)):
+                return False
+    return True
+
+
+CASES = (
+    # Name, recomputed call, call using tables
+    (
+        'is_safe (safe)',
+        lambda: recomputed_is_safe(difficult_case_grid, 4, 4, 9),
+        lambda: is_safe(difficult_case_grid, 4, 4, 9),
+    ),
+    (
+        'is_safe (row conflict)',
+        lambda: recomputed_is_safe(grid1, 0, 2, 3),
+        lambda: is_safe(grid1, 0, 2, 3),
+    ),
+    (
+        'is_valid_column',
+        lambda: recomputed_is_valid_column(grid1, 4),
+        lambda: is_valid_column(grid1, 4),
+    ),
+    (
+        'is_valid_boxes',
+        lambda: recomputed_is_valid_boxes(grid1),
+        lambda: is_valid_boxes(grid1),
+    ),
+)
+
+
+def measure(call):
+    """
+    Measures the call with `timeit`.
+
+    Args:
+        call (callable): Function without arguments.
+
+    Returns:
+        float: The best time of one call in microseconds.
+    """
+    times = timeit.repeat(call, repeat=REPEAT, number=NUMBER)
+    return min(times) / NUMBER * 1e6
+
+
+def main():
+    print(f'{"routine":<26}{"recomputed us":>15}{"tables us":>12}{"x":>7}')
+    for name, recomputed, tables in CASES:
+        assert recomputed() == tables()
+        recomputed_us = measure(recomputed)
+        tables_us = measure(tables)
+        print(
+            f'{name:<26}{recomputed_us:>15.3f}{tables_us:>12.3f}'
+            f'{recomputed_us / tables_us:>7.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
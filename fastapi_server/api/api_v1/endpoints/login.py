@@ -3,17 +3,18 @@ from datetime import timedelta
 
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi_server import crud
 from fastapi_server.core import security
 from fastapi_server.api.dependencies import (
     additional_responses,
-    get_db, get_current_user
+    get_async_db, get_current_user
 )
 from fastapi_server.core.config import settings
 from fastapi_server.models import User as UserModel
 from fastapi_server.schemas import Token, User
+from fastapi_server.services.password_pool import password_pool
 
 router = APIRouter()
 
@@ -37,14 +38,17 @@ router = APIRouter()
         }
     }
 })
-def login_access_token(
-    db: Session = Depends(get_db),
+async def login_access_token(
+    db: AsyncSession = Depends(get_async_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """OAuth2 compatible token login get an access token for future requests"""
-    user = crud.user.authenticate(
-        db, email=form_data.username, password=form_data.password
-    )
+    # Password is verified in the password pool, bursts of logins wait for
+    # a login slot without blocking other endpoints
+    async with password_pool.login_slot():
+        user = await crud.user.authenticate_async(
+            db, email=form_data.username, password=form_data.password
+        )
     if not user:
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
@@ -72,9 +76,9 @@ def login_access_token(
     response_model=User,
     responses=additional_responses
 )
-def test_token(
+async def test_token(
     current_user: UserModel = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Test access token"""
     return current_user
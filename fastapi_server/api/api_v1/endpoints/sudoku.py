@@ -1,28 +1,155 @@
-from fastapi import APIRouter
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import (
+    APIRouter, HTTPException, Query, Request, Response, status
+)
 from fastapi.params import Body, Depends
+from starlette.concurrency import run_in_threadpool
 
-from fastapi_server.models import User
-from fastapi_server.schemas import SudokuIn, SudokuOut
+from fastapi_server.core.config import settings
+from fastapi_server.schemas import (
+    SudokuBatchIn, SudokuBatchOut, SudokuEngine, SudokuIn, SudokuOut
+)
 from fastapi_server.api.dependencies import get_current_active_user
-from sudoku_solver.solver import (
-    is_valid_sudoku_grid,
-    solve_sudoku,
-    sudoku_str_to_grid,
-    grid_to_sudoku_str,
+from fastapi_server.services.auth_cache import UserSnapshot
+from fastapi_server.services.solver_pool import (
+    SolverPoolBusy, SolverPoolTimeout, solver_pool
 )
+from fastapi_server.services.sudoku import (
+    PACKED_ERROR,
+    PACKED_SOLVABLE,
+    PACKED_UNSOLVABLE,
+    complete_sudoku_strs,
+    conflict_result,
+    pack_results,
+    prepare_sudoku_strs,
+    solve_sudoku_batch,
+    solve_sudoku_str,
+    unpack_sudoku_strs,
+)
+from sudoku_solver import codec
+from sudoku_solver.exceptions import SearchAborted
 
 
 router = APIRouter()
 
+PACKED_MEDIA_TYPE = 'application/octet-stream'
+
+solver_unavailable_responses = {
+    status.HTTP_503_SERVICE_UNAVAILABLE: {
+        'description': 'Solver unavailable',
+        'content': {
+            'application/json': {
+                'examples': {
+                    'busy': {
+                        'summary': 'Too many sudokus are being solved',
+                        'value': {
+                            'detail': 'Solver is busy, try again later'
+                        }
+                    },
+                    'timeout': {
+                        'summary': 'Solving took too long',
+                        'value': {'detail': 'Solving took too long'}
+                    },
+                }
+            }
+        }
+    }
+}
+
+
+async def run_solver(func: Callable, *args: Any, tasks: int = 1) -> Any:
+    """
+    Run solving function in the solver pool. Aborted search ends with 422,
+    failures of the pool with 503.
+    """
+    try:
+        return await solver_pool.run(func, *args, tasks=tasks)
+    except SearchAborted as aborted:
+        raise HTTPException(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f'Sudoku is too hard: {aborted}'
+        )
+    except SolverPoolBusy:
+        raise HTTPException(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Solver is busy, try again later'
+        )
+    except SolverPoolTimeout:
+        raise HTTPException(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Solving took too long'
+        )
+
+
+async def solve_in_pool(
+    sudokus: List[str],
+    engine: str,
+    solutions_limit: Optional[int]
+) -> List[Dict[str, Any]]:
+    """Solve correct sudokus in chunks spread over worker processes"""
+    chunk_size = -(-len(sudokus) // max(solver_pool.workers, 1))
+    chunks = await asyncio.gather(*(
+        run_solver(
+            solve_sudoku_batch,
+            sudokus[start:start + chunk_size],
+            engine,
+            solutions_limit,
+            settings.SOLVER_MAX_NODES,
+            settings.SOLVER_TIME_LIMIT_SECONDS,
+            tasks=len(sudokus[start:start + chunk_size])
+        )
+        for start in range(0, len(sudokus), chunk_size)
+    ))
+    return [result for chunk in chunks for result in chunk]
+
+
+async def solve_sudokus(
+    sudokus: List[str],
+    engine: str,
+    solutions_limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Solve many sudoku's strings with the solution cache. Equivalent sudokus
+    are solved once, results are in the input order.
+    """
+    options = (engine, solutions_limit)
+    results, missing = await run_in_threadpool(
+        prepare_sudoku_strs, sudokus, *options
+    )
+
+    # Equivalent sudokus are solved once, only not cached ones in the pool
+    canonicals = {key: canonical for key, canonical, _ in missing.values()}
+    if canonicals:
+        solved = dict(zip(canonicals, await solve_in_pool(
+            list(canonicals.values()), *options
+        )))
+        results = await run_in_threadpool(
+            complete_sudoku_strs, results, missing, solved
+        )
+    return results
+
 
 @router.post(
     '/',
     response_model=SudokuOut,
     summary='Solve the sudoku',
-    description='Solve the sudoku if it is possible and return the solution.',
+    description=(
+        'Solve the sudoku if it is possible and return the solution. '
+        'Optionally count solutions up to `solutions_limit`. Search which '
+        'exceeds the node budget or the time limit ends with 422 response. '
+        'With `stats` flag the statistics of the search are returned too, '
+        'such sudoku is always solved as sent (without cached solutions).'
+    ),
+    response_model_exclude_none=True,
+    responses=solver_unavailable_responses,
 )
-def solve(
-    current_user: User = Depends(get_current_active_user),
+async def solve(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    stats: bool = Query(
+        False, description='Return statistics of the search.'
+    ),
     sudoku_in: SudokuIn = Body(
         ...,
         examples={
@@ -38,6 +165,26 @@ def solve(
                     ),
                 }
             },
+            'dlx_engine': {
+                'summary': 'Correct data solved with Dancing Links engine.',
+                'value': {
+                    'sudoku': (
+                        '..98..7.41..5..6...3...7.9.5.27.8.3..81.5...664.123.'
+                        '5....24.3..9..6.18....5..9.2.'
+                    ),
+                    'engine': 'dlx',
+                }
+            },
+            'uniqueness': {
+                'summary': 'Check whether the solution is unique.',
+                'value': {
+                    'sudoku': (
+                        '..98..7.41..5..6...3...7.9.5.27.8.3..81.5...664.123.'
+                        '5....24.3..9..6.18....5..9.2.'
+                    ),
+                    'solutions_limit': 2,
+                }
+            },
             'zeros': {
                 'summary': 'Correct data using zeros with solution.',
                 'value': {
@@ -74,8 +221,171 @@ def solve(
         }
     )
 ):
-    grid = sudoku_str_to_grid(sudoku_in.dict()['sudoku'])
-    solvable = is_valid_sudoku_grid(grid)
-    if solvable:
-        solve_sudoku(grid)
-    return SudokuOut(sudoku=grid_to_sudoku_str(grid), solvable=solvable)
+    options = (sudoku_in.engine.value, sudoku_in.solutions_limit)
+    limits = (settings.SOLVER_MAX_NODES, settings.SOLVER_TIME_LIMIT_SECONDS)
+    if stats:
+        # Statistics describe the search of the sent sudoku, not of its
+        # canonical form, and are not cached
+        result = await run_in_threadpool(
+            conflict_result, sudoku_in.sudoku, sudoku_in.solutions_limit
+        )
+        if result is None:
+            result = await run_solver(
+                solve_sudoku_str, sudoku_in.sudoku, *options, *limits, True
+            )
+        return SudokuOut(**result)
+
+    results, missing = await run_in_threadpool(
+        prepare_sudoku_strs, [sudoku_in.sudoku], *options
+    )
+    if missing:
+        key, canonical, _ = missing[0]
+        result = await run_solver(
+            solve_sudoku_str, canonical, *options, *limits
+        )
+        results = await run_in_threadpool(
+            complete_sudoku_strs, results, missing, {key: result}
+        )
+    return SudokuOut(**results[0])
+
+
+@router.post(
+    '/batch',
+    response_model=SudokuBatchOut,
+    summary='Solve many sudokus',
+    description=(
+        'Solve many sudokus in one request. Results are returned in the '
+        'input order. Incorrect sudoku\'s strings and searches exceeding '
+        'the node budget or the time limit are reported per item with '
+        '`error` message instead of failing the whole batch.'
+    ),
+    response_model_exclude_none=True,
+    responses=solver_unavailable_responses,
+)
+async def solve_batch(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    batch_in: SudokuBatchIn = Body(
+        ...,
+        examples={
+            'correct': {
+                'summary': 'Correct sudokus.',
+                'value': {
+                    'sudokus': [
+                        '..98..7.41..5..6...3...7.9.5.27.8.3..81.5...664.123.'
+                        '5....24.3..9..6.18....5..9.2.',
+                        '0098007041005006000300070905027080300810500066401230'
+                        '50000240300900601800005009020',
+                    ],
+                }
+            },
+            'incorrect_item': {
+                'summary': 'Batch with incorrect sudoku\'s string.',
+                'value': {
+                    'sudokus': [
+                        '..98..7.41..5..6...3...7.9.5.27.8.3..81.5...664.123.'
+                        '5....24.3..9..6.18....5..9.2.',
+                        '..98..7.41..5..6...3..7.9..5..123.',
+                    ],
+                    'engine': 'dlx',
+                }
+            },
+        }
+    )
+):
+    results = await solve_sudokus(
+        batch_in.sudokus, batch_in.engine.value, batch_in.solutions_limit
+    )
+    return SudokuBatchOut(results=results)
+
+
+async def read_body(request: Request, max_size: int, detail: str) -> bytes:
+    """
+    Read the request's body, rejecting it as soon as it is known to exceed
+    `max_size` bytes - from `Content-Length` or while streaming.
+    """
+    too_large = HTTPException(
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail
+    )
+    content_length = request.headers.get('content-length', '')
+    if content_length.isdigit() and int(content_length) > max_size:
+        raise too_large
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_size:
+            raise too_large
+    return bytes(body)
+
+
+@router.post(
+    '/batch/packed',
+    response_class=Response,
+    summary='Solve many packed sudokus',
+    description=(
+        'Binary version of the batch for high-volume clients. The body is '
+        'a sequence of sudokus packed with 4 bits per cell (41 bytes each, '
+        'see `sudoku_solver.codec.pack`). The response has a 42 bytes '
+        'record per sudoku in the input order: status byte '
+        f'({PACKED_UNSOLVABLE} - not solvable, {PACKED_SOLVABLE} - '
+        f'solvable, {PACKED_ERROR} - incorrect sudoku or aborted search) '
+        'and the packed solution (the sent sudoku when it is not solved).'
+    ),
+    responses={
+        status.HTTP_200_OK: {
+            'content': {'application/octet-stream': {}},
+            'description': 'Packed results.',
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {
+            'description': 'Body has more sudokus than a batch allows',
+        },
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {
+            'description': 'Body is not `application/octet-stream`',
+        },
+        **solver_unavailable_responses,
+    },
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/octet-stream': {
+                    'schema': {'type': 'string', 'format': 'binary'}
+                }
+            },
+        }
+    },
+)
+async def solve_batch_packed(
+    request: Request,
+    engine: SudokuEngine = SudokuEngine.bitmask,
+    current_user: UserSnapshot = Depends(get_current_active_user),
+):
+    # Parameters like `charset` do not change the media type
+    content_type = request.headers.get('content-type', '')
+    if content_type.split(';', 1)[0].strip().lower() != PACKED_MEDIA_TYPE:
+        raise HTTPException(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f'Body must be {PACKED_MEDIA_TYPE}'
+        )
+    detail = (
+        f'Body must contain from 1 to {settings.SUDOKU_BATCH_MAX_SIZE}'
+        f' sudokus of {codec.PACKED_SIZE} bytes'
+    )
+    data = await read_body(
+        request, settings.SUDOKU_BATCH_MAX_SIZE * codec.PACKED_SIZE, detail
+    )
+    count, remainder = divmod(len(data), codec.PACKED_SIZE)
+    if remainder or not count:
+        raise HTTPException(
+            status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail
+        )
+
+    sudokus = unpack_sudoku_strs(data)
+    solved = iter(await solve_sudokus(
+        [sudoku for sudoku in sudokus if sudoku is not None], engine.value
+    ))
+    results = [
+        None if sudoku is None else next(solved) for sudoku in sudokus
+    ]
+    return Response(
+        content=pack_results(results, data), media_type=PACKED_MEDIA_TYPE
+    )
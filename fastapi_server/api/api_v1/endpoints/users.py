@@ -1,13 +1,13 @@
 from copy import deepcopy
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, HTTPException, status, Query, Path
+from fastapi import APIRouter, HTTPException, Response, status, Query, Path
 from fastapi.param_functions import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi_server import crud
 from fastapi_server.api.dependencies import (
-    get_db,
+    get_async_db,
     get_current_active_user,
     get_current_active_superuser,
     additional_responses,
@@ -16,6 +16,8 @@ from fastapi_server.api.dependencies import (
 )
 from fastapi_server.models import User as UserModel
 from fastapi_server.schemas import User, UserCreate, UserUpdate
+from fastapi_server.services.auth_cache import UserSnapshot, auth_cache
+from fastapi_server.services.users_count import users_count
 
 router = APIRouter()
 
@@ -45,25 +47,49 @@ read_users_responses['403']['content']['application/json']['examples'].update(
 )
 
 
+# Only columns of the response schema are selected (no password's hash)
+user_columns = [getattr(UserModel, field) for field in User.__fields__]
+
+
 @router.get(
     '/',
     response_model=List[User],
     summary='Get users from database',
     responses=read_users_responses
 )
-def read_users(
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user),
+async def read_users(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     skip: Optional[int] = Query(0, ge=0, description='Skip N first records'),
     limit: Optional[int] = Query(
         100, gt=0, description='Max number of records'
+    ),
+    after_id: Optional[int] = Query(
+        None,
+        ge=0,
+        description=(
+            'Return users with greater id (keyset pagination, pass '
+            '`X-Next-After-Id` header of the previous page instead of `skip`)'
+        )
+    ),
+    with_count: bool = Query(
+        False,
+        description='Return total number of users in `X-Total-Count` header'
     )
 ) -> Any:
     """
-    Get list of users from database. Only allowed for active and authenticated
-    users.
+    Get list of users ordered by id from database. Only allowed for active
+    and authenticated users. `X-Next-After-Id` header holds `after_id` of the
+    next page when this page is full.
     """
-    users = crud.user.get_multi(db, skip=skip, limit=limit)
+    users = await crud.user.get_multi_async(
+        db, skip=skip, limit=limit, after_id=after_id, columns=user_columns
+    )
+    if len(users) == limit:
+        response.headers['X-Next-After-Id'] = str(users[-1].id)
+    if with_count:
+        response.headers['X-Total-Count'] = str(await users_count.get(db))
     return users
 
 
@@ -82,13 +108,13 @@ read_user_responses['404']['content']['application/json']['examples'].update({
     responses=read_user_responses,
     summary='Read user\'s data with given id'
 )
-def read_user_by_id(
+async def read_user_by_id(
     user_id: int = Path(..., gt=0, description='User\'s primary key - id'),
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserSnapshot = Depends(get_current_active_user),
 ) -> Any:
     """Get user's data with the given id if exists."""
-    user = crud.user.get(db, user_id)
+    user = await crud.user.get_async(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -103,15 +129,15 @@ def read_user_by_id(
     status_code=status.HTTP_201_CREATED,
     responses={status.HTTP_400_BAD_REQUEST: bad_request_not_unique_email}
 )
-def create_user(
+async def create_user(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_in: UserCreate
 ) -> Any:
     """
     Create user with the given data. E-mail has to be unique value per user.
     """
-    user_db = crud.user.get_by_email(db, user_in.email)
+    user_db = await crud.user.get_by_email_async(db, user_in.email)
     if user_db:
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
@@ -121,7 +147,8 @@ def create_user(
             )
         )
 
-    user_db = crud.user.create(db, user_in=user_in)
+    user_db = await crud.user.create_async(db, user_in=user_in)
+    users_count.invalidate()
     return user_db
 
 
@@ -141,15 +168,15 @@ update_user_responses['400'] = bad_request_not_unique_email
 
 
 @router.put('/{user_id}', response_model=User, responses=update_user_responses)
-def update_user(
+async def update_user(
     *,
     user_in: UserUpdate,
     user_id: int = Path(..., gt=0, description='User\'s primary key - id'),
-    db: Session = Depends(get_db),
-    current_superuser: User = Depends(get_current_active_superuser)
+    db: AsyncSession = Depends(get_async_db),
+    current_superuser: UserSnapshot = Depends(get_current_active_superuser)
 ) -> Any:
     """Update user's record with given data. Endpoint only for superusers"""
-    user_db = crud.user.get(db, id=user_id)
+    user_db = await crud.user.get_async(db, id=user_id)
     if not user_db:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -157,7 +184,7 @@ def update_user(
         )
     if (
         user_in.email != user_db.email and
-        crud.user.get_by_email(db, user_in.email)
+        await crud.user.get_by_email_async(db, user_in.email)
     ):
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
@@ -166,7 +193,11 @@ def update_user(
                 'system.'
             )
         )
-    user_db = crud.user.update(db, user_db=user_db, user_in=user_in)
+    user_db = await crud.user.update_async(
+        db, user_db=user_db, user_in=user_in
+    )
+    # Tokens of the user may carry outdated permissions
+    auth_cache.invalidate(user_id)
     return user_db
 
 
@@ -189,22 +220,24 @@ delete_user_responses['404']['content']['application/json']['examples'].update(
     response_model=User,
     responses=delete_user_responses
 )
-def remove_user(
+async def remove_user(
     *,
     user_id: int = Path(..., gt=0, description='User\'s primary key - id'),
-    db: Session = Depends(get_db),
-    current_superuser: User = Depends(get_current_active_superuser)
+    db: AsyncSession = Depends(get_async_db),
+    current_superuser: UserSnapshot = Depends(get_current_active_superuser)
 ):
     """
     Delete user's data with the given id if exists. Only superuser can delete
     data.
     """
-    user_db = crud.user.get(db, id=user_id)
+    user_db = await crud.user.get_async(db, id=user_id)
     if not user_db:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f'User with id {user_id} not found'
         )
 
-    user_db = crud.user.remove(db, id=user_id)
+    user_db = await crud.user.remove_async(db, id=user_id)
+    auth_cache.invalidate(user_id)
+    users_count.invalidate()
     return user_db
@@ -1,17 +1,18 @@
-from typing import Generator
+from typing import AsyncGenerator
 
 from jose import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import ValidationError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi_server import crud
 from fastapi_server.core.config import settings
 from fastapi_server.core.security import ALGORITHM
-from fastapi_server.db.session import SessionLocal
+from fastapi_server.db.session import AsyncSessionLocal
 from fastapi_server.models import User
 from fastapi_server.schemas import TokenPayload
+from fastapi_server.services.auth_cache import UserSnapshot, auth_cache
 
 
 oauth2_schema = OAuth2PasswordBearer(
@@ -79,18 +80,12 @@ not_active_superuser_response = {
 }
 
 
-def get_db() -> Generator:
-    try:
-        db = SessionLocal()
+async def get_async_db() -> AsyncGenerator:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(oauth2_schema)
-) -> User:
+def decode_token(token: str) -> TokenPayload:
     # Decode token and create schema TokenPayload object
     try:
         payload = jwt.decode(
@@ -109,9 +104,17 @@ def get_current_user(
             status.HTTP_403_FORBIDDEN,
             detail='Could not validate credentials'
         )
+    return token_data
+
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(oauth2_schema)
+) -> User:
+    token_data = decode_token(token)
 
     # Get user
-    user = crud.user.get(db, id=token_data.sub)
+    user = await crud.user.get_async(db, id=token_data.sub)
 
     # Raise an error if user does not exist.
     if not user:
@@ -123,7 +126,32 @@ def get_current_user(
     return user
 
 
-def get_current_active_user(user: User = Depends(get_current_user)) -> User:
+async def get_current_user_snapshot(
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(oauth2_schema)
+) -> UserSnapshot:
+    """
+    Fields of the current user needed by permission checks. Validated tokens
+    are cached (see `AuthCache`), so repeated requests skip decoding of the
+    token and the database query (the session connects only when used).
+    """
+    snapshot = auth_cache.get(token)
+    if snapshot is None:
+        token_data = decode_token(token)
+        user = await crud.user.get_async(db, id=token_data.sub)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail='User from token not found'
+            )
+        snapshot = UserSnapshot(user.id, user.is_active, user.is_superuser)
+        auth_cache.set(token, snapshot, token_data.exp)
+    return snapshot
+
+
+def get_current_active_user(
+    user: UserSnapshot = Depends(get_current_user_snapshot)
+) -> UserSnapshot:
     if not crud.user.is_active(user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -134,8 +162,8 @@ def get_current_active_user(user: User = Depends(get_current_user)) -> User:
 
 
 def get_current_active_superuser(
-    user: User = Depends(get_current_active_user)
-) -> User:
+    user: UserSnapshot = Depends(get_current_active_user)
+) -> UserSnapshot:
     if not crud.user.is_superuser(user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1,11 +1,14 @@
 # import secrets
 import os
+from typing import Any, Dict, Optional
 
-from pydantic import BaseSettings
+from pydantic import BaseSettings, validator
 
 OEG = os.environ.get
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 print(BASE_DIR)
+# Async driver of the database dialect, for the default async database URI
+ASYNC_DRIVERS = {'sqlite': 'aiosqlite', 'postgresql': 'asyncpg'}
 
 
 class Settings(BaseSettings):
@@ -18,10 +21,91 @@ class Settings(BaseSettings):
         'SECRET_KEY',
         'Z7dB4UikAcpG2VU7HHHOH-yifGtMPp3RJe08jon2MGw'
     )
-    SQL_ALCHEMY_DATABASE_URI = OEG(
+    SQL_ALCHEMY_DATABASE_URI: str = OEG(
         'SQL_ALCHEMY_DATABASE_URI',
         f'sqlite:///{os.path.join(BASE_DIR, "sqlite3.db")}'
     )
+    # The same database for the async engine (used by the endpoints), e.g.
+    # `postgresql+asyncpg://...`. Not set means `SQL_ALCHEMY_DATABASE_URI`
+    # with its async driver, so migrations and the API use one database
+    SQL_ALCHEMY_ASYNC_DATABASE_URI: Optional[str] = OEG(
+        'SQL_ALCHEMY_ASYNC_DATABASE_URI'
+    )
+    # Connections kept open in the pool, not set keeps the default pool of
+    # the database's dialect (SQLite file connections are not pooled)
+    DB_POOL_SIZE: Optional[int] = None
+    # Connections opened over `DB_POOL_SIZE` under load
+    DB_POOL_MAX_OVERFLOW = 10
+    # Seconds to wait for a free connection of the full pool
+    DB_POOL_TIMEOUT_SECONDS = 30.0
+    # Test connection before its checkout from the pool
+    DB_POOL_PRE_PING = True
+    # Pragmas set on every SQLite connection, not set keeps SQLite defaults.
+    # 'WAL' lets readers run concurrently with a writer
+    SQLITE_JOURNAL_MODE: Optional[str] = None
+    # 'NORMAL' syncs to disk only at WAL checkpoints instead of every commit
+    SQLITE_SYNCHRONOUS: Optional[str] = None
+    # Bytes of the database file read through memory mapping
+    SQLITE_MMAP_SIZE: Optional[int] = None
+    # Pages (or KiB when negative) of the page cache per connection
+    SQLITE_CACHE_SIZE: Optional[int] = None
+    # Milliseconds to wait for a lock before `database is locked` error
+    SQLITE_BUSY_TIMEOUT_MS: Optional[int] = None
+    # The highest allowed cap of counted solutions per sudoku
+    SUDOKU_MAX_SOLUTIONS_LIMIT = 1000
+    # The highest allowed number of sudokus in one batch request
+    SUDOKU_BATCH_MAX_SIZE = 1000
+    # Number of solver worker processes, 0 solves in the threadpool
+    SOLVER_POOL_SIZE = min(4, os.cpu_count() or 1)
+    # Puzzles waiting or being solved at once (a batch counts all of its
+    # puzzles), next requests get 503 response. Keep it at least
+    # `SUDOKU_BATCH_MAX_SIZE`, bigger batches would be always rejected
+    SOLVER_POOL_MAX_QUEUE = 2 * SUDOKU_BATCH_MAX_SIZE
+    # Start method of worker processes ('spawn', 'forkserver' or 'fork')
+    SOLVER_POOL_START_METHOD = 'spawn'
+    # Time limit of a single solve
+    SOLVER_TIMEOUT_SECONDS = 10.0
+    # Search of a single sudoku gives up after that many nodes...
+    SOLVER_MAX_NODES = 50000
+    # ...or seconds, keep it below `SOLVER_TIMEOUT_SECONDS` to free the worker
+    SOLVER_TIME_LIMIT_SECONDS = 5.0
+    # Worker processes are replaced after that many tasks per worker
+    SOLVER_MAX_TASKS_PER_WORKER = 1000
+    # Number of solving results kept in memory
+    SOLUTION_CACHE_SIZE = 10000
+    # 1 day * 24 hours * 60 minutes * 60 seconds = 1 day
+    SOLUTION_CACHE_TTL_SECONDS = 1 * 24 * 60 * 60
+    # SQLite database of the persistent cache tier, not set means memory only
+    SOLUTION_CACHE_PATH: Optional[str] = OEG('SOLUTION_CACHE_PATH')
+
+    # Number of validated access tokens whose users are kept in memory
+    AUTH_CACHE_SIZE = 10000
+    # Cached user of a token is loaded again after that many seconds, so
+    # changes made outside the API are seen in bounded time
+    AUTH_CACHE_TTL_SECONDS = 60.0
+
+    # Seconds the total count of users listing is cached
+    USERS_COUNT_TTL_SECONDS = 60.0
+    # Threads hashing and verifying passwords (bcrypt)
+    PASSWORD_POOL_SIZE = 2
+    # Logins running at once, next ones wait for a free slot
+    LOGIN_MAX_CONCURRENCY = 8
+
+    @validator('SQL_ALCHEMY_ASYNC_DATABASE_URI', always=True)
+    def async_database_uri(
+        cls, value: Optional[str], values: Dict[str, Any]
+    ) -> str:
+        if value:
+            return value
+        uri = values['SQL_ALCHEMY_DATABASE_URI']
+        dialect, separator, rest = uri.partition('://')
+        dialect = dialect.split('+', 1)[0]
+        if not separator or dialect not in ASYNC_DRIVERS:
+            raise ValueError(
+                f'No async driver of {dialect!r} database, set '
+                'SQL_ALCHEMY_ASYNC_DATABASE_URI'
+            )
+        return f'{dialect}+{ASYNC_DRIVERS[dialect]}://{rest}'
 
     class Config:
         case_sensitive = True
@@ -1,7 +1,11 @@
-from typing import Any, Dict, Generic, List, Type, TypeVar, Union
+from typing import (
+    Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
+)
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from fastapi_server.db.base_class import Base
@@ -13,17 +17,51 @@ UpdateSchemaType = TypeVar('UpdateSchemaType', bound=BaseModel)
 
 
 class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    Basic operations of the model. Methods with `_async` suffix are their
+    counterparts for `AsyncSession`.
+    """
+
     def __init__(self, model: Type[ModelType]):
         self.model = model
 
     def get(self, db: Session, id: Any) -> ModelType:
         return db.query(self.model).get(id)
 
+    async def get_async(self, db: AsyncSession, id: Any) -> ModelType:
+        return await db.get(self.model, id)
+
     def get_multi(
         self, db: Session, *, skip: int = 0, limit: int = 100
     ) -> List[ModelType]:
         return db.query(self.model).offset(skip).limit(limit).all()
 
+    async def get_multi_async(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[Any] = None,
+        columns: Optional[Sequence[Any]] = None
+    ) -> List[Any]:
+        """
+        Records ordered by id. `after_id` starts the page after the record
+        with that id (keyset pagination - the index seeks to it instead of
+        skipping all previous records). With `columns` only these columns
+        are selected and rows are returned instead of model's objects.
+        """
+        query = select(*columns) if columns else select(self.model)
+        if after_id is not None:
+            query = query.filter(self.model.id > after_id)
+        query = query.order_by(self.model.id).offset(skip).limit(limit)
+        result = await db.execute(query)
+        return result.all() if columns else result.scalars().all()
+
+    async def count_async(self, db: AsyncSession) -> int:
+        result = await db.execute(select(func.count(self.model.id)))
+        return result.scalar_one()
+
     def create(self, db: Session, input: CreateSchemaType) -> ModelType:
         obj_input_data = jsonable_encoder(input)
         db_object = self.model(**obj_input_data)
@@ -32,12 +70,44 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.refresh(db_object)
         return db_object
 
+    async def create_async(
+        self, db: AsyncSession, input: CreateSchemaType
+    ) -> ModelType:
+        db_object = self.model(**jsonable_encoder(input))
+        db.add(db_object)
+        await db.commit()
+        await db.refresh(db_object)
+        return db_object
+
     def update(
         self,
         db: Session, *,
         db_object: ModelType,
         input: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
+        self._set_fields(db_object, input)
+        db.add(db_object)
+        db.commit()
+        db.refresh(db_object)
+        return db_object
+
+    async def update_async(
+        self,
+        db: AsyncSession, *,
+        db_object: ModelType,
+        input: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        self._set_fields(db_object, input)
+        db.add(db_object)
+        await db.commit()
+        await db.refresh(db_object)
+        return db_object
+
+    def _set_fields(
+        self,
+        db_object: ModelType,
+        input: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> None:
         data = jsonable_encoder(db_object)
         update_data = input if isinstance(input, dict) else input.dict(
             exclude_unset=True
@@ -47,13 +117,14 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if field in update_data:
                 setattr(db_object, field, update_data[field])
 
-        db.add(db_object)
-        db.commit()
-        db.refresh(db_object)
-        return db_object
-
     def remove(self, db: Session, *, id: Any) -> ModelType:
         obj = db.query(self.model).get(id)
         db.delete(obj)
         db.commit()
         return obj
+
+    async def remove_async(self, db: AsyncSession, *, id: Any) -> ModelType:
+        obj = await db.get(self.model, id)
+        await db.delete(obj)
+        await db.commit()
+        return obj
@@ -1,29 +1,56 @@
 from typing import Any, Dict, Optional, Union
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from fastapi_server.core.security import get_password_hash, verify_password
 from fastapi_server.crud.base import BaseCRUD
 from fastapi_server.models import User
 from fastapi_server.schemas import UserCreate, UserUpdate
+from fastapi_server.services.password_pool import password_pool
 
 
 class UserCRUD(BaseCRUD[User, UserCreate, UserUpdate]):
+    """
+    Async counterparts of operations hashing or verifying passwords run
+    bcrypt in `password_pool`.
+    """
+
     def get_by_email(self, db: Session, email: str) -> Optional[User]:
         return db.query(User).filter(User.email == email).first()
 
+    async def get_by_email_async(
+        self, db: AsyncSession, email: str
+    ) -> Optional[User]:
+        result = await db.execute(select(User).filter(User.email == email))
+        return result.scalars().first()
+
     def create(self, db: Session, *, user_in: UserCreate) -> User:
-        db_user = User(
+        db_user = self._new_user(user_in, get_password_hash(user_in.password))
+        db.add(db_user)
+        db.commit()
+        db.refresh(db_user)
+        return db_user
+
+    async def create_async(
+        self, db: AsyncSession, *, user_in: UserCreate
+    ) -> User:
+        hashed_password = await password_pool.hash(user_in.password)
+        db_user = self._new_user(user_in, hashed_password)
+        db.add(db_user)
+        await db.commit()
+        await db.refresh(db_user)
+        return db_user
+
+    def _new_user(self, user_in: UserCreate, hashed_password: str) -> User:
+        return User(
             email=user_in.email,
-            hashed_password=get_password_hash(user_in.password),
+            hashed_password=hashed_password,
             first_name=user_in.first_name,
             last_name=user_in.last_name,
             is_superuser=user_in.is_superuser
         )
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
-        return db_user
 
     def update(
         self,
@@ -32,15 +59,36 @@ class UserCRUD(BaseCRUD[User, UserCreate, UserUpdate]):
         user_db: User,
         user_in: Union[UserUpdate, Dict[str, Any]]
     ) -> User:
-        update_data = user_in if isinstance(user_in, dict) else user_in.dict(
-            exclude_unset=True
-        )
+        update_data = self._update_data(user_in)
         if update_data.get('password'):
             hashed_password = get_password_hash(update_data['password'])
             del update_data['password']
             update_data['hashed_password'] = hashed_password
         return super().update(db, db_object=user_db, input=update_data)
 
+    async def update_async(
+        self,
+        db: AsyncSession,
+        *,
+        user_db: User,
+        user_in: Union[UserUpdate, Dict[str, Any]]
+    ) -> User:
+        update_data = self._update_data(user_in)
+        if update_data.get('password'):
+            hashed_password = await password_pool.hash(update_data['password'])
+            del update_data['password']
+            update_data['hashed_password'] = hashed_password
+        return await super().update_async(
+            db, db_object=user_db, input=update_data
+        )
+
+    def _update_data(
+        self, user_in: Union[UserUpdate, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        return user_in if isinstance(user_in, dict) else user_in.dict(
+            exclude_unset=True
+        )
+
     def authenticate(
         self, db: Session, *, email: str, password: str
     ) -> Optional[User]:
@@ -51,6 +99,16 @@ class UserCRUD(BaseCRUD[User, UserCreate, UserUpdate]):
             return None
         return user
 
+    async def authenticate_async(
+        self, db: AsyncSession, *, email: str, password: str
+    ) -> Optional[User]:
+        user = await self.get_by_email_async(db, email)
+        if not user:
+            return None
+        if not await password_pool.verify(password, user.hashed_password):
+            return None
+        return user
+
     def is_active(self, user: User) -> bool:
         return user.is_active
 
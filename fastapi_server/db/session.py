@@ -1,12 +1,74 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from fastapi_server.core.config import settings
 
 
+def pool_options(is_async: bool = False) -> Dict[str, Any]:
+    """Options of the engine's connection pool from the settings."""
+    options: Dict[str, Any] = {'pool_pre_ping': settings.DB_POOL_PRE_PING}
+    if settings.DB_POOL_SIZE is not None:
+        options.update(
+            poolclass=AsyncAdaptedQueuePool if is_async else QueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS
+        )
+    return options
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """Pragmas of SQLite connections set in the settings."""
+    pragmas = {
+        'journal_mode': settings.SQLITE_JOURNAL_MODE,
+        'synchronous': settings.SQLITE_SYNCHRONOUS,
+        'mmap_size': settings.SQLITE_MMAP_SIZE,
+        'cache_size': settings.SQLITE_CACHE_SIZE,
+        'busy_timeout': settings.SQLITE_BUSY_TIMEOUT_MS,
+    }
+    return {
+        name: value for name, value in pragmas.items() if value is not None
+    }
+
+
+def set_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """
+    Set pragmas on every new connection of the engine. Engines of other
+    databases than SQLite are left unchanged. For async engine pass its
+    `sync_engine`.
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+# Synchronous engine for scripts and the like, the endpoints use
+# `AsyncSessionLocal` (migrations connect to the same database URI)
 engine = create_engine(
     settings.SQL_ALCHEMY_DATABASE_URI,
     connect_args={"check_same_thread": False},
-    pool_pre_ping=True
+    **pool_options()
 )
+set_sqlite_pragmas(engine, sqlite_pragmas())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Database waits of async endpoints do not take threads of the threadpool
+async_engine = create_async_engine(
+    settings.SQL_ALCHEMY_ASYNC_DATABASE_URI, **pool_options(is_async=True)
+)
+set_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas())
+# Loaded attributes stay available after commit (no implicit IO)
+AsyncSessionLocal = sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
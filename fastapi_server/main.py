@@ -2,6 +2,10 @@ from fastapi import FastAPI
 
 from fastapi_server.api.api_v1.api import api_router
 from fastapi_server.core.config import settings
+from fastapi_server.db.session import async_engine
+from fastapi_server.services.password_pool import password_pool
+from fastapi_server.services.solver_pool import solver_pool
+from fastapi_server.services.sudoku import solution_cache
 
 
 app = FastAPI(
@@ -9,3 +13,34 @@ app = FastAPI(
     openapi_url=f'{settings.API_V1_STR}/openapi.json'
 )
 app.include_router(api_router, prefix=settings.API_V1_STR)
+
+
+@app.on_event('startup')
+def start_solver_pool():
+    solver_pool.start()
+
+
+@app.on_event('shutdown')
+def shutdown_solver_pool():
+    solver_pool.shutdown()
+
+
+@app.on_event('startup')
+def start_password_pool():
+    password_pool.start()
+
+
+@app.on_event('shutdown')
+def shutdown_password_pool():
+    password_pool.shutdown()
+
+
+@app.on_event('shutdown')
+async def dispose_async_engine():
+    # Pooled connections of the async driver hold threads until disposed
+    await async_engine.dispose()
+
+
+@app.on_event('shutdown')
+def close_solution_cache():
+    solution_cache.close()
@@ -1,4 +1,7 @@
-from fastapi_server.schemas.sudoku import SudokuIn, SudokuOut # noqa
+from fastapi_server.schemas.sudoku import (  # noqa
+    SudokuBatchIn, SudokuBatchItem, SudokuBatchOut, SudokuEngine, SudokuIn,
+    SudokuOut, SearchStatsOut
+)
 from fastapi_server.schemas.user import (  # noqa
     UserCreate, UserUpdate, User, UserInDBBase
 )
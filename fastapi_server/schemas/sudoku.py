@@ -1,5 +1,15 @@
+from enum import Enum
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
+from fastapi_server.core.config import settings
+
+
+class SudokuEngine(str, Enum):
+    bitmask = 'bitmask'
+    dlx = 'dlx'
+
 
 class SudokuBase(BaseModel):
     sudoku: str = Field(
@@ -19,11 +29,34 @@ class SudokuBase(BaseModel):
     )
 
 
-class SudokuIn(SudokuBase):
+class SudokuOptions(BaseModel):
+    engine: SudokuEngine = Field(
+        SudokuEngine.bitmask,
+        title='Solving engine',
+        description=(
+            'Engine used to solve the sudoku: `bitmask` (constraint '
+            'propagation with backtracking) or `dlx` (Dancing Links exact '
+            'cover search).'
+        )
+    )
+    solutions_limit: Optional[int] = Field(
+        None,
+        ge=1,
+        le=settings.SUDOKU_MAX_SOLUTIONS_LIMIT,
+        title='Limit of counted solutions',
+        description=(
+            'Count solutions of the sudoku, stopping at the given number '
+            '(2 is enough to check whether the solution is unique). '
+            'Solutions are not counted when not set.'
+        )
+    )
+
+
+class SudokuIn(SudokuBase, SudokuOptions):
     pass
 
 
-class SudokuOut(SudokuBase):
+class SudokuResult(BaseModel):
     solvable: bool = Field(
         ...,
         title='If sudoku is solvable',
@@ -32,3 +65,109 @@ class SudokuOut(SudokuBase):
             ' of the sent sudoku\'s string.'
         )
     )
+    solutions: Optional[int] = Field(
+        None,
+        title='Number of solutions',
+        description=(
+            'Number of found solutions, at most `solutions_limit`. Only '
+            'returned when `solutions_limit` was sent.'
+        )
+    )
+    nodes: Optional[int] = Field(
+        None,
+        title='Search nodes',
+        description=(
+            'Number of search nodes visited while counting solutions. Only '
+            'returned when `solutions_limit` was sent. Equivalent sudokus '
+            '(e.g. with swapped digits or rotated) are solved and cached in '
+            'one canonical form, so it counts the search of that form, not '
+            'of the sent sudoku - use `stats` for the sent one.'
+        )
+    )
+    error: Optional[str] = Field(
+        None,
+        title='Error',
+        description=(
+            'Why the sudoku is not solvable, e.g. the first cells breaking '
+            'sudoku rules (`r1c2` is the first row, the second column).'
+        )
+    )
+
+
+class SearchStatsOut(BaseModel):
+    nodes: int = Field(..., title='Search nodes')
+    guesses: int = Field(
+        ...,
+        title='Guesses',
+        description='Tried choices among more than one candidate.'
+    )
+    forced: int = Field(
+        ...,
+        title='Forced moves',
+        description=(
+            'Values placed without guessing (propagated singles or '
+            'constraints with a single candidate).'
+        )
+    )
+    backtracks: int = Field(
+        ...,
+        title='Backtracks',
+        description='Dead ends the search returned from.'
+    )
+    max_depth: int = Field(
+        ...,
+        title='Maximum depth',
+        description='The deepest level of nested choices.'
+    )
+    solutions: int = Field(..., title='Found solutions')
+    time: float = Field(
+        ...,
+        title='Search time',
+        description='Wall time of the search in seconds.'
+    )
+
+
+class SudokuOut(SudokuBase, SudokuResult):
+    stats: Optional[SearchStatsOut] = Field(
+        None,
+        title='Search statistics',
+        description='Only returned when `stats` query parameter is set.'
+    )
+
+
+class SudokuBatchIn(SudokuOptions):
+    sudokus: List[str] = Field(
+        ...,
+        min_items=1,
+        max_items=settings.SUDOKU_BATCH_MAX_SIZE,
+        example=[
+            '..98..7.41..5..6...3...7.9.5.27.8.3..81.5...664.123.5....24.3..9.'
+            '.6.18....5..9.2.',
+            '0098007041005006000300070905027080300810500066401230500002403009'
+            '00601800005009020',
+        ],
+        title='Sudoku\'s strings',
+        description=(
+            'The strings of sudoku (see `sudoku` field of the single sudoku '
+            'request). Incorrect strings are reported per item.'
+        )
+    )
+
+
+class SudokuBatchItem(SudokuResult):
+    sudoku: str = Field(
+        ...,
+        title='Sudoku\'s string',
+        description=(
+            'Solution of the sudoku or the sent string when it is not '
+            'solvable.'
+        )
+    )
+
+
+class SudokuBatchOut(BaseModel):
+    results: List[SudokuBatchItem] = Field(
+        ...,
+        title='Results',
+        description='Results in the same order as sent sudoku\'s strings.'
+    )
@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional, Set, Tuple
+
+from fastapi_server.core.config import settings
+
+
+class UserSnapshot(NamedTuple):
+    """Fields of the authenticated user needed by permission checks."""
+    id: int
+    is_active: bool
+    is_superuser: bool
+
+
+class AuthCache:
+    """
+    Bounded LRU cache of validated access tokens -> `UserSnapshot`, so
+    authenticated requests skip both decoding of the token and the database
+    lookup of its user.
+
+    - Entry expires with the token (its `exp` claim) or after `ttl` seconds,
+      whichever comes first.
+    - The oldest entries are evicted when the cache holds `maxsize` tokens.
+    - Changes of the user's record must call `invalidate` with its id, which
+      drops all tokens of that user.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.time
+    ):
+        if maxsize < 1:
+            raise ValueError('Cache size must be at least 1')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # token -> (expiration time, snapshot)
+        self._entries: 'OrderedDict[str, Tuple[float, UserSnapshot]]' = (
+            OrderedDict()
+        )
+        # user's id -> cached tokens of the user
+        self._tokens: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> Optional[UserSnapshot]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None and entry[0] <= self.clock():
+                self._discard(token)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return entry[1]
+
+    def set(
+        self,
+        token: str,
+        snapshot: UserSnapshot,
+        expires: Optional[float] = None
+    ) -> None:
+        """Store snapshot of the token which expires at `expires` (epoch)."""
+        expiration = self.clock() + self.ttl
+        if expires is not None:
+            expiration = min(expiration, expires)
+        with self._lock:
+            self._discard(token)
+            self._entries[token] = (expiration, snapshot)
+            self._tokens.setdefault(snapshot.id, set()).add(token)
+            while len(self._entries) > self.maxsize:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop all cached tokens of the user."""
+        with self._lock:
+            for token in list(self._tokens.get(user_id, ())):
+                self._discard(token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _discard(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        tokens = self._tokens[entry[1].id]
+        tokens.discard(token)
+        if not tokens:
+            del self._tokens[entry[1].id]
+
+
+auth_cache = AuthCache(
+    maxsize=settings.AUTH_CACHE_SIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Optional
+
+from fastapi_server.core.config import settings
+from fastapi_server.core.security import get_password_hash, verify_password
+
+
+class PasswordPool:
+    """
+    Runs bcrypt hashing and verification in a dedicated pool of `workers`
+    threads, so bursts of logins do not take the event loop nor the shared
+    threadpool of sync endpoints and dependencies.
+
+    - Slow hashing waits in the pool's queue instead of blocking other
+      requests.
+    - `login_slot` lets at most `max_logins` logins run at once, next ones
+      wait for a free slot - heavy login load degrades only login latency.
+    """
+
+    def __init__(self, workers: int, max_logins: int):
+        self.workers = workers
+        self.max_logins = max_logins
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._login_semaphore: Optional[asyncio.Semaphore] = None
+
+    def start(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix='password'
+            )
+        # Created in the running event loop (Python 3.9 binds it on creation)
+        self._login_semaphore = asyncio.Semaphore(self.max_logins)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        self._login_semaphore = None
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """Run `func(*args)` in the pool's thread."""
+        if self._executor is None:
+            self.start()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self.run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run(verify_password, plain_password, hashed_password)
+
+    @asynccontextmanager
+    async def login_slot(self) -> AsyncIterator[None]:
+        """Wait until fewer than `max_logins` logins are running."""
+        if self._login_semaphore is None:
+            self.start()
+        async with self._login_semaphore:
+            yield
+
+
+password_pool = PasswordPool(
+    workers=settings.PASSWORD_POOL_SIZE,
+    max_logins=settings.LOGIN_MAX_CONCURRENCY
+)
@@ -0,0 +1,142 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Awaitable, Callable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_server.core.config import settings
+
+
+class SolverPoolBusy(Exception):
+    pass
+
+
+class SolverPoolTimeout(Exception):
+    pass
+
+
+class SolverPool:
+    """
+    Runs CPU-bound solving in worker processes, so the event loop and the
+    threadpool of the API worker stay free for other requests.
+
+    - At most `max_queue` puzzles may wait or be solved at once (a call
+      counts as many puzzles as its `tasks`), next calls are rejected with
+      `SolverPoolBusy`.
+    - Task which does not finish in `timeout` seconds raises
+      `SolverPoolTimeout`. The executor is replaced and processes of the old
+      one are terminated, so the stuck worker does not keep using CPU. Other
+      tasks running in the old executor are submitted again to the new one,
+      once - when it breaks again they raise `SolverPoolBusy`.
+    - After `max_tasks_per_worker * workers` tasks (summed `tasks` of the
+      calls) the executor is replaced with a fresh one (worker recycling,
+      e.g. to release leaked memory).
+    - With `workers` equal 0 tasks run in the threadpool (no processes).
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_queue: int,
+        timeout: float,
+        max_tasks_per_worker: int,
+        start_method: str = 'spawn'
+    ):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.start_method = start_method
+        self.pending = 0
+        self.submitted = 0
+        self._executor: Optional[Executor] = None
+
+    def start(self) -> None:
+        if self.workers and self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method)
+            )
+            self.submitted = 0
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def recycle(self, terminate: bool = False) -> None:
+        """
+        Replace the executor. Running tasks of the old one still end, unless
+        `terminate` is set - then its worker processes are terminated.
+        """
+        executor = self._executor
+        if terminate and isinstance(executor, ProcessPoolExecutor):
+            # The executor does not expose its processes (before Python 3.14)
+            for process in list((executor._processes or {}).values()):
+                process.terminate()
+        self.shutdown(wait=False)
+        self.start()
+
+    async def run(self, func: Callable, *args: Any, tasks: int = 1) -> Any:
+        """
+        Run `func(*args)` in a worker process. `tasks` is the number of solves
+        done by the call - it scales the timeout (e.g. chunk of a batch).
+        """
+        if self.pending + tasks > self.max_queue:
+            raise SolverPoolBusy()
+
+        self.pending += tasks
+        try:
+            if not self.workers:
+                return await self._wait(run_in_threadpool(func, *args), tasks)
+            try:
+                return await self._run_in_executor(func, args, tasks)
+            except BrokenProcessPool:
+                # Workers were terminated after a timeout of another task
+                pass
+            try:
+                return await self._run_in_executor(func, args, tasks)
+            except BrokenProcessPool as error:
+                # Broken again, e.g. by the next timeout or the task itself
+                raise SolverPoolBusy() from error
+        finally:
+            self.pending -= tasks
+
+    async def _run_in_executor(
+        self, func: Callable, args: Any, tasks: int
+    ) -> Any:
+        if self._executor is None:
+            self.start()
+        elif self.submitted >= self.max_tasks_per_worker * self.workers:
+            self.recycle()
+        self.submitted += tasks
+        executor = self._executor
+        call = asyncio.get_running_loop().run_in_executor(
+            executor, func, *args
+        )
+        try:
+            return await self._wait(call, tasks)
+        except BrokenProcessPool:
+            if executor is self._executor:
+                # Worker crashed, the next calls need a working executor
+                self.recycle(terminate=True)
+            raise
+
+    async def _wait(self, call: Awaitable, tasks: int) -> Any:
+        try:
+            return await asyncio.wait_for(call, self.timeout * tasks)
+        except asyncio.TimeoutError:
+            if self.workers:
+                self.recycle(terminate=True)
+            raise SolverPoolTimeout()
+
+
+solver_pool = SolverPool(
+    workers=settings.SOLVER_POOL_SIZE,
+    max_queue=settings.SOLVER_POOL_MAX_QUEUE,
+    timeout=settings.SOLVER_TIMEOUT_SECONDS,
+    max_tasks_per_worker=settings.SOLVER_MAX_TASKS_PER_WORKER,
+    start_method=settings.SOLVER_POOL_START_METHOD
+)
@@ -0,0 +1,283 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi_server.core.config import settings
+from sudoku_solver import codec
+from sudoku_solver.cache import SolutionCache
+from sudoku_solver.canonical import Transform, canonicalize
+from sudoku_solver.bitmask import cells_masks
+from sudoku_solver.exceptions import InvalidSudokuGrid, SearchAborted
+from sudoku_solver.pipeline import format_cells, parse_cells
+from sudoku_solver.solver import (
+    BITMASK,
+    create_solver,
+    sudoku_str_to_grid,
+    grid_to_sudoku_str,
+)
+from sudoku_solver.stats import SearchStats
+
+
+# Same rules as `SudokuBase.sudoku` field
+SUDOKU_STR_PATTERN = re.compile(r'[\d\.]{81}')
+# Status byte of packed results
+PACKED_UNSOLVABLE = 0
+PACKED_SOLVABLE = 1
+PACKED_ERROR = 2
+# Index -> cache key, canonical sudoku and transform of not resolved sudokus
+MissingSudokus = Dict[int, Tuple[str, str, Transform]]
+
+solution_cache = SolutionCache(
+    maxsize=settings.SOLUTION_CACHE_SIZE,
+    ttl=settings.SOLUTION_CACHE_TTL_SECONDS,
+    path=settings.SOLUTION_CACHE_PATH
+)
+
+
+def validate_sudoku_str(sudoku: str) -> Optional[str]:
+    """Return error message if value is not a correct sudoku's string."""
+    if len(sudoku) != 81:
+        return 'ensure this value has 81 characters'
+    if not SUDOKU_STR_PATTERN.fullmatch(sudoku):
+        return 'string does not match regex "^[\\d\\.]+$"'
+    return None
+
+
+def error_result(sudoku: str, error: str) -> Dict[str, Any]:
+    """
+    Return data of `SudokuBatchItem` for the sudoku's string which could not
+    be solved, e.g. incorrect string or aborted search.
+    """
+    return {'sudoku': sudoku, 'solvable': False, 'error': error}
+
+
+def conflict_result(
+    sudoku: str,
+    solutions_limit: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Return data of `SudokuOut` with the first conflicting cells in `error`
+    when the correct sudoku's string breaks sudoku rules, otherwise None.
+    """
+    cells = parse_cells(sudoku)
+    conflict = cells_masks(cells)[3]
+    if conflict is None:
+        return None
+    unit, value, earlier, cell = conflict
+    row, column = divmod(earlier, 9)
+    other_row, other_column = divmod(cell, 9)
+    if unit == 'range':
+        error = f'Value {value} is out of range: r{row + 1}c{column + 1}'
+    else:
+        error = (
+            f'Digit {value} repeats in the same {unit}: r{row + 1}c'
+            f'{column + 1} and r{other_row + 1}c{other_column + 1}'
+        )
+    return {
+        'sudoku': format_cells(cells),
+        'solvable': False,
+        'solutions': None if solutions_limit is None else 0,
+        'nodes': None if solutions_limit is None else 0,
+        'error': error,
+    }
+
+
+def canonicalize_sudoku_str(sudoku: str) -> Tuple[str, Transform]:
+    """
+    Return canonical form of the correct sudoku's string (shared by
+    equivalent sudokus) and the transform mapping the sudoku to it.
+    """
+    grid, transform = canonicalize(sudoku_str_to_grid(sudoku))
+    return grid_to_sudoku_str(grid), transform
+
+
+def revert_result(
+    result: Dict[str, Any],
+    transform: Transform
+) -> Dict[str, Any]:
+    """Map result of the canonical sudoku back to the submitted sudoku."""
+    grid = transform.inverse().apply(sudoku_str_to_grid(result['sudoku']))
+    return {**result, 'sudoku': grid_to_sudoku_str(grid)}
+
+
+def solution_cache_key(
+    canonical_sudoku: str,
+    engine: str = 'bitmask',
+    solutions_limit: Optional[int] = None
+) -> str:
+    """
+    Return key of `solution_cache` for the canonical sudoku's string (see
+    `canonicalize_sudoku_str`). Options are part of it as they change results.
+    Cached `nodes` are of the canonical sudoku's search, shared by equivalent
+    sudokus (documented in `SudokuResult.nodes`).
+    """
+    limit = '' if solutions_limit is None else solutions_limit
+    return f'{canonical_sudoku}:{engine}:{limit}'
+
+
+def prepare_sudoku_strs(
+    sudokus: List[str],
+    engine: str = 'bitmask',
+    solutions_limit: Optional[int] = None
+) -> Tuple[List[Optional[Dict[str, Any]]], MissingSudokus]:
+    """
+    Resolve sudoku's strings which need no search - incorrect, breaking
+    sudoku rules or cached ones. Return their results in the input order
+    (None for the rest) and index -> cache key, canonical sudoku and
+    transform of the rest.
+
+    Checks and the cache reads are synchronous (SQLite tier of the cache),
+    run it in a thread, not on the event loop.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(sudokus)
+    missing: MissingSudokus = {}
+    for index, sudoku in enumerate(sudokus):
+        error = validate_sudoku_str(sudoku)
+        if error:
+            results[index] = error_result(sudoku, error)
+            continue
+        results[index] = conflict_result(sudoku, solutions_limit)
+        if results[index] is not None:
+            continue
+        canonical, transform = canonicalize_sudoku_str(sudoku)
+        key = solution_cache_key(canonical, engine, solutions_limit)
+        result = solution_cache.get(key)
+        if result is None:
+            missing[index] = (key, canonical, transform)
+        else:
+            results[index] = revert_result(result, transform)
+    return results, missing
+
+
+def complete_sudoku_strs(
+    results: List[Optional[Dict[str, Any]]],
+    missing: MissingSudokus,
+    solved: Dict[str, Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Cache results of the canonical sudokus solved for `missing` ones of
+    `prepare_sudoku_strs` (cache key -> result) and fill them in `results`.
+    Like `prepare_sudoku_strs` it should run in a thread.
+    """
+    for key, result in solved.items():
+        # Aborted searches may succeed later, e.g. with higher limits
+        if 'error' not in result:
+            solution_cache.set(key, result)
+    for index, (key, _, transform) in missing.items():
+        results[index] = revert_result(solved[key], transform)
+    return results
+
+
+def solve_sudoku_str(
+    sudoku: str,
+    engine: str = 'bitmask',
+    solutions_limit: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    stats: bool = False
+) -> Dict[str, Any]:
+    """
+    Solve the correct sudoku's string and return data of `SudokuOut`.
+    Solutions are counted and search nodes reported only when
+    `solutions_limit` is given, statistics of the search (`SearchStats`) only
+    when `stats` is set. Raise `SearchAborted` when the search exceeds
+    `max_nodes` or `time_limit` seconds.
+    """
+    # Flat cells are validated, solved and serialized without nested lists
+    cells = parse_cells(sudoku)
+    *masks, conflict = cells_masks(cells)
+    if conflict is not None:
+        return conflict_result(sudoku, solutions_limit)
+
+    options = {'max_nodes': max_nodes, 'time_limit': time_limit}
+    if engine == BITMASK:
+        # Validation masks seed candidates of the solver
+        options['masks'] = masks
+    if stats:
+        options['stats'] = SearchStats()
+    solver = create_solver(cells, engine, **options)
+    if solutions_limit is None:
+        solvable = solver.solve()
+        result = {'sudoku': format_cells(cells), 'solvable': solvable}
+    else:
+        solutions = solver.count_solutions(solutions_limit)
+        if solutions:
+            solver.write_solution()
+        result = {
+            'sudoku': format_cells(cells),
+            'solvable': bool(solutions),
+            'solutions': solutions,
+            'nodes': solver.nodes,
+        }
+    if stats:
+        result['stats'] = options['stats'].to_dict()
+    return result
+
+
+def solve_sudoku_batch(
+    sudokus: List[str],
+    engine: str = 'bitmask',
+    solutions_limit: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    time_limit: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Solve many sudoku's strings. Results are in the input order. Incorrect
+    strings and aborted searches do not fail the whole batch, they get `error`
+    message instead. Limits of the search apply to every sudoku separately.
+    """
+    results = []
+    for sudoku in sudokus:
+        error = validate_sudoku_str(sudoku)
+        if error:
+            results.append(error_result(sudoku, error))
+            continue
+        try:
+            results.append(solve_sudoku_str(
+                sudoku, engine, solutions_limit, max_nodes, time_limit
+            ))
+        except SearchAborted as aborted:
+            results.append(error_result(sudoku, str(aborted)))
+    return results
+
+
+def unpack_sudoku_strs(data: bytes) -> List[Optional[str]]:
+    """
+    Convert sudokus packed by `sudoku_solver.codec.pack` (41 bytes each) to
+    sudoku's strings, None for records with values out of range.
+    """
+    sudokus = []
+    for start in range(0, len(data), codec.PACKED_SIZE):
+        try:
+            cells = codec.unpack(data[start:start + codec.PACKED_SIZE])
+        except InvalidSudokuGrid:
+            sudokus.append(None)
+        else:
+            sudokus.append(format_cells(cells))
+    return sudokus
+
+
+def pack_results(
+    results: List[Optional[Dict[str, Any]]],
+    data: bytes
+) -> bytes:
+    """
+    Encode results of packed sudokus: status byte (`PACKED_SOLVABLE`,
+    `PACKED_UNSOLVABLE` or `PACKED_ERROR` when `error` is set or the record
+    is incorrect) followed by 41 bytes of the packed solution (or the sent
+    sudoku when it is not solved).
+    """
+    packed = bytearray()
+    for index, result in enumerate(results):
+        if result is None:
+            start = index * codec.PACKED_SIZE
+            packed.append(PACKED_ERROR)
+            packed += data[start:start + codec.PACKED_SIZE]
+            continue
+        if result.get('error'):
+            packed.append(PACKED_ERROR)
+        elif result['solvable']:
+            packed.append(PACKED_SOLVABLE)
+        else:
+            packed.append(PACKED_UNSOLVABLE)
+        packed += codec.pack(parse_cells(result['sudoku']))
+    return bytes(packed)
@@ -0,0 +1,35 @@
+import time
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_server import crud
+from fastapi_server.core.config import settings
+
+
+class UsersCount:
+    """
+    Number of users counted once per `ttl` seconds, so listing pages with
+    the total count does not scan the whole table for every page. Creating
+    or removing a user must call `invalidate`.
+    """
+
+    def __init__(
+        self, ttl: float, clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.clock = clock
+        # (expiration time, count)
+        self._entry: Optional[Tuple[float, int]] = None
+
+    async def get(self, db: AsyncSession) -> int:
+        if self._entry is None or self._entry[0] <= self.clock():
+            count = await crud.user.count_async(db)
+            self._entry = (self.clock() + self.ttl, count)
+        return self._entry[1]
+
+    def invalidate(self) -> None:
+        self._entry = None
+
+
+users_count = UsersCount(ttl=settings.USERS_COUNT_TTL_SECONDS)
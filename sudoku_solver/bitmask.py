@@ -0,0 +1,535 @@
+"""
+Constraint propagation sudoku engine based on candidate bitmasks.
+
+Every row, column and box keeps a mask of digits already placed in it (bit
+``d - 1`` is set when digit ``d`` is used). Candidates of an empty cell are
+the digits missing from all three masks, so testing a digit costs a few
+bitwise operations instead of rescanning 20 peers like `is_safe` does.
+
+Boards of any square box size are supported (9x9, 16x16, 25x25, ...).
+"""
+from math import isqrt
+
+from sudoku_solver.exceptions import SearchAborted
+from sudoku_solver.limits import SearchLimits, check_solutions_limit
+from sudoku_solver.stats import timed
+from sudoku_solver.tables import cells_tables, grid_tables
+
+
+def cells_masks(cells):
+    """
+    Builds masks of digits placed in every row, column and box in a single
+    pass over flat cells. Stops on the first conflict - a digit repeated in a
+    unit or a value out of range.
+
+    Args:
+        cells (bytearray): Flat cells of sudoku (81, 256, 625...), row by row
+            (any sequence of ints, e.g. list, works too).
+
+    Raises:
+        InvalidSudokuGrid: Length is not a square of a square number.
+
+    Returns:
+        tuple: Lists of row, column and box masks (bit ``d - 1`` stands for
+            digit ``d``) and the conflict - None or tuple of the unit
+            (``'row'``, ``'column'``, ``'box'`` or ``'range'`` for value out of
+            range), the value and flat indexes of the earlier and the
+            conflicting cell (the same cell for ``'range'``). Masks are
+            incomplete when there is a conflict.
+    """
+    row_of, column_of, box_of, units, _ = cells_tables(cells)
+    size = isqrt(len(cells))
+    rows = [0] * size
+    columns = [0] * size
+    boxes = [0] * size
+    for cell, value in enumerate(cells):
+        if not value:
+            continue
+        if not 0 < value <= size:
+            return rows, columns, boxes, ('range', value, cell, cell)
+        bit = 1 << (value - 1)
+        row = row_of[cell]
+        column = column_of[cell]
+        box = box_of[cell]
+        if (rows[row] | columns[column] | boxes[box]) & bit:
+            if rows[row] & bit:
+                unit, unit_cells = 'row', units[row]
+            elif columns[column] & bit:
+                unit, unit_cells = 'column', units[size + column]
+            else:
+                unit, unit_cells = 'box', units[2 * size + box]
+            earlier = next(
+                other for other in unit_cells if cells[other] == value
+            )
+            return rows, columns, boxes, (unit, value, earlier, cell)
+        rows[row] |= bit
+        columns[column] |= bit
+        boxes[box] |= bit
+    return rows, columns, boxes, None
+
+
+def grid_masks(grid):
+    """
+    Builds masks of digits placed in every row, column and box in a single
+    pass over the grid (see `cells_masks`).
+
+    Args:
+        grid (list): Sudoku grid (9x9, 16x16, 25x25...).
+
+    Raises:
+        InvalidSudokuGrid: Grid is not a square with a square number of rows.
+
+    Returns:
+        tuple: Lists of row, column and box masks and the conflict (see
+            `cells_masks`).
+    """
+    grid_tables(grid)
+    return cells_masks([value for row in grid for value in row])
+
+
+# Cell selection strategies
+ROW_MAJOR = 'row-major'
+MINIMUM_REMAINING_VALUES = 'mrv'
+CELL_ORDERS = (ROW_MAJOR, MINIMUM_REMAINING_VALUES)
+
+
+class BitmaskSolver:
+    """
+    Sudoku solver keeping per-row, per-column and per-box masks of placed
+    digits. Masks are updated incrementally on every assignment and
+    unassignment. Before each guess naked singles (cell with one candidate)
+    and hidden singles (digit with one possible cell in a unit) are filled in.
+
+    The search is iterative: guesses are kept on an explicit stack of
+    ``[cell, untried candidates, trail length, position in empties]`` frames,
+    so the depth is not limited by `sys.getrecursionlimit` and there is no
+    call overhead per guess. Empty cells are collected once, before the
+    search, row-major order resumes their scan from the top frame's cell.
+
+    The cell to branch on is chosen according to `cell_order`:
+        * ``'row-major'`` - first empty cell in reading order, so the first
+          solution found is the lexicographically smallest one,
+        * ``'mrv'`` - empty cell with the fewest candidates (minimum remaining
+          values), ties are broken by the highest degree (number of empty
+          peers).
+    Candidates count and degree of every cell are maintained incrementally
+    by `assign` and `unassign`.
+
+    The search raises `SearchAborted` when it exceeds `max_nodes` or
+    `time_limit` (counted from the solver creation). Assignments are undone
+    then, so the grid and the solver stay untouched.
+
+    Args:
+        grid (list): Partially filled-in sudoku grid (9x9, 16x16, 25x25...)
+            or its flat cells, e.g. `bytearray`, or `Grid` - the solution is
+            written into it in place.
+        cell_order (str): Cell selection strategy. Defaults to None -
+            ``'row-major'`` for 9x9 (and smaller) grids, ``'mrv'`` for bigger
+            ones, where row-major search does not finish in practice.
+        max_nodes (int): Node budget of the solver. Defaults to None (no
+            budget).
+        time_limit (float): Seconds the solver may spend searching. Defaults
+            to None (no time limit).
+        masks (tuple): Row, column and box masks of the grid without
+            conflicts computed by `cells_masks`, so they are not recomputed.
+            Defaults to None (computed by the solver).
+        stats (SearchStats): Statistics the search is counted into. Defaults
+            to None (not collected).
+
+    Raises:
+        ValueError: Unknown `cell_order`.
+        InvalidSudokuGrid: Grid is not a square with a square number of rows
+            (or flat cells length is not a square of a square number).
+
+    Attributes:
+        flat (bool): Whether the grid was given as flat cells.
+        cells (list): Flat list of cell values (0 means empty).
+        empties (list): Cells which were empty before solving.
+        counts (list): Number of candidates of every cell.
+        degrees (list): Number of empty peers of every cell.
+        nodes (int): Number of search nodes visited so far.
+        consistent (bool): Whether givens do not break sudoku rules.
+        solution (list): Flat list of values of the solution found by the
+            last `solve` or `count_solutions` call or None.
+    """
+
+    def __init__(
+        self,
+        grid,
+        cell_order=None,
+        max_nodes=None,
+        time_limit=None,
+        masks=None,
+        stats=None
+    ):
+        if cell_order is not None and cell_order not in CELL_ORDERS:
+            raise ValueError(f'Unknown cell order: {cell_order}')
+
+        # `Grid` is solved in place in its flat buffer
+        grid = getattr(grid, 'cells', grid)
+        self.grid = grid
+        self.flat = not grid or isinstance(grid[0], int)
+        if self.flat:
+            tables = cells_tables(grid)
+            self.cells = list(grid)
+        else:
+            tables = grid_tables(grid)
+            self.cells = [value for row in grid for value in row]
+        size = isqrt(len(self.cells))
+        self.size = size
+        self.all_digits = (1 << size) - 1
+        self.row_of, self.column_of, self.box_of, self.units, self.peers = (
+            tables
+        )
+        if cell_order is None:
+            cell_order = ROW_MAJOR if size <= 9 else MINIMUM_REMAINING_VALUES
+        self.cell_order = cell_order
+        self.empties = [
+            cell for cell, value in enumerate(self.cells) if not value
+        ]
+        self.trail = []
+        self.solution = None
+        self.nodes = 0
+        self.limits = SearchLimits(max_nodes, time_limit)
+        self.stats = stats
+        if masks is None:
+            *masks, conflict = cells_masks(self.cells)
+            self.consistent = conflict is None
+        else:
+            self.consistent = True
+        self.rows, self.columns, self.boxes = (mask[:] for mask in masks)
+
+        self.counts = [
+            bin(self.candidates(cell)).count('1')
+            for cell in range(len(self.cells))
+        ]
+        self.degrees = [
+            sum(1 for peer in peers if not self.cells[peer])
+            for peers in self.peers
+        ]
+
+    def candidates(self, cell):
+        """
+        Computes digits which can be legally assigned to the cell.
+
+        Args:
+            cell (int): Flat cell index (row * size + column).
+
+        Returns:
+            int: Bitmask of candidates (bit ``d - 1`` stands for digit ``d``).
+        """
+        return self.all_digits & ~(
+            self.rows[self.row_of[cell]] |
+            self.columns[self.column_of[cell]] |
+            self.boxes[self.box_of[cell]]
+        )
+
+    def assign(self, cell, value):
+        """Place `value` in the empty `cell` and remember it on the trail."""
+        bit = 1 << (value - 1)
+        rows, columns, boxes = self.rows, self.columns, self.boxes
+        row_of, column_of, box_of = self.row_of, self.column_of, self.box_of
+        counts, degrees = self.counts, self.degrees
+        # Peers lose `value` candidate unless it was already excluded
+        for peer in self.peers[cell]:
+            degrees[peer] -= 1
+            if not (
+                rows[row_of[peer]] | columns[column_of[peer]] |
+                boxes[box_of[peer]]
+            ) & bit:
+                counts[peer] -= 1
+
+        self.cells[cell] = value
+        rows[row_of[cell]] |= bit
+        columns[column_of[cell]] |= bit
+        boxes[box_of[cell]] |= bit
+        self.trail.append(cell)
+
+    def unassign(self, cell):
+        """Clear the `cell` assigned earlier with `assign`."""
+        bit = 1 << (self.cells[cell] - 1)
+        rows, columns, boxes = self.rows, self.columns, self.boxes
+        row_of, column_of, box_of = self.row_of, self.column_of, self.box_of
+        counts, degrees = self.counts, self.degrees
+        self.cells[cell] = 0
+        rows[row_of[cell]] &= ~bit
+        columns[column_of[cell]] &= ~bit
+        boxes[box_of[cell]] &= ~bit
+
+        # Peers regain `value` candidate unless other unit still excludes it
+        for peer in self.peers[cell]:
+            degrees[peer] += 1
+            if not (
+                rows[row_of[peer]] | columns[column_of[peer]] |
+                boxes[box_of[peer]]
+            ) & bit:
+                counts[peer] += 1
+
+    def undo(self, mark):
+        """Revert all assignments made after trail had `mark` length."""
+        trail = self.trail
+        while len(trail) > mark:
+            self.unassign(trail.pop())
+
+    def propagate(self):
+        """
+        Fills in naked and hidden singles until nothing more can be deduced.
+
+        Returns:
+            bool: False when contradiction was found (some cell has no
+                candidates or some digit has no place in a unit).
+        """
+        cells, counts, empties = self.cells, self.counts, self.empties
+        all_digits = self.all_digits
+        changed = True
+        while changed:
+            changed = False
+
+            # Naked singles
+            for cell in empties:
+                if cells[cell] or counts[cell] > 1:
+                    continue
+                if not counts[cell]:
+                    return False
+                self.assign(cell, self.candidates(cell).bit_length())
+                changed = True
+
+            # Hidden singles
+            for unit in self.units:
+                once = twice = placed = 0
+                for cell in unit:
+                    if cells[cell]:
+                        placed |= 1 << (cells[cell] - 1)
+                    else:
+                        mask = self.candidates(cell)
+                        twice |= once & mask
+                        once |= mask
+                if once | placed != all_digits:
+                    return False
+                hidden = once & ~twice
+                if not hidden:
+                    continue
+                for cell in unit:
+                    if cells[cell]:
+                        continue
+                    mask = self.candidates(cell) & hidden
+                    if not mask:
+                        continue
+                    # Two digits can only go to this cell
+                    if mask & (mask - 1):
+                        return False
+                    self.assign(cell, mask.bit_length())
+                    changed = True
+        return True
+
+    def select_cell(self):
+        """
+        Picks the cell to branch on.
+
+        Returns:
+            int: Empty cell chosen according to `cell_order` or None if the
+                grid is complete.
+        """
+        return self.select_position(0)[0]
+
+    def select_position(self, start):
+        """
+        Picks the cell to branch on, in row-major order scanning `empties`
+        only from `start` - the search keeps positions of its cells, so
+        filled cells are not rescanned at every node.
+
+        Args:
+            start (int): Position in `empties` to scan from in row-major
+                order, all empty cells before it must be filled.
+
+        Returns:
+            tuple: Empty cell chosen according to `cell_order` (None if the
+                grid is complete) and its position in `empties`.
+        """
+        cells, empties = self.cells, self.empties
+        if self.cell_order == ROW_MAJOR:
+            for position in range(start, len(empties)):
+                if not cells[empties[position]]:
+                    return empties[position], position
+            return None, len(empties)
+
+        counts, degrees = self.counts, self.degrees
+        best, best_count, best_degree = None, self.size + 1, -1
+        for cell in empties:
+            if cells[cell]:
+                continue
+            count = counts[cell]
+            if count < best_count or (
+                count == best_count and degrees[cell] > best_degree
+            ):
+                best, best_count, best_degree = cell, count, degrees[cell]
+        return best, 0
+
+    def solutions(self):
+        """
+        Generator walking the search tree. Propagates constraints and then
+        guesses candidates of the selected cell, backtracking with the
+        explicit stack when a guess leads to a contradiction.
+
+        Yields each time the grid is complete - `cells` hold the solution at
+        that moment. Resuming the generator continues the same search from
+        the last guess, so next solutions are found without restarting.
+        Assignments are undone when the search space is exhausted or aborted.
+
+        Raises:
+            SearchAborted: Node budget or time limit is exceeded.
+        """
+        root = len(self.trail)
+        limits = self.limits
+        stats = self.stats
+        try:
+            self.nodes += 1
+            if self.nodes >= limits.next_check:
+                limits.check(self.nodes)
+            consistent = self.propagate()
+            if stats is not None:
+                stats.nodes += 1
+                stats.forced += len(self.trail) - root
+                stats.backtracks += not consistent
+            if not consistent:
+                self.undo(root)
+                return
+
+            stack = []
+            cell, position = self.select_position(0)
+            while True:
+                if cell is None:
+                    if stats is not None:
+                        stats.solutions += 1
+                    yield
+                else:
+                    stack.append([
+                        cell, self.candidates(cell), len(self.trail), position
+                    ])
+                    if stats is not None:
+                        stats.max_depth = max(stats.max_depth, len(stack))
+
+                # Try next candidate of the top frame; pop exhausted frames
+                while True:
+                    if not stack:
+                        self.undo(root)
+                        return
+                    frame = stack[-1]
+                    cell, mask, mark, position = frame
+                    self.undo(mark)
+                    if not mask:
+                        stack.pop()
+                        continue
+                    bit = mask & -mask
+                    frame[1] = mask ^ bit
+                    self.assign(cell, bit.bit_length())
+                    self.nodes += 1
+                    if self.nodes >= limits.next_check:
+                        limits.check(self.nodes)
+                    consistent = self.propagate()
+                    if stats is not None:
+                        # The last untried candidate is forced, the others
+                        # (at least one) led to contradictions
+                        guess = mask != bit
+                        stats.nodes += 1
+                        stats.guesses += guess
+                        stats.forced += len(self.trail) - mark - guess
+                        stats.backtracks += not consistent
+                    if consistent:
+                        break
+                # Cells before the frame's one stay filled until it is popped
+                cell, position = self.select_position(position + 1)
+        except SearchAborted:
+            self.undo(root)
+            raise
+
+    def search(self):
+        """
+        Looks for the first solution.
+
+        Raises:
+            SearchAborted: Node budget or time limit is exceeded.
+
+        Returns:
+            bool: Whether the solution has been found (it is kept in `cells`).
+                Assignments are undone when there is no solution.
+        """
+        with timed(self.stats):
+            for _ in self.solutions():
+                return True
+            return False
+
+    def count_solutions(self, limit=None):
+        """
+        Counts solutions of the sudoku by resuming the search after every
+        solution found. The first solution is kept in `solution`, the grid is
+        not modified.
+
+        Args:
+            limit (int): Stop counting after reaching this number of
+                solutions. Defaults to None (count all).
+
+        Raises:
+            ValueError: `limit` is lower than 1.
+            SearchAborted: Node budget or time limit is exceeded.
+
+        Returns:
+            int: Number of solutions (at most `limit`).
+        """
+        check_solutions_limit(limit)
+        self.solution = None
+        if not self.consistent:
+            return 0
+
+        count = 0
+        root = len(self.trail)
+        with timed(self.stats):
+            solutions = self.solutions()
+            for _ in solutions:
+                count += 1
+                if self.solution is None:
+                    self.solution = self.cells[:]
+                if limit is not None and count >= limit:
+                    break
+            solutions.close()
+        self.undo(root)
+        return count
+
+    def is_unique(self):
+        """
+        Checks whether the sudoku has exactly one solution. Search stops on
+        the second solution.
+
+        Raises:
+            SearchAborted: Node budget or time limit is exceeded.
+
+        Returns:
+            bool: If sudoku has one and only one solution.
+        """
+        return self.count_solutions(limit=2) == 1
+
+    def write_solution(self):
+        """Writes `solution` into the given grid."""
+        if self.flat:
+            self.grid[:] = self.solution
+            return
+        size = self.size
+        for row in range(size):
+            self.grid[row][:] = self.solution[row * size:(row + 1) * size]
+
+    def solve(self):
+        """
+        Solves the sudoku and writes the solution into the given grid.
+
+        Raises:
+            SearchAborted: Node budget or time limit is exceeded.
+
+        Returns:
+            bool: If sudoku can be solved or not. The grid is left untouched
+                when there is no solution.
+        """
+        if not self.consistent or not self.search():
+            return False
+        self.solution = self.cells[:]
+        self.write_solution()
+        return True
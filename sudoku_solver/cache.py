@@ -0,0 +1,181 @@
+"""
+Cache of sudoku solving results.
+
+Results are kept in memory in least recently used order, the oldest entries
+are evicted when the cache is full. Entries can expire after a time to live.
+Optionally results are also stored in SQLite database, so they survive
+restarts of the application.
+"""
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from sudoku_solver.solver import grid_to_sudoku_str, sudoku_str_to_grid
+
+
+def normalize_sudoku_str(sudoku_str):
+    """
+    Converts sudoku's string to its normalized form - empty cells are always
+    dots, so ``'0'`` and ``'.'`` strings of the same sudoku are equal.
+
+    Args:
+        sudoku_str (str): Sudoku's string with dots or zeros as empty cells.
+
+    Raises:
+        InvalidSudokuString: String is not correct sudoku's string.
+
+    Returns:
+        str: Normalized sudoku's string.
+    """
+    return grid_to_sudoku_str(sudoku_str_to_grid(sudoku_str))
+
+
+class SolutionCache:
+    """
+    LRU cache of solving results with optional time to live and optional
+    persistent SQLite tier.
+
+    Memory is checked first. On a miss the persistent tier is checked and the
+    found entry is moved to memory. Values are stored in SQLite as JSON, so
+    they must be JSON serializable when `path` is used.
+
+    Args:
+        maxsize (int): The highest number of entries kept in memory. Defaults
+            to 1024.
+        ttl (float): Seconds after which entry expires. Defaults to None (no
+            expiration).
+        path (str): Path of SQLite database of the persistent tier. Defaults
+            to None (memory only).
+        clock (callable): Function returning current time in seconds.
+            Defaults to `time.time` (wall clock, so expiration times stored in
+            the database are still valid after restart).
+
+    Raises:
+        ValueError: `maxsize` is lower than 1.
+
+    Attributes:
+        hits (int): Number of lookups which found the entry.
+        misses (int): Number of lookups which did not find the entry.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, path=None, clock=time.time):
+        if maxsize < 1:
+            raise ValueError('Cache size must be at least 1')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiration time or None, value)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            with self._connection:
+                self._connection.execute(
+                    'CREATE TABLE IF NOT EXISTS solutions ('
+                    'key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)'
+                )
+                self._connection.execute(
+                    'DELETE FROM solutions WHERE expires <= ?',
+                    (self.clock(),)
+                )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._lookup(key) is not None
+
+    def _lookup(self, key):
+        """Returns not expired (expires, value) entry or None."""
+        now = self.clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] is None or entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry
+            del self._entries[key]
+
+        if self._connection is None:
+            return None
+        row = self._connection.execute(
+            'SELECT expires, value FROM solutions WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[0] is not None and row[0] <= now:
+            with self._connection:
+                self._connection.execute(
+                    'DELETE FROM solutions WHERE key = ?', (key,)
+                )
+            return None
+        entry = (row[0], json.loads(row[1]))
+        self._store(key, entry)
+        return entry
+
+    def _store(self, key, entry):
+        """Puts entry in memory and evicts the least recently used ones."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key, default=None):
+        """
+        Looks for the value of the key and updates hit/miss counters.
+
+        Args:
+            key (str): Cache key, e.g. normalized sudoku's string.
+            default: Value returned on a miss. Defaults to None.
+
+        Returns:
+            Cached value or `default`.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        """
+        Stores the value of the key in memory and in the persistent tier.
+
+        Args:
+            key (str): Cache key, e.g. normalized sudoku's string.
+            value: Cached value (JSON serializable with persistent tier).
+        """
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._store(key, (expires, value))
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute(
+                        'INSERT OR REPLACE INTO solutions '
+                        '(key, value, expires) VALUES (?, ?, ?)',
+                        (key, json.dumps(value), expires)
+                    )
+
+    def clear(self):
+        """Removes all entries (also persistent ones) and resets counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute('DELETE FROM solutions')
+
+    def close(self):
+        """Closes the connection of the persistent tier."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
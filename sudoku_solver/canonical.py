@@ -0,0 +1,254 @@
+"""
+Canonical form of sudoku grids.
+
+Relabeling digits, permuting rows inside bands and columns inside stacks,
+permuting bands and stacks and transposing the grid give an equivalent sudoku
+- solution of one maps to solution of the other. `canonicalize` picks one
+representative of such puzzles, so equivalent ones can share a cached result.
+
+The form is heuristic, so it stays much cheaper than solving. Bands, rows,
+stacks and columns are ordered by invariants (number of givens refined by the
+numbers of givens in crossing lines), only orders of lines with equal
+invariants are tried (up to `MAX_CANDIDATES`) and digits are relabeled by the
+first appearance. Equivalent puzzles get the same form in most cases, in the
+rest they just do not share the cache entry - the transform is always exact.
+"""
+from itertools import chain, permutations, product
+from math import factorial, isqrt
+
+from sudoku_solver.exceptions import InvalidSudokuGrid
+
+
+# The highest number of tried line orders per grid orientation
+MAX_CANDIDATES = 16
+
+
+class Transform:
+    """
+    Symmetry of sudoku: optional transposition, then rows and columns
+    permutation and digits relabeling.
+
+    Args:
+        transpose (bool): Whether the grid is transposed first.
+        rows (list): Row ``i`` of the result is row ``rows[i]`` of the
+            (transposed) grid.
+        columns (list): Column ``j`` of the result is column ``columns[j]``
+            of the (transposed) grid.
+        digits (list): Digit ``d`` becomes ``digits[d]`` (``digits[0]`` is 0).
+    """
+
+    def __init__(self, transpose, rows, columns, digits):
+        self.transpose = transpose
+        self.rows = rows
+        self.columns = columns
+        self.digits = digits
+
+    def __eq__(self, other):
+        return isinstance(other, Transform) and (
+            self.transpose, self.rows, self.columns, self.digits
+        ) == (other.transpose, other.rows, other.columns, other.digits)
+
+    def __repr__(self):
+        return (
+            f'Transform(transpose={self.transpose}, rows={self.rows}, '
+            f'columns={self.columns}, digits={self.digits})'
+        )
+
+    def apply(self, grid):
+        """
+        Transforms the grid.
+
+        Args:
+            grid (list): Sudoku grid, it is not modified.
+
+        Returns:
+            list: New transformed grid.
+        """
+        if self.transpose:
+            grid = [list(column) for column in zip(*grid)]
+        digits = self.digits
+        return [
+            [digits[grid[row][column]] for column in self.columns]
+            for row in self.rows
+        ]
+
+    def inverse(self):
+        """
+        Computes the transform reverting this one.
+
+        Returns:
+            Transform: Inverse transform, ``t.inverse().apply(t.apply(grid))``
+                equals ``grid``.
+        """
+        rows = _invert(self.rows)
+        columns = _invert(self.columns)
+        if self.transpose:
+            rows, columns = columns, rows
+        return Transform(self.transpose, rows, columns, _invert(self.digits))
+
+
+def _invert(permutation):
+    """Returns inverse of the permutation given as a list."""
+    inverse = [0] * len(permutation)
+    for index, value in enumerate(permutation):
+        inverse[value] = index
+    return inverse
+
+
+def _runs(items, keys):
+    """Yields runs of consecutive items with equal keys."""
+    run = []
+    for item in items:
+        if run and keys[run[-1]] != keys[item]:
+            yield run
+            run = []
+        run.append(item)
+    if run:
+        yield run
+
+
+def _line_orders(keys, box_size):
+    """
+    Orders lines (rows or columns) by their invariants: groups of lines
+    (bands or stacks) by sorted keys of their lines, lines inside a group by
+    their keys.
+
+    Args:
+        keys (list): Invariant of every line.
+        box_size (int): Number of lines in a group.
+
+    Returns:
+        list: Orders of lines - one for every arrangement of lines with equal
+            invariants. Only the first one (ties in the original order) when
+            there are more than `MAX_CANDIDATES` arrangements.
+    """
+    groups = [
+        sorted(
+            range(group * box_size, (group + 1) * box_size),
+            key=keys.__getitem__
+        )
+        for group in range(box_size)
+    ]
+    group_keys = [[keys[line] for line in group] for group in groups]
+    order = sorted(range(box_size), key=group_keys.__getitem__)
+
+    # Every run of equal keys can be arranged in any order
+    group_runs = list(_runs(order, group_keys))
+    line_runs = [list(_runs(group, keys)) for group in groups]
+    arrangements = 1
+    for run in group_runs + [run for runs in line_runs for run in runs]:
+        arrangements *= factorial(len(run))
+    if arrangements > MAX_CANDIDATES:
+        return [[line for group in order for line in groups[group]]]
+
+    group_choices = product(*(permutations(run) for run in group_runs))
+    line_choices = list(product(*(
+        list(product(*(permutations(run) for run in runs)))
+        for runs in line_runs
+    )))
+    return [
+        [
+            line
+            for group in chain.from_iterable(group_choice)
+            for run in line_choice[group]
+            for line in run
+        ]
+        for group_choice in group_choices
+        for line_choice in line_choices
+    ]
+
+
+def _candidates(grid, box_size):
+    """
+    Computes row and column orders of the grid worth comparing.
+
+    Returns:
+        list: Pairs of row order and column order.
+    """
+    size = len(grid)
+    row_counts = [sum(1 for value in row if value) for row in grid]
+    column_counts = [
+        sum(1 for row in grid if row[column]) for column in range(size)
+    ]
+    # Number of givens refined by numbers of givens in crossing lines
+    row_keys = [
+        (row_counts[row], sorted(
+            column_counts[column] for column in range(size)
+            if grid[row][column]
+        ))
+        for row in range(size)
+    ]
+    column_keys = [
+        (column_counts[column], sorted(
+            row_counts[row] for row in range(size) if grid[row][column]
+        ))
+        for column in range(size)
+    ]
+    row_orders = _line_orders(row_keys, box_size)
+    column_orders = _line_orders(column_keys, box_size)
+    if len(row_orders) * len(column_orders) > MAX_CANDIDATES:
+        row_orders, column_orders = row_orders[:1], column_orders[:1]
+    return list(product(row_orders, column_orders))
+
+
+def _relabel(grid, rows, columns):
+    """
+    Relabels digits by their first appearance in the reordered grid.
+
+    Returns:
+        tuple: Flat list of relabeled cells and digits mapping.
+    """
+    size = len(grid)
+    digits = [0] * (size + 1)
+    label = 0
+    cells = []
+    for row in rows:
+        line = grid[row]
+        for column in columns:
+            value = line[column]
+            if value and not digits[value]:
+                label += 1
+                digits[value] = label
+            cells.append(digits[value])
+    # Digits absent from the grid take the remaining labels
+    for value in range(1, size + 1):
+        if not digits[value]:
+            label += 1
+            digits[value] = label
+    return cells, digits
+
+
+def canonicalize(grid):
+    """
+    Maps the grid to the canonical representative of its equivalent grids.
+
+    Args:
+        grid (list): Partially filled-in sudoku grid (9x9, 16x16...), it is
+            not modified.
+
+    Raises:
+        InvalidSudokuGrid: Grid is not a square with a square number of rows.
+
+    Returns:
+        tuple: Canonical grid and `Transform` mapping the grid to it. Use
+            ``transform.inverse().apply(canonical_solution)`` to get the
+            solution of the given grid.
+    """
+    size = len(grid)
+    box_size = isqrt(size)
+    if box_size < 1 or box_size * box_size != size or any(
+        len(row) != size for row in grid
+    ):
+        raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+
+    best = None
+    transposed = [list(column) for column in zip(*grid)]
+    for transpose, oriented in ((False, grid), (True, transposed)):
+        for rows, columns in _candidates(oriented, box_size):
+            cells, digits = _relabel(oriented, rows, columns)
+            if best is None or cells < best[0]:
+                best = (cells, Transform(transpose, rows, columns, digits))
+
+    cells, transform = best
+    canonical = [cells[row * size:(row + 1) * size] for row in range(size)]
+    return canonical, transform
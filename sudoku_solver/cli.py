@@ -0,0 +1,206 @@
+"""
+Command line interface solving files with one sudoku's string per line.
+
+Lines are streamed in chunks through the flat cells pipeline (parse, solve,
+format), so memory stays constant regardless of the input size. With
+``--jobs`` chunks are solved in worker processes and at most a few chunks per
+worker are in flight, results are written in the input order.
+
+Every input line produces an output line ``sudoku,solution`` - the solution
+is `NO_SOLUTION` (81 dots) when the sudoku can't be solved, so the output of
+81 characters long sudokus is a fixed-width file readable by
+`sudoku_solver.dataset.Dataset`. A summary is printed to stderr.
+
+    sudoku-solver puzzles.txt --jobs 4 > solutions.csv
+"""
+import argparse
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from sudoku_solver.exceptions import InvalidSudokuString, SearchAborted
+from sudoku_solver.pipeline import solve_sudoku_str
+from sudoku_solver.solver import BITMASK, ENGINES
+
+SOLVED = 'solved'
+UNSOLVABLE = 'unsolvable'
+INVALID = 'invalid'
+ABORTED = 'aborted'
+# Solution of the sudoku which can't be solved, as wide as a solved one
+NO_SOLUTION = '.' * 81
+# Number of chunks in flight per worker process
+CHUNKS_PER_JOB = 2
+
+
+def solve_lines(lines, engine=BITMASK, **options):
+    """
+    Solves sudoku's strings of the chunk.
+
+    Args:
+        lines (list): Sudoku's strings (without line endings).
+        engine (str): Name of the engine from `ENGINES`. Defaults to
+            ``'bitmask'``.
+        options: Engine's options.
+
+    Returns:
+        list: Pairs of the output line and its status (`SOLVED`,
+            `UNSOLVABLE`, `INVALID` or `ABORTED` when the search exceeded
+            limits given in `options`).
+    """
+    results = []
+    for line in lines:
+        try:
+            solution, solvable = solve_sudoku_str(line, engine, **options)
+        except InvalidSudokuString:
+            results.append((f'{line},{NO_SOLUTION}', INVALID))
+            continue
+        except SearchAborted:
+            results.append((f'{line},{NO_SOLUTION}', ABORTED))
+            continue
+        if solvable:
+            results.append((f'{line},{solution}', SOLVED))
+        else:
+            results.append((f'{line},{NO_SOLUTION}', UNSOLVABLE))
+    return results
+
+
+def read_chunks(lines, chunk_size):
+    """
+    Groups non-empty lines into chunks.
+
+    Args:
+        lines (iterable): Lines of the input, e.g. a text file.
+        chunk_size (int): Number of lines in a chunk.
+
+    Yields:
+        list: Lines without surrounding whitespace.
+    """
+    stripped = (line.strip() for line in lines)
+    sudokus = (line for line in stripped if line)
+    while True:
+        chunk = list(islice(sudokus, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_chunks(chunks, jobs=1, engine=BITMASK, **options):
+    """
+    Solves chunks in order, in worker processes when `jobs` is greater than
+    1.
+
+    Args:
+        chunks (iterable): Chunks of sudoku's strings (see `read_chunks`).
+        jobs (int): Number of worker processes. Defaults to 1 (solved in the
+            current process).
+        engine (str): Name of the engine from `ENGINES`. Defaults to
+            ``'bitmask'``.
+        options: Engine's options.
+
+    Yields:
+        list: Results of every chunk (see `solve_lines`), in the input order.
+    """
+    if jobs <= 1:
+        for chunk in chunks:
+            yield solve_lines(chunk, engine, **options)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(
+                executor.submit(solve_lines, chunk, engine, **options)
+            )
+            if len(pending) >= jobs * CHUNKS_PER_JOB:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def parse_args(argv=None):
+    """Parses command line arguments of `main`."""
+    parser = argparse.ArgumentParser(
+        prog='sudoku-solver',
+        description=(
+            'Solve sudoku\'s strings, one per line. Prints "sudoku,solution" '
+            'for every line, the solution is 81 dots when the sudoku can\'t '
+            'be solved.'
+        )
+    )
+    parser.add_argument(
+        'input', nargs='?', type=argparse.FileType('r'), default=sys.stdin,
+        help='File with sudoku\'s strings (default: stdin).'
+    )
+    parser.add_argument(
+        '-o', '--output', type=argparse.FileType('w'), default=sys.stdout,
+        help='Output file (default: stdout).'
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='Number of worker processes (default: 1).'
+    )
+    parser.add_argument(
+        '-c', '--chunk-size', type=int, default=1000,
+        help='Number of sudokus sent to a worker at once (default: 1000).'
+    )
+    parser.add_argument(
+        '-e', '--engine', choices=sorted(ENGINES), default=BITMASK,
+        help='Solving engine (default: bitmask).'
+    )
+    parser.add_argument(
+        '--max-nodes', type=int, default=None,
+        help='Node budget per sudoku, harder ones are counted as aborted.'
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+    return args
+
+
+def main(argv=None):
+    """
+    Entry point of the ``sudoku-solver`` command.
+
+    Args:
+        argv (list): Command line arguments. Defaults to None
+            (`sys.argv`).
+
+    Returns:
+        int: Exit status.
+    """
+    args = parse_args(argv)
+    options = {}
+    if args.max_nodes is not None:
+        options['max_nodes'] = args.max_nodes
+
+    counts = {SOLVED: 0, UNSOLVABLE: 0, INVALID: 0, ABORTED: 0}
+    start = time.perf_counter()
+    chunks = read_chunks(args.input, args.chunk_size)
+    for results in solve_chunks(chunks, args.jobs, args.engine, **options):
+        for line, status in results:
+            counts[status] += 1
+            args.output.write(line)
+            args.output.write('\n')
+    args.output.flush()
+    for stream in (args.input, args.output):
+        if stream not in (sys.stdin, sys.stdout):
+            stream.close()
+
+    elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    rate = total / elapsed if elapsed else 0.0
+    print(
+        f'{total} sudokus in {elapsed:.2f}s ({rate:.1f} sudokus/s): '
+        f'{counts[SOLVED]} solved, {counts[UNSOLVABLE]} unsolvable, '
+        f'{counts[INVALID]} invalid, {counts[ABORTED]} aborted',
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Compact binary encodings of 9x9 sudokus.
+
+- Packed: 4 bits per cell, two cells per byte (the first cell in the high
+  nibble), 41 bytes for any sudoku - fixed width, so packed sudokus can be
+  stored in fixed-width records.
+- Sparse: bitmap of givens (81 bits, 11 bytes) followed by the givens packed
+  4 bits each, e.g. 20 bytes for 17 givens. Smaller than packed for sudokus
+  with fewer than 60 givens, but the width varies.
+
+Both work on flat cells (see `sudoku_solver.pipeline.parse_cells`), batches of
+many sudokus are encoded with `sudoku_solver.vectorized.pack`.
+"""
+from sudoku_solver.exceptions import InvalidSudokuGrid
+
+
+PACKED_SIZE = 41
+BITMAP_SIZE = 11
+# Byte -> its high and low nibble as two cells
+_NIBBLES = [bytes(divmod(byte, 16)) for byte in range(256)]
+
+
+def _check_cells(cells):
+    """Checks there are 81 cells with values in range."""
+    if len(cells) != 81:
+        raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+    if max(cells) > 9:
+        raise InvalidSudokuGrid('Value is out of range!')
+
+
+def _pack_nibbles(values):
+    """Packs values (at most 15) two per byte, pads odd count with 0."""
+    values = bytes(values) + b'\x00'
+    return bytes(
+        values[index] << 4 | values[index + 1]
+        for index in range(0, len(values) - 1, 2)
+    )
+
+
+def _unpack_nibbles(data, count):
+    """Unpacks `count` values packed two per byte, checking they are digits."""
+    values = b''.join([_NIBBLES[byte] for byte in data])
+    if len(values) not in (count, count + 1) or any(values[count:]):
+        raise InvalidSudokuGrid('Wrong length of packed sudoku!')
+    values = bytearray(values[:count])
+    if values and max(values) > 9:
+        raise InvalidSudokuGrid('Value is out of range!')
+    return values
+
+
+def pack(cells):
+    """
+    Packs the sudoku into 41 bytes, 4 bits per cell.
+
+    Args:
+        cells (bytearray): 81 cell values row by row (0 means empty).
+
+    Raises:
+        InvalidSudokuGrid: There are not 81 cells or a value is out of range.
+
+    Returns:
+        bytes: Packed sudoku.
+    """
+    _check_cells(cells)
+    return _pack_nibbles(cells)
+
+
+def unpack(data):
+    """
+    Unpacks the sudoku packed by `pack`.
+
+    Args:
+        data (bytes): 41 bytes of packed sudoku.
+
+    Raises:
+        InvalidSudokuGrid: Data has wrong length or a value is out of range.
+
+    Returns:
+        bytearray: 81 cell values row by row (0 means empty).
+    """
+    if len(data) != PACKED_SIZE:
+        raise InvalidSudokuGrid('Wrong length of packed sudoku!')
+    return _unpack_nibbles(data, 81)
+
+
+def pack_sparse(cells):
+    """
+    Packs the sudoku into the bitmap of givens and the givens, 4 bits each.
+
+    Args:
+        cells (bytearray): 81 cell values row by row (0 means empty).
+
+    Raises:
+        InvalidSudokuGrid: There are not 81 cells or a value is out of range.
+
+    Returns:
+        bytes: 11 bytes of bitmap (bit 7 of the first byte stands for the
+            first cell) and ``ceil(givens / 2)`` bytes of givens.
+    """
+    _check_cells(cells)
+    bitmap = 0
+    for value in cells:
+        bitmap = bitmap << 1 | (value != 0)
+    bitmap <<= BITMAP_SIZE * 8 - 81
+    givens = bytes(cells).replace(b'\x00', b'')
+    return bitmap.to_bytes(BITMAP_SIZE, 'big') + _pack_nibbles(givens)
+
+
+def unpack_sparse(data):
+    """
+    Unpacks the sudoku packed by `pack_sparse`.
+
+    Args:
+        data (bytes): Bitmap of givens and the givens.
+
+    Raises:
+        InvalidSudokuGrid: Data has wrong length or a given is not a digit.
+
+    Returns:
+        bytearray: 81 cell values row by row (0 means empty).
+    """
+    bitmap = int.from_bytes(data[:BITMAP_SIZE], 'big')
+    if len(data) < BITMAP_SIZE or bitmap & (1 << BITMAP_SIZE * 8 - 81) - 1:
+        raise InvalidSudokuGrid('Wrong length of packed sudoku!')
+    bitmap >>= BITMAP_SIZE * 8 - 81
+    positions = [cell for cell in range(81) if bitmap >> (80 - cell) & 1]
+    givens = _unpack_nibbles(data[BITMAP_SIZE:], len(positions))
+    if 0 in givens:
+        raise InvalidSudokuGrid('Given is not a digit!')
+    cells = bytearray(81)
+    for cell, value in zip(positions, givens):
+        cells[cell] = value
+    return cells
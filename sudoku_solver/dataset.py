@@ -0,0 +1,217 @@
+"""
+Memory-mapped reader of fixed-width sudoku dataset files.
+
+Every record of the file has the same width: a sudoku's string and a newline
+(82 bytes) or a sudoku's string, a comma, its solution and a newline (164
+bytes, as printed by the ``sudoku-solver`` command for 81 characters long
+sudokus). The file is mapped into
+memory, records are `memoryview` slices of the mapping, so reading a record
+copies nothing and files larger than RAM are paged in by the OS on demand.
+
+`Dataset` can be pickled - it is reopened from its path - so worker
+processes get a shard (a range of records starting at a byte offset) and
+map the file themselves:
+
+    with Dataset('puzzles.txt') as dataset:
+        for shard in dataset.shards(workers):
+            executor.submit(validate_shard, dataset, shard)
+"""
+import mmap
+import os
+
+from sudoku_solver.exceptions import InvalidSudokuString
+from sudoku_solver.pipeline import parse_bytes
+
+
+PUZZLE_RECORD_SIZE = 82
+SOLUTION_RECORD_SIZE = 164
+
+
+class Dataset:
+    """
+    Fixed-width dataset file mapped into memory.
+
+    Args:
+        path (str): Path of the dataset file.
+
+    Raises:
+        InvalidSudokuString: File is not a fixed-width dataset of sudoku's
+            strings (or pairs of sudoku's string and solution).
+
+    Attributes:
+        record_size (int): Width of a record in bytes with the newline.
+        has_solutions (bool): Whether records contain solutions.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        with open(self.path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            self._mmap = None
+            self._view = memoryview(b'')
+            if size:
+                self._mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                self._view = memoryview(self._mmap)
+        self.record_size = self._detect_record_size(size)
+        self.has_solutions = self.record_size == SOLUTION_RECORD_SIZE
+        # The last record may miss its newline
+        self._count = (size + 1) // self.record_size
+
+    def _detect_record_size(self, size):
+        """Finds width of records by the first newline and checks the size."""
+        if not size:
+            return PUZZLE_RECORD_SIZE
+        newline = self._mmap.find(b'\n', 0, SOLUTION_RECORD_SIZE)
+        record_size = newline + 1 if newline != -1 else size + 1
+        if record_size not in (PUZZLE_RECORD_SIZE, SOLUTION_RECORD_SIZE):
+            raise InvalidSudokuString(
+                f'Records of {self.path} are not fixed-width sudoku\'s '
+                'strings!'
+            )
+        if size % record_size not in (0, record_size - 1):
+            raise InvalidSudokuString(
+                f'Size of {self.path} is not a multiple of the record size '
+                f'({record_size} bytes)!'
+            )
+        return record_size
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Releases the memory mapping, records can't be read afterwards.
+
+        Raises:
+            BufferError: Some records (or buffers) are still referenced.
+        """
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self):
+        return self._count
+
+    def offset(self, index):
+        """Returns byte offset of the record in the file."""
+        return index * self.record_size
+
+    def record(self, index):
+        """
+        Returns the record without its newline.
+
+        Args:
+            index (int): Index of the record, negative indexes count from the
+                end.
+
+        Raises:
+            IndexError: Index is out of range.
+
+        Returns:
+            memoryview: Zero-copy slice of the file - 81 bytes of the sudoku's
+                string or 163 bytes of the sudoku's string, comma and
+                solution.
+        """
+        if not -self._count <= index < self._count:
+            raise IndexError('Dataset record index out of range')
+        start = self.offset(index % self._count)
+        return self._view[start:start + self.record_size - 1]
+
+    __getitem__ = record
+
+    def puzzle(self, index):
+        """Returns zero-copy `memoryview` of the sudoku's string (81 bytes)."""
+        return self.record(index)[:81]
+
+    def solution(self, index):
+        """
+        Returns zero-copy `memoryview` of the solution (81 bytes) or None
+        when records do not contain solutions.
+        """
+        if not self.has_solutions:
+            return None
+        return self.record(index)[82:]
+
+    def cells(self, index):
+        """
+        Parses the sudoku's string of the record to flat cells.
+
+        Raises:
+            InvalidSudokuString: Record contains disallowed characters.
+
+        Returns:
+            bytearray: 81 cell values row by row (0 means empty).
+        """
+        return parse_bytes(self.puzzle(index))
+
+    def records(self, start=0, stop=None):
+        """
+        Yields records of the range (see `record`).
+
+        Args:
+            start (int): Index of the first record. Defaults to 0.
+            stop (int): Index after the last record. Defaults to None (till
+                the end of the file).
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        width = self.record_size - 1
+        for offset in range(
+            self.offset(start), self.offset(stop), self.record_size
+        ):
+            yield self._view[offset:offset + width]
+
+    def __iter__(self):
+        return self.records()
+
+    def buffer(self, start=0, stop=None):
+        """
+        Returns zero-copy `memoryview` of the bytes of the records range
+        (with newlines), e.g. for `numpy.frombuffer`.
+
+        Args:
+            start (int): Index of the first record. Defaults to 0.
+            stop (int): Index after the last record. Defaults to None (till
+                the end of the file).
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        return self._view[self.offset(start):self.offset(stop)]
+
+    def shards(self, count):
+        """
+        Splits records into contiguous shards of nearly equal size, e.g. one
+        per worker process. Shard ``range(start, stop)`` starts at byte
+        offset ``dataset.offset(start)``.
+
+        Args:
+            count (int): Number of shards.
+
+        Raises:
+            ValueError: Number of shards is lower than 1.
+
+        Returns:
+            list: Ranges of record indexes, empty shards are omitted.
+        """
+        if count < 1:
+            raise ValueError('Number of shards must be at least 1')
+
+        size, extra = divmod(self._count, count)
+        shards = []
+        start = 0
+        for shard in range(count):
+            stop = start + size + (shard < extra)
+            if stop > start:
+                shards.append(range(start, stop))
+            start = stop
+        return shards
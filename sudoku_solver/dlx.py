@@ -0,0 +1,327 @@
+"""
+Dancing Links (Algorithm X) sudoku engine.
+
+Sudoku is encoded as an exact cover problem with 324 constraint columns (each
+cell filled, each digit once in every row, column and box) and 729 candidate
+rows (digit in a cell). The linked structure is built once as a template and
+copied for every puzzle, then reduced by covering the rows of the givens.
+"""
+from sudoku_solver.exceptions import InvalidSudokuGrid
+from sudoku_solver.limits import SearchLimits, check_solutions_limit
+from sudoku_solver.stats import timed
+from sudoku_solver.tables import BOX_OF, COLUMN_OF, ROW_OF
+
+
+CONSTRAINTS = 324
+CANDIDATES = 729
+
+
+def _build_template():
+    """
+    Builds the doubly linked exact cover matrix of empty sudoku.
+
+    Node 0 is the root, nodes 1-324 are column headers and every candidate
+    row ``cell * 9 + digit - 1`` adds four nodes, one per satisfied
+    constraint.
+
+    Returns:
+        tuple: Left, right, up, down links, column of every node, candidate
+            row of every node, column sizes and the first node of every
+            candidate row.
+    """
+    nodes = 1 + CONSTRAINTS + 4 * CANDIDATES
+    left = list(range(-1, nodes - 1))
+    right = list(range(1, nodes + 1))
+    up = list(range(nodes))
+    down = list(range(nodes))
+    column = list(range(nodes))
+    candidate = [-1] * nodes
+    size = [0] * (1 + CONSTRAINTS)
+    row_start = [0] * CANDIDATES
+
+    # Circular list of column headers
+    left[0] = CONSTRAINTS
+    right[CONSTRAINTS] = 0
+
+    node = CONSTRAINTS + 1
+    for cell in range(81):
+        row, col, box = ROW_OF[cell], COLUMN_OF[cell], BOX_OF[cell]
+        for digit in range(9):
+            row_id = cell * 9 + digit
+            row_start[row_id] = node
+            headers = (
+                1 + cell,
+                1 + 81 + row * 9 + digit,
+                1 + 162 + col * 9 + digit,
+                1 + 243 + box * 9 + digit,
+            )
+            for offset, header in enumerate(headers):
+                current = node + offset
+                # Circular list of the candidate row
+                left[current] = node + (offset - 1) % 4
+                right[current] = node + (offset + 1) % 4
+                # Append at the bottom of the column
+                up[current] = up[header]
+                down[current] = header
+                down[up[header]] = current
+                up[header] = current
+                column[current] = header
+                candidate[current] = row_id
+                size[header] += 1
+            node += 4
+    return left, right, up, down, column, candidate, size, row_start
+
+
+(
+    _LEFT, _RIGHT, _UP, _DOWN, COLUMN, CANDIDATE, _SIZE, ROW_START
+) = _build_template()
+
+
+class DLXSolver:
+    """
+    Sudoku solver using Knuth's Algorithm X with Dancing Links. It always
+    branches on the constraint with the fewest remaining candidates, so it is
+    well suited to exhausting the search space, e.g. counting solutions or
+    proving uniqueness.
+
+    The search raises `SearchAborted` when it exceeds `max_nodes` or
+    `time_limit` (counted from the solver creation). Covered columns are
+    restored then, so the solver stays consistent.
+
+    Args:
+        grid (list): Partially filled-in sudoku grid (9x9) or its 81 flat
+            cells, e.g. `bytearray`, or `Grid` - the solution is written into
+            it in place.
+        max_nodes (int): Node budget of the solver. Defaults to None (no
+            budget).
+        time_limit (float): Seconds the solver may spend searching. Defaults
+            to None (no time limit).
+        stats (SearchStats): Statistics the search is counted into. Defaults
+            to None (not collected).
+
+    Raises:
+        InvalidSudokuGrid: Grid is not 9x9.
+
+    Attributes:
+        nodes (int): Number of search nodes (tried candidates) visited so far.
+        consistent (bool): Whether givens do not break sudoku rules.
+        solution (list): Flat list of 81 values of the first solution found
+            by the last search or None.
+    """
+
+    def __init__(self, grid, max_nodes=None, time_limit=None, stats=None):
+        # `Grid` is solved in place in its flat buffer
+        grid = getattr(grid, 'cells', grid)
+        self.flat = not grid or isinstance(grid[0], int)
+        if self.flat:
+            if len(grid) != 81:
+                raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+            self.givens = list(grid)
+        else:
+            if len(grid) != 9 or any(len(row) != 9 for row in grid):
+                raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+            self.givens = [value for row in grid for value in row]
+
+        self.grid = grid
+        self.left = _LEFT[:]
+        self.right = _RIGHT[:]
+        self.up = _UP[:]
+        self.down = _DOWN[:]
+        self.size = _SIZE[:]
+        self.partial = []
+        self.solution = None
+        self.count = 0
+        self.nodes = 0
+        self.limits = SearchLimits(max_nodes, time_limit)
+        self.stats = stats
+        self.consistent = True
+
+        covered = bytearray(1 + CONSTRAINTS)
+        for cell, value in enumerate(self.givens):
+            if not value:
+                continue
+            if not 0 < value <= 9:
+                self.consistent = False
+                return
+            node = ROW_START[cell * 9 + value - 1]
+            for current in range(node, node + 4):
+                header = COLUMN[current]
+                # Constraint already satisfied by other given
+                if covered[header]:
+                    self.consistent = False
+                    return
+                covered[header] = 1
+                self.cover(header)
+
+    def cover(self, header):
+        """Remove column and all rows intersecting it from the matrix."""
+        left, right, up, down, size = (
+            self.left, self.right, self.up, self.down, self.size
+        )
+        left[right[header]] = left[header]
+        right[left[header]] = right[header]
+        row = down[header]
+        while row != header:
+            node = right[row]
+            while node != row:
+                up[down[node]] = up[node]
+                down[up[node]] = down[node]
+                size[COLUMN[node]] -= 1
+                node = right[node]
+            row = down[row]
+
+    def uncover(self, header):
+        """Revert `cover` of the column."""
+        left, right, up, down, size = (
+            self.left, self.right, self.up, self.down, self.size
+        )
+        row = up[header]
+        while row != header:
+            node = left[row]
+            while node != row:
+                size[COLUMN[node]] += 1
+                up[down[node]] = node
+                down[up[node]] = node
+                node = left[node]
+            row = up[row]
+        left[right[header]] = header
+        right[left[header]] = header
+
+    def search(self, limit):
+        """
+        Recursively looks for exact covers of the remaining columns.
+
+        Args:
+            limit (int): Stop after finding this number of solutions. None
+                means no limit.
+
+        Raises:
+            SearchAborted: Node budget or time limit is exceeded.
+
+        Returns:
+            bool: Whether the limit of solutions has been reached.
+        """
+        right, down, size = self.right, self.down, self.size
+        stats = self.stats
+        if right[0] == 0:
+            if stats is not None:
+                stats.solutions += 1
+            self.count += 1
+            if self.solution is None:
+                self.solution = self.givens[:]
+                for row_id in self.partial:
+                    self.solution[row_id // 9] = row_id % 9 + 1
+            return limit is not None and self.count >= limit
+
+        # Column with the fewest candidates
+        header, best = right[0], size[right[0]]
+        current = right[header]
+        while current != 0 and best > 1:
+            if size[current] < best:
+                header, best = current, size[current]
+            current = right[current]
+        if not best:
+            if stats is not None:
+                stats.backtracks += 1
+            return False
+        if stats is not None:
+            stats.max_depth = max(stats.max_depth, len(self.partial) + 1)
+
+        stop = False
+        limits = self.limits
+        self.cover(header)
+        try:
+            row = down[header]
+            while row != header:
+                self.nodes += 1
+                if self.nodes >= limits.next_check:
+                    limits.check(self.nodes)
+                if stats is not None:
+                    stats.nodes += 1
+                    # The last untried row is forced like a single one
+                    if down[row] == header:
+                        stats.forced += 1
+                    else:
+                        stats.guesses += 1
+                self.partial.append(CANDIDATE[row])
+                node = right[row]
+                while node != row:
+                    self.cover(COLUMN[node])
+                    node = right[node]
+
+                # Restore the matrix also when the search is aborted
+                try:
+                    stop = self.search(limit)
+                finally:
+                    node = self.left[row]
+                    while node != row:
+                        self.uncover(COLUMN[node])
+                        node = self.left[node]
+                    self.partial.pop()
+                if stop:
+                    break
+                row = down[row]
+        finally:
+            self.uncover(header)
+        return stop
+
+    def count_solutions(self, limit=None):
+        """
+        Counts solutions of the sudoku. The first solution found is kept in
+        `solution`, the grid is not modified.
+
+        Args:
+            limit (int): Stop counting after reaching this number of
+                solutions. Defaults to None (count all).
+
+        Raises:
+            ValueError: `limit` is lower than 1.
+            SearchAborted: Node budget or time limit is exceeded.
+
+        Returns:
+            int: Number of solutions (at most `limit`).
+        """
+        check_solutions_limit(limit)
+        self.count = 0
+        self.solution = None
+        if self.consistent:
+            with timed(self.stats):
+                self.search(limit)
+        return self.count
+
+    def is_unique(self):
+        """
+        Checks whether the sudoku has exactly one solution. Search stops on
+        the second solution.
+
+        Raises:
+            SearchAborted: Node budget or time limit is exceeded.
+
+        Returns:
+            bool: If sudoku has one and only one solution.
+        """
+        return self.count_solutions(limit=2) == 1
+
+    def write_solution(self):
+        """Writes `solution` into the given grid."""
+        if self.flat:
+            self.grid[:] = self.solution
+            return
+        for row in range(9):
+            self.grid[row][:] = self.solution[row * 9:(row + 1) * 9]
+
+    def solve(self):
+        """
+        Solves the sudoku and writes the solution into the given grid.
+
+        Raises:
+            SearchAborted: Node budget or time limit is exceeded.
+
+        Returns:
+            bool: If sudoku can be solved or not. The grid is left untouched
+                when there is no solution.
+        """
+        if not self.count_solutions(limit=1):
+            return False
+        self.write_solution()
+        return True
@@ -0,0 +1,10 @@
+class InvalidSudokuString(Exception):
+    pass
+
+
+class InvalidSudokuGrid(Exception):
+    pass
+
+
+class SearchAborted(Exception):
+    pass
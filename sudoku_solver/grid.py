@@ -0,0 +1,186 @@
+"""
+Compact sudoku grid.
+
+`Grid` keeps all cells in one contiguous `bytearray` (one byte per cell)
+instead of a list of row lists with boxed ints. Rows are exposed as
+`memoryview` slices of the buffer, so functions written for list of lists
+(``grid[row][column]``, iterating rows) accept it transparently, while the
+engines solve it directly in the flat buffer.
+"""
+from math import isqrt
+
+from sudoku_solver.exceptions import InvalidSudokuGrid
+from sudoku_solver.pipeline import format_cells, parse_cells
+from sudoku_solver.tables import cells_tables
+
+
+class Grid:
+    """
+    Sudoku grid backed by a single `bytearray` of cells, row by row.
+
+    Args:
+        cells (bytes): Cell values row by row (0 means empty), any iterable of
+            ints works. Defaults to None (empty grid).
+        box_size (int): Size of the box side, used for the empty grid.
+            Defaults to 3.
+
+    Raises:
+        InvalidSudokuGrid: Number of cells is not a square of a square number.
+
+    Attributes:
+        cells (bytearray): Flat buffer of cells, engines solve it in place.
+        size (int): Number of rows (and columns).
+    """
+
+    __slots__ = ('cells', 'size', '_tables')
+
+    def __init__(self, cells=None, box_size=3):
+        if cells is None:
+            cells = bytes(box_size ** 4)
+        self.cells = bytearray(cells)
+        self._tables = cells_tables(self.cells)
+        self.size = isqrt(len(self.cells))
+
+    @classmethod
+    def from_str(cls, sudoku_str):
+        """
+        Creates 9x9 grid from sudoku's string without intermediate lists.
+
+        Args:
+            sudoku_str (str): Sudoku grid as string which can only contains
+                digits or dots (same as 0).
+
+        Raises:
+            InvalidSudokuString: String has wrong length or contains
+                disallowed characters.
+
+        Returns:
+            Grid: New grid.
+        """
+        return cls(parse_cells(sudoku_str))
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Creates grid from list of lists.
+
+        Args:
+            rows (list): Matrix with partially/fully filled-in sudoku.
+
+        Raises:
+            InvalidSudokuGrid: Rows do not make a sudoku grid.
+
+        Returns:
+            Grid: New grid.
+        """
+        if any(len(row) != len(rows) for row in rows):
+            raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+        return cls(value for row in rows for value in row)
+
+    def to_str(self):
+        """
+        Converts 9x9 grid to sudoku's string without intermediate lists.
+
+        Raises:
+            InvalidSudokuGrid: Grid is not 9x9.
+
+        Returns:
+            str: Sudoku grid as string which can only contains digits or dots
+                (same as 0).
+        """
+        return format_cells(self.cells)
+
+    def to_rows(self):
+        """Returns the grid as list of lists."""
+        return [list(row) for row in self]
+
+    def copy(self):
+        """Returns independent grid with copied buffer."""
+        grid = Grid.__new__(Grid)
+        grid.cells = self.cells[:]
+        grid.size = self.size
+        grid._tables = self._tables
+        return grid
+
+    def view(self):
+        """
+        Returns writable `memoryview` of the flat cells buffer. It works on
+        every supported Python version, ``memoryview(grid)`` needs the buffer
+        protocol of Python classes available only since Python 3.12.
+        """
+        return memoryview(self.cells)
+
+    def __buffer__(self, flags):
+        # Used only by Python 3.12+ (PEP 688), older versions raise TypeError
+        # for `memoryview(grid)` - `view` is the portable way
+        return memoryview(self.cells)
+
+    @property
+    def peers(self):
+        """list: Flat indexes of peers (cells sharing a unit) of every cell."""
+        return self._tables[4]
+
+    def is_safe(self, row, column, value):
+        """
+        Checks whether `value` can be placed in the cell, using the
+        precomputed peers table. Same as `sudoku_solver.solver.is_safe`, the
+        cell itself must not hold the value either.
+
+        Args:
+            row (int): The row number.
+            column (int): The column number.
+            value (int): The value to check.
+
+        Returns:
+            bool: Whether neither the cell nor its peers hold the value.
+        """
+        cells = self.cells
+        cell = row * self.size + column
+        return cells[cell] != value and all(
+            cells[peer] != value for peer in self.peers[cell]
+        )
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        """
+        Returns row as `memoryview` (``grid[row][column]``) or a single cell
+        (``grid[row, column]``).
+        """
+        size = self.size
+        if isinstance(index, tuple):
+            return self.cells[self._cell(index)]
+        if not -size <= index < size:
+            raise IndexError('Grid row index out of range')
+        start = (index % size) * size
+        return memoryview(self.cells)[start:start + size]
+
+    def __setitem__(self, index, value):
+        self.cells[self._cell(index)] = value
+
+    def _cell(self, index):
+        # Flat index of the cell, unchecked column would reach the next row
+        row, column = index
+        size = self.size
+        if not (0 <= row < size and 0 <= column < size):
+            raise IndexError('Grid cell index out of range')
+        return row * size + column
+
+    def __iter__(self):
+        view = memoryview(self.cells)
+        size = self.size
+        for start in range(0, size * size, size):
+            yield view[start:start + size]
+
+    def __eq__(self, other):
+        if isinstance(other, Grid):
+            return self.cells == other.cells
+        if isinstance(other, list):
+            return self.to_rows() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'Grid({bytes(self.cells)!r})'
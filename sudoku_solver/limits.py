@@ -0,0 +1,79 @@
+"""
+Limits of the search: node budget and time limit.
+
+Engines compare their node counter with `SearchLimits.next_check` on every
+node (one integer comparison) and call `check` only when it is reached, so
+the clock is read once per `CHECK_INTERVAL` nodes.
+"""
+import time
+
+from sudoku_solver.exceptions import SearchAborted
+
+
+# Number of nodes between clock readings
+CHECK_INTERVAL = 256
+
+
+class SearchLimits:
+    """
+    Node budget and deadline of the search.
+
+    Args:
+        max_nodes (int): The highest number of search nodes. Defaults to None
+            (no budget).
+        time_limit (float): Seconds from now after which the search is
+            aborted. Defaults to None (no time limit).
+        clock (callable): Function returning monotonic time in seconds.
+            Defaults to `time.monotonic`.
+
+    Attributes:
+        deadline (float): Clock time of the time limit or None.
+        next_check (int): Number of nodes on which `check` has to be called
+            next.
+    """
+
+    def __init__(self, max_nodes=None, time_limit=None, clock=time.monotonic):
+        self.max_nodes = max_nodes
+        self.clock = clock
+        self.deadline = None if time_limit is None else clock() + time_limit
+        self.next_check = self._next_check(0)
+
+    def _next_check(self, nodes):
+        next_check = float('inf')
+        if self.deadline is not None:
+            next_check = nodes + CHECK_INTERVAL
+        if self.max_nodes is not None:
+            next_check = min(next_check, self.max_nodes + 1)
+        return next_check
+
+    def check(self, nodes):
+        """
+        Checks whether the search can go on.
+
+        Args:
+            nodes (int): Number of nodes visited so far.
+
+        Raises:
+            SearchAborted: Node budget or time limit is exceeded.
+        """
+        if self.max_nodes is not None and nodes > self.max_nodes:
+            raise SearchAborted(
+                f'Search exceeded the budget of {self.max_nodes} nodes'
+            )
+        if self.deadline is not None and self.clock() >= self.deadline:
+            raise SearchAborted('Search exceeded the time limit')
+        self.next_check = self._next_check(nodes)
+
+
+def check_solutions_limit(limit):
+    """
+    Checks the limit of counted solutions.
+
+    Args:
+        limit (int): Maximum number of solutions to count or None (no limit).
+
+    Raises:
+        ValueError: `limit` is lower than 1.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError('Solutions limit must be at least 1')
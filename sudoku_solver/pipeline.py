@@ -0,0 +1,137 @@
+"""
+Fast path of solving sudoku's strings on flat cells.
+
+Sudoku's string is parsed into a flat `bytearray` of 81 cells with
+`bytes.translate`, validated in a single pass with bitmasks, solved in place
+and serialized back with `bytes.translate`, so no nested lists are built on
+the way. Functions of `sudoku_solver.solver` working on list of lists stay as
+the compatibility layer.
+"""
+from sudoku_solver.bitmask import cells_masks
+from sudoku_solver.exceptions import InvalidSudokuGrid, InvalidSudokuString
+from sudoku_solver.solver import BITMASK, create_solver, sudoku_str_to_grid
+
+
+ALLOWED_CHARACTERS = b'.0123456789'
+# Character -> cell value and cell value -> character
+_TO_CELLS = bytes.maketrans(ALLOWED_CHARACTERS, bytes([0, *range(10)]))
+_TO_CHARACTERS = bytes.maketrans(bytes(range(10)), b'.123456789')
+
+
+def parse_cells(sudoku_str):
+    """
+    Converts sudoku's string to flat cells.
+
+    Args:
+        sudoku_str (str): Sudoku grid as string which can only contains digits
+            or dots (same as 0).
+
+    Raises:
+        InvalidSudokuString: String has wrong length or contains disallowed
+            characters.
+
+    Returns:
+        bytearray: 81 cell values row by row (0 means empty).
+    """
+    if len(sudoku_str) != 81:
+        raise InvalidSudokuString('Too many characters!')
+    try:
+        data = sudoku_str.encode('ascii')
+    except UnicodeEncodeError:
+        # Non ASCII decimals (e.g. Arabic-Indic digits) take the slow path
+        return bytearray(
+            value for row in sudoku_str_to_grid(sudoku_str) for value in row
+        )
+    return parse_bytes(data)
+
+
+def parse_bytes(data):
+    """
+    Converts ASCII sudoku's string to flat cells, e.g. a record of a dataset
+    file without decoding it to `str`.
+
+    Args:
+        data (bytes): 81 ASCII digits or dots (same as 0), any bytes-like
+            object (e.g. `memoryview`) works.
+
+    Raises:
+        InvalidSudokuString: Data has wrong length or contains disallowed
+            characters.
+
+    Returns:
+        bytearray: 81 cell values row by row (0 means empty).
+    """
+    if len(data) != 81:
+        raise InvalidSudokuString('Too many characters!')
+    data = bytes(data)
+    disallowed = data.translate(None, ALLOWED_CHARACTERS)
+    if disallowed:
+        raise InvalidSudokuString(
+            f'{chr(disallowed[0])} is not a decimal or "." !'
+        )
+    return bytearray(data.translate(_TO_CELLS))
+
+
+def format_cells(cells):
+    """
+    Converts flat cells to sudoku's string.
+
+    Args:
+        cells (bytearray): 81 cell values row by row.
+
+    Raises:
+        InvalidSudokuGrid: When there are not 81 cells.
+
+    Returns:
+        str: Sudoku grid as string which can only contains digits or dots
+            (same as 0).
+    """
+    if len(cells) != 81:
+        raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+    return bytes(cells).translate(_TO_CHARACTERS).decode('ascii')
+
+
+def solve_cells(cells, engine=BITMASK, **options):
+    """
+    Validates and solves flat cells in place. Masks built by the validation
+    seed the bitmask engine.
+
+    Args:
+        cells (bytearray): 81 cell values row by row.
+        engine (str): Name of the engine from `ENGINES`. Defaults to
+            ``'bitmask'``.
+        options: Engine's options.
+
+    Returns:
+        bool: If sudoku can be solved or not. Solution in `cells` if exists.
+    """
+    *masks, conflict = cells_masks(cells)
+    if conflict is not None:
+        return False
+    if engine == BITMASK:
+        options['masks'] = masks
+    return create_solver(cells, engine, **options).solve()
+
+
+def solve_sudoku_str(sudoku_str, engine=BITMASK, **options):
+    """
+    Parses, validates, solves and serializes the sudoku in one pipeline.
+
+    Args:
+        sudoku_str (str): Sudoku grid as string which can only contains digits
+            or dots (same as 0).
+        engine (str): Name of the engine from `ENGINES`. Defaults to
+            ``'bitmask'``.
+        options: Engine's options.
+
+    Raises:
+        InvalidSudokuString: String has wrong length or contains disallowed
+            characters.
+
+    Returns:
+        tuple: Solution string (the normalized sudoku's string when it can't
+            be solved) and whether sudoku can be solved.
+    """
+    cells = parse_cells(sudoku_str)
+    solvable = solve_cells(cells, engine, **options)
+    return format_cells(cells), solvable
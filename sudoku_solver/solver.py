@@ -1,9 +1,40 @@
-class InvalidSudokuString(Exception):
-    pass
+from sudoku_solver.bitmask import BitmaskSolver, grid_masks
+from sudoku_solver.dlx import DLXSolver
+from sudoku_solver.exceptions import (  # noqa
+    InvalidSudokuGrid, InvalidSudokuString, SearchAborted
+)
+from sudoku_solver.tables import size_positions
+
+BITMASK = 'bitmask'
+DLX = 'dlx'
+# Engine name -> solver class
+ENGINES = {
+    BITMASK: BitmaskSolver,
+    DLX: DLXSolver,
+}
+
+
+def _is_valid_unit(grid, positions):
+    """
+    Checks whether values at the given positions are different (zeros are
+    omitted).
 
+    Args:
+        grid (list): Matrix with partially/fully filled-in sudoku.
+        positions (list): ``(row, column)`` pairs of the unit's cells.
 
-class InvalidSudokuGrid(Exception):
-    pass
+    Returns:
+        bool: Whether unit is valid sudoku unit or not.
+    """
+    seen = 0
+    for row, column in positions:
+        value = grid[row][column]
+        if value:
+            bit = 1 << value
+            if seen & bit:
+                return False
+            seen |= bit
+    return True
 
 
 def is_valid_column(grid, column_number):
@@ -18,10 +49,9 @@ def is_valid_column(grid, column_number):
     Returns:
         bool: Whether column is valid sudoku column or not.
     """
-    column = list(filter(
-        lambda value: value != 0, [row[column_number] for row in grid]
-    ))
-    return len(column) == len(set(column))
+    size = len(grid)
+    unit_positions, _ = size_positions(size)
+    return _is_valid_unit(grid, unit_positions[size + column_number])
 
 
 def is_valid_row(grid, row_num):
@@ -36,8 +66,8 @@ def is_valid_row(grid, row_num):
     Returns:
         bool: Whether row is valid sudoku row or not.
     """
-    row = list(filter(lambda value: value != 0, grid[row_num]))
-    return len(row) == len(set(row))
+    unit_positions, _ = size_positions(len(grid))
+    return _is_valid_unit(grid, unit_positions[row_num])
 
 
 def is_valid_boxes(grid):
@@ -51,38 +81,56 @@ def is_valid_boxes(grid):
     Returns:
         bool: Whether all boxes are valid sudoku box or not.
     """
-    for row in range(0, 9, 3):
-        for col in range(0, 9, 3):
-            box = []
-            for x in range(row, row+3):
-                for y in range(col, col+3):
-                    if grid[x][y] != 0:
-                        box.append(grid[x][y])
-            if len(box) != len(set(box)):
-                return False
-    return True
+    size = len(grid)
+    unit_positions, _ = size_positions(size)
+    return all(
+        _is_valid_unit(grid, positions)
+        for positions in unit_positions[2 * size:]
+    )
 
 
 def is_valid_sudoku_grid(grid):
     """
     Checks whether grid is correct sudoku grid. Grid is correct when each row
     is correct sudoku row, each column is correct sudoku column and each box is
-    correct sudoku box.
+    correct sudoku box. All units are checked in a single pass with bitmasks
+    (see `find_conflict`).
 
     Args:
         grid (list): Matrix with partially/fully filled-in sudoku.
 
+    Raises:
+        InvalidSudokuGrid: When grid has got wrong dimension.
+
     Returns:
         bool: Whether passed grid is valid sudoku grid or not.
     """
-    for i in range(9):
-        is_valid = is_valid_row(grid, i)
-        if not is_valid:
-            return False
-        is_valid = is_valid_column(grid, i)
-        if not is_valid:
-            return False
-    return is_valid_boxes(grid)
+    return grid_masks(grid)[3] is None
+
+
+def find_conflict(grid):
+    """
+    Finds the first cell (in reading order) breaking sudoku rules in a single
+    pass over the grid.
+
+    Args:
+        grid (list): Matrix with partially/fully filled-in sudoku.
+
+    Raises:
+        InvalidSudokuGrid: When grid has got wrong dimension.
+
+    Returns:
+        tuple: None when grid is valid, otherwise the unit (``'row'``,
+            ``'column'``, ``'box'`` or ``'range'`` for value out of range),
+            the value and ``(row, column)`` positions of the earlier cell with
+            the same value and of the conflicting cell.
+    """
+    conflict = grid_masks(grid)[3]
+    if conflict is None:
+        return None
+    unit, value, earlier, cell = conflict
+    size = len(grid)
+    return unit, value, divmod(earlier, size), divmod(cell, size)
 
 
 def sudoku_str_to_grid(sudoku_str):
@@ -147,62 +195,103 @@ def is_safe(grid, row, column, number):
     Returns:
         bool: Whether assignation is legal or not.
     """
-    # Checking row
-    for x in range(9):
-        if grid[row][x] == number:
+    size = len(grid)
+    if grid[row][column] == number:
+        return False
+    _, peer_positions = size_positions(size)
+    for peer_row, peer_column in peer_positions[row * size + column]:
+        if grid[peer_row][peer_column] == number:
             return False
+    return True
 
-    # Checking column
-    for x in range(9):
-        if grid[x][column] == number:
-            return False
 
-    # Checking box
-    start_row = row - row % 3
-    start_column = column - column % 3
-    for x in range(3):
-        for y in range(3):
-            if grid[x + start_row][y + start_column] == number:
-                return False
-    return True
+def create_solver(grid, engine=BITMASK, **options):
+    """
+    Creates solver of the given engine for the grid. Every solver exposes
+    `solve`, `count_solutions`, `is_unique` and `write_solution` methods and
+    `nodes` counter.
+
+    Args:
+        grid (list): Partially filled-in sudoku grid.
+        engine (str): Name of the engine from `ENGINES`. Defaults to
+            ``'bitmask'``.
+        options: Additional engine's options, e.g. `cell_order` of bitmask
+            engine or `max_nodes` and `time_limit` of every engine (search
+            exceeding them raises `SearchAborted`).
+
+    Raises:
+        ValueError: Unknown engine.
 
+    Returns:
+        object: Solver instance.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f'Unknown engine: {engine}')
+    return ENGINES[engine](grid, **options)
 
-def solve_sudoku(grid, row=0, column=0):
+
+def solve_sudoku(grid, engine=BITMASK, **options):
     """
     Takes a partially filled-in grid and attempt to assign values to all
     unassigned locations in such a way to meet the requirements for Sudoku
-    solution (non-duplication across rows, columns, and boxes)
+    solution (non-duplication across rows, columns, and boxes). Uses
+    constraint propagation engine (`BitmaskSolver`) by default.
 
     Args:
             grid (list): Partially filled-in sudoku grid.
-            row (int): Row index. Defaults to 0.
-            column (int): Column index. Defaults to 0.
+            engine (str): ``'bitmask'`` (constraint propagation) or ``'dlx'``
+                (Dancing Links). Defaults to ``'bitmask'``.
+            options: Engine's options, e.g. `cell_order` of bitmask engine -
+                ``'row-major'`` (returns lexicographically smallest solution,
+                default) or ``'mrv'`` (the fewest candidates first, usually
+                fewer search nodes).
 
     Returns:
             bool: If sudoku can be solved or not. Solution in `grid` if exists.
     """
-    # Avoid further backtracking
-    if (row == 8 and column == 9):
-        return True
-
-    # Go to next row of grid
-    if column == 9:
-        row += 1
-        column = 0
-
-    # Skip cell if it contains value (go to next step)
-    if grid[row][column] > 0:
-        return solve_sudoku(grid, row, column + 1)
-
-    for number in range(1, 10):
-        # Check if `number` can be assigned in `row` & `column`. Move to next
-        # column if `number` can be inserted.
-        if is_safe(grid, row, column, number):
-            grid[row][column] = number
-            if solve_sudoku(grid, row, column + 1):
-                return True
-
-        # Assumption went wrong, reset value and go to next assumption with
-        # different `number` value
-        grid[row][column] = 0
-    return False
+    return create_solver(grid, engine, **options).solve()
+
+
+def count_solutions(grid, limit=None, engine=BITMASK, **options):
+    """
+    Counts solutions of the sudoku. Search is resumed after every solution
+    and stops as soon as `limit` solutions are found, e.g. ``limit=2`` is
+    enough to tell unique sudoku from ambiguous one.
+
+    Args:
+        grid (list): Partially filled-in sudoku grid.
+        limit (int): Maximum number of solutions to count. Defaults to None
+            (count all).
+        engine (str): Name of the engine from `ENGINES`. Defaults to
+            ``'bitmask'``.
+        options: Engine's options.
+
+    Raises:
+        ValueError: `limit` is lower than 1.
+
+    Returns:
+        int: Number of solutions (at most `limit`). The first solution found
+            is written into `grid` if exists.
+    """
+    solver = create_solver(grid, engine, **options)
+    count = solver.count_solutions(limit)
+    if count:
+        solver.write_solution()
+    return count
+
+
+def is_unique(grid, engine=BITMASK, **options):
+    """
+    Checks whether the sudoku has exactly one solution.
+
+    Args:
+        grid (list): Partially filled-in sudoku grid.
+        engine (str): Name of the engine from `ENGINES`. Defaults to
+            ``'bitmask'``.
+        options: Engine's options.
+
+    Returns:
+        bool: If sudoku has one and only one solution. The grid is not
+            modified.
+    """
+    return create_solver(grid, engine, **options).is_unique()
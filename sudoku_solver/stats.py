@@ -0,0 +1,75 @@
+"""
+Instrumentation of the search.
+
+Engines created with ``stats=SearchStats()`` count what the search does
+into it. Without stats the engines only test ``stats is not None`` a few
+times per node, so the instrumentation costs next to nothing when disabled.
+"""
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class SearchStats:
+    """
+    Statistics of the search. Counters add up when the same object is passed
+    to several searches.
+
+    Attributes:
+        nodes (int): Search nodes visited (the root and every tried choice).
+        guesses (int): Choices tried while other candidates of the same
+            cell (or constraint) were still untried.
+        forced (int): Values placed without guessing - singles found by
+            constraint propagation (bitmask), choices of a constraint with
+            a single candidate (dlx) and the last untried candidate after
+            the others led to contradictions.
+        backtracks (int): Dead ends (contradictions) the search returned
+            from.
+        max_depth (int): The deepest level of nested choices.
+        solutions (int): Solutions found.
+        time (float): Wall time of the searches in seconds.
+    """
+
+    FIELDS = (
+        'nodes', 'guesses', 'forced', 'backtracks', 'max_depth', 'solutions',
+        'time',
+    )
+
+    def __init__(self):
+        self.nodes = 0
+        self.guesses = 0
+        self.forced = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.solutions = 0
+        self.time = 0.0
+
+    def to_dict(self):
+        """Returns statistics as a dictionary, e.g. for metrics or JSON."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        fields = ', '.join(
+            f'{field}={getattr(self, field)!r}' for field in self.FIELDS
+        )
+        return f'SearchStats({fields})'
+
+
+@contextmanager
+def _measure(stats):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.time += time.perf_counter() - start
+
+
+def timed(stats):
+    """
+    Returns context manager adding its wall time to `stats.time`.
+
+    Args:
+        stats (SearchStats): Statistics of the search or None (no-op).
+    """
+    if stats is None:
+        return nullcontext()
+    return _measure(stats)
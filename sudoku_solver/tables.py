@@ -0,0 +1,153 @@
+"""
+Precomputed index tables of sudoku boards.
+
+Every cell belongs to three units (its row, column and box) and has peers -
+cells sharing a unit with it (20 per cell on 9x9). The tables are built once
+per box size and shared by validation and solving routines, so they do not
+re-derive box boundaries (``row - row % 3``) on every call.
+"""
+from math import isqrt
+
+from sudoku_solver.exceptions import InvalidSudokuGrid
+
+
+def build_tables(box_size):
+    """
+    Builds index tables of a board with the given box size.
+
+    Args:
+        box_size (int): Size of the box side (3 for standard sudoku).
+
+    Returns:
+        tuple: Lists mapping a flat cell index to its row, column and box,
+            list of units (rows, columns, boxes) and list of peers.
+    """
+    size = box_size * box_size
+    cells = range(size * size)
+    row_of = [cell // size for cell in cells]
+    column_of = [cell % size for cell in cells]
+    box_of = [
+        (cell // (size * box_size)) * box_size + (cell % size) // box_size
+        for cell in cells
+    ]
+    units = (
+        [[row * size + column for column in range(size)]
+         for row in range(size)] +
+        [[row * size + column for row in range(size)]
+         for column in range(size)] +
+        [[cell for cell in cells if box_of[cell] == box]
+         for box in range(size)]
+    )
+    # Cells sharing a row, column or box with the cell (20 per cell on 9x9)
+    peers = [
+        sorted(set(
+            units[row_of[cell]] + units[size + column_of[cell]] +
+            units[2 * size + box_of[cell]]
+        ) - {cell})
+        for cell in cells
+    ]
+    return row_of, column_of, box_of, units, peers
+
+
+ROW_OF, COLUMN_OF, BOX_OF, UNITS, PEERS = build_tables(3)
+_TABLES = {3: (ROW_OF, COLUMN_OF, BOX_OF, UNITS, PEERS)}
+
+
+def _box_tables(box_size):
+    """Returns tables of the box size, built once per box size."""
+    if box_size not in _TABLES:
+        _TABLES[box_size] = build_tables(box_size)
+    return _TABLES[box_size]
+
+
+def grid_tables(grid):
+    """
+    Checks dimension of the grid and returns its index tables (see
+    `build_tables`).
+
+    Args:
+        grid (list): Sudoku grid (9x9, 16x16, 25x25...).
+
+    Raises:
+        InvalidSudokuGrid: Grid is not a square with a square number of rows.
+
+    Returns:
+        tuple: Row, column and box of every cell, units and peers.
+    """
+    size = len(grid)
+    box_size = isqrt(size)
+    if box_size < 1 or box_size * box_size != size or any(
+        len(row) != size for row in grid
+    ):
+        raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+    return _box_tables(box_size)
+
+
+def cells_tables(cells):
+    """
+    Checks length of the flat cells sequence and returns its index tables
+    (see `build_tables`).
+
+    Args:
+        cells (bytearray): Flat cells of sudoku (81, 256, 625...), row by row.
+
+    Raises:
+        InvalidSudokuGrid: Length is not a square of a square number.
+
+    Returns:
+        tuple: Row, column and box of every cell, units and peers.
+    """
+    size = isqrt(len(cells))
+    box_size = isqrt(size)
+    if box_size < 1 or box_size * box_size != size or size * size != len(
+        cells
+    ):
+        raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+    return _box_tables(box_size)
+
+
+def build_positions(units, peers, size):
+    """
+    Converts flat indexes of units and peers to ``(row, column)`` pairs, so
+    list of lists grids are indexed without dividing flat indexes.
+
+    Args:
+        units (list): Units of the board (see `build_tables`).
+        peers (list): Peers of every cell of the board.
+        size (int): Number of rows (and columns) of the board.
+
+    Returns:
+        tuple: Lists of ``(row, column)`` pairs of every unit and of peers of
+            every cell.
+    """
+    return (
+        [[divmod(cell, size) for cell in unit] for unit in units],
+        [[divmod(peer, size) for peer in cell_peers] for cell_peers in peers]
+    )
+
+
+UNIT_POSITIONS, PEER_POSITIONS = build_positions(UNITS, PEERS, 9)
+_POSITIONS = {9: (UNIT_POSITIONS, PEER_POSITIONS)}
+
+
+def size_positions(size):
+    """
+    Returns ``(row, column)`` pairs of units and peers (see `build_positions`)
+    of the board with the given number of rows, built once per size.
+
+    Args:
+        size (int): Number of rows (and columns) of the board.
+
+    Raises:
+        InvalidSudokuGrid: Size is not a square number.
+
+    Returns:
+        tuple: Positions of every unit and of peers of every cell.
+    """
+    if size not in _POSITIONS:
+        box_size = isqrt(size)
+        if box_size < 1 or box_size * box_size != size:
+            raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+        _, _, _, units, peers = _box_tables(box_size)
+        _POSITIONS[size] = build_positions(units, peers, size)
+    return _POSITIONS[size]
@@ -0,0 +1,288 @@
+"""
+Batch validation and solving of many 9x9 sudokus with NumPy.
+
+Puzzles are rows of an ``(N, 81)`` uint8 array (0 means empty). Validation
+counts one-hot encoded digits of all 27 units of all puzzles at once and
+constraint propagation places naked and hidden singles in the whole batch
+with array operations. Only puzzles left unsolved by the propagation go to
+the scalar search of `sudoku_solver.pipeline.solve_cells`.
+
+NumPy is an optional dependency, install it with
+``poetry install --extras numpy``.
+"""
+try:
+    import numpy as np
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        'sudoku_solver.vectorized requires NumPy, install it with '
+        '`poetry install --extras numpy`.'
+    ) from error
+
+from sudoku_solver.codec import PACKED_SIZE
+from sudoku_solver.exceptions import InvalidSudokuGrid
+from sudoku_solver.pipeline import solve_cells
+from sudoku_solver.solver import BITMASK
+from sudoku_solver.tables import BOX_OF, COLUMN_OF, ROW_OF, UNITS
+
+
+# Number of puzzles processed at once, bounds memory of temporary arrays
+CHUNK_SIZE = 10000
+
+_UNITS = np.array(UNITS, dtype=np.intp)
+_ROW_OF = np.array(ROW_OF, dtype=np.intp)
+_COLUMN_OF = np.array(COLUMN_OF, dtype=np.intp) + 9
+_BOX_OF = np.array(BOX_OF, dtype=np.intp) + 18
+_ALL_DIGITS = 0b111111111
+# Cell value -> bit of the digit (0 for empty cell)
+_DIGIT_BITS = np.array([0] + [1 << digit for digit in range(9)], np.uint16)
+# Candidates mask -> its only digit (0 when there are none or more digits)
+_SINGLE_DIGIT = np.zeros(_ALL_DIGITS + 1, dtype=np.uint8)
+_SINGLE_DIGIT[_DIGIT_BITS[1:]] = np.arange(1, 10)
+# Character -> cell value, disallowed characters become out of range values
+_CELL_OF_CHARACTER = np.full(256, 255, dtype=np.uint8)
+_CELL_OF_CHARACTER[ord('.')] = 0
+_CELL_OF_CHARACTER[np.frombuffer(b'0123456789', np.uint8)] = np.arange(10)
+
+
+def _check_shape(cells):
+    """Returns cells as uint8 array, checking it has 81 cells per puzzle."""
+    cells = np.asarray(cells, dtype=np.uint8)
+    if cells.ndim != 2 or cells.shape[1] != 81:
+        raise InvalidSudokuGrid('Wrong dimension of sudoku matrix!')
+    return cells
+
+
+def _chunks(count):
+    """Yields slices of `CHUNK_SIZE` puzzles."""
+    for start in range(0, count, CHUNK_SIZE):
+        yield slice(start, start + CHUNK_SIZE)
+
+
+def from_dataset(dataset, start=0, stop=None):
+    """
+    Converts puzzles of the dataset's records range to cells, reading the
+    memory mapped file directly (see `sudoku_solver.dataset.Dataset`).
+
+    Args:
+        dataset (Dataset): Opened dataset file.
+        start (int): Index of the first record. Defaults to 0.
+        stop (int): Index after the last record. Defaults to None (till the
+            end of the file).
+
+    Returns:
+        numpy.ndarray: ``(N, 81)`` uint8 array of cells. Disallowed
+            characters become value 255, so `validate` rejects the puzzle.
+    """
+    characters = np.frombuffer(dataset.buffer(start, stop), dtype=np.uint8)
+    if len(characters) % dataset.record_size:
+        # The last record without newline
+        characters = np.append(characters, np.uint8(ord('\n')))
+    records = characters.reshape(-1, dataset.record_size)
+    return _CELL_OF_CHARACTER[records[:, :81]]
+
+
+def pack(cells):
+    """
+    Packs puzzles 4 bits per cell, same as `sudoku_solver.codec.pack`.
+
+    Args:
+        cells (numpy.ndarray): ``(N, 81)`` array of cell values row by row
+            (0 means empty).
+
+    Raises:
+        InvalidSudokuGrid: Array is not ``(N, 81)`` or a value is out of
+            range.
+
+    Returns:
+        numpy.ndarray: ``(N, 41)`` uint8 array of packed puzzles.
+    """
+    cells = _check_shape(cells)
+    if (cells > 9).any():
+        raise InvalidSudokuGrid('Value is out of range!')
+    padded = np.zeros((len(cells), 2 * PACKED_SIZE), dtype=np.uint8)
+    padded[:, :81] = cells
+    return padded[:, 0::2] << 4 | padded[:, 1::2]
+
+
+def unpack(packed):
+    """
+    Unpacks puzzles packed by `pack` (or `sudoku_solver.codec.pack`).
+
+    Args:
+        packed (numpy.ndarray): ``(N, 41)`` array of packed puzzles, e.g.
+            ``np.frombuffer(data, np.uint8).reshape(-1, 41)``.
+
+    Raises:
+        InvalidSudokuGrid: Array is not ``(N, 41)``.
+
+    Returns:
+        numpy.ndarray: ``(N, 81)`` uint8 array of cells. Values out of range
+            are kept, so `validate` rejects such puzzles.
+    """
+    packed = np.asarray(packed, dtype=np.uint8)
+    if packed.ndim != 2 or packed.shape[1] != PACKED_SIZE:
+        raise InvalidSudokuGrid('Wrong length of packed sudoku!')
+    cells = np.empty((len(packed), 2 * PACKED_SIZE), dtype=np.uint8)
+    cells[:, 0::2] = packed >> 4
+    cells[:, 1::2] = packed & 0x0F
+    return cells[:, :81]
+
+
+def _validate(cells):
+    """Validates a chunk of puzzles, see `validate`."""
+    onehot = cells[:, :, None] == np.arange(1, 10, dtype=np.uint8)
+    counts = np.zeros((len(cells), 27, 9), dtype=np.uint8)
+    for position in range(9):
+        counts += onehot[:, _UNITS[:, position]]
+    return (counts <= 1).all(axis=(1, 2)) & (cells <= 9).all(axis=1)
+
+
+def validate(cells):
+    """
+    Checks whether puzzles break sudoku rules.
+
+    Args:
+        cells (numpy.ndarray): ``(N, 81)`` array of cell values row by row
+            (0 means empty), any array-like convertible to uint8 works.
+
+    Raises:
+        InvalidSudokuGrid: Array is not ``(N, 81)``.
+
+    Returns:
+        numpy.ndarray: ``(N,)`` bool array - whether every row, column and
+            box of the puzzle holds different digits and all values are in
+            range.
+    """
+    cells = _check_shape(cells)
+    valid = np.empty(len(cells), dtype=bool)
+    for chunk in _chunks(len(cells)):
+        valid[chunk] = _validate(cells[chunk])
+    return valid
+
+
+def candidates(cells):
+    """
+    Computes candidates of every empty cell of valid puzzles.
+
+    Args:
+        cells (numpy.ndarray): ``(N, 81)`` uint8 array of valid puzzles.
+
+    Returns:
+        numpy.ndarray: ``(N, 81)`` uint16 array of candidate masks (bit
+            ``d - 1`` stands for digit ``d``), 0 for filled cells.
+    """
+    placed = _DIGIT_BITS[cells]
+    used = np.bitwise_or.reduce(placed[:, _UNITS], axis=2)
+    blocked = used[:, _ROW_OF] | used[:, _COLUMN_OF] | used[:, _BOX_OF]
+    return np.where(cells == 0, ~blocked & _ALL_DIGITS, 0).astype(np.uint16)
+
+
+def _singles(cells):
+    """
+    Finds forced digits of a chunk of valid puzzles.
+
+    Returns:
+        tuple: ``(N, 81)`` array of digits to place (0 for none) and ``(N,)``
+            bool array of puzzles with an empty cell without candidates.
+    """
+    masks = candidates(cells)
+    dead = ((cells == 0) & (masks == 0)).any(axis=1)
+
+    # Naked singles - cells with a single candidate
+    singles = _SINGLE_DIGIT[masks]
+
+    # Hidden singles - digits with a single possible cell in a unit
+    onehot = (masks[:, :, None] & _DIGIT_BITS[1:]) != 0
+    counts = np.zeros((len(cells), 27, 9), dtype=np.uint8)
+    for position in range(9):
+        counts += onehot[:, _UNITS[:, position]]
+    hidden = counts == 1
+    for position in range(9):
+        unit_cells = _UNITS[:, position]
+        puzzle, unit, digit = np.nonzero(onehot[:, unit_cells] & hidden)
+        singles[puzzle, unit_cells[unit]] = digit + 1
+
+    singles[dead] = 0
+    return singles, dead
+
+
+def _propagate(cells):
+    """Propagates constraints in a chunk of valid puzzles in place."""
+    dead = np.zeros(len(cells), dtype=bool)
+    active = np.arange(len(cells))
+    while len(active):
+        current = cells[active]
+        singles, stuck = _singles(current)
+        dead[active[stuck]] = True
+        changed = singles.any(axis=1)
+        current = np.where(singles > 0, singles, current)
+        # Contradicting singles (e.g. one digit forced twice in a unit)
+        broken = changed & ~_validate(current)
+        dead[active[broken]] = True
+        keep = changed & ~broken
+        cells[active[keep]] = current[keep]
+        active = active[keep]
+    return dead
+
+
+def propagate(cells):
+    """
+    Places naked and hidden singles in all puzzles until none is left.
+
+    Args:
+        cells (numpy.ndarray): ``(N, 81)`` array of valid puzzles (see
+            `validate`).
+
+    Raises:
+        InvalidSudokuGrid: Array is not ``(N, 81)``.
+
+    Returns:
+        tuple: New ``(N, 81)`` uint8 array of propagated puzzles and ``(N,)``
+            bool array of puzzles found unsolvable by the propagation
+            (their cells are left partially propagated).
+    """
+    cells = _check_shape(cells).copy()
+    dead = np.zeros(len(cells), dtype=bool)
+    for chunk in _chunks(len(cells)):
+        dead[chunk] = _propagate(cells[chunk])
+    return cells, dead
+
+
+def solve(cells, engine=BITMASK, **options):
+    """
+    Validates and solves all puzzles: constraint propagation over the whole
+    batch first, then the scalar search for puzzles it did not solve.
+
+    Args:
+        cells (numpy.ndarray): ``(N, 81)`` array of cell values row by row
+            (0 means empty), any array-like convertible to uint8 works.
+        engine (str): Name of the engine from `ENGINES` used for the
+            remaining puzzles. Defaults to ``'bitmask'``.
+        options: Engine's options.
+
+    Raises:
+        InvalidSudokuGrid: Array is not ``(N, 81)``.
+        SearchAborted: The scalar search exceeded limits given in `options`.
+
+    Returns:
+        tuple: New ``(N, 81)`` uint8 array of solutions (the sent puzzle when
+            it can't be solved) and ``(N,)`` bool array whether the puzzle
+            can be solved.
+    """
+    cells = _check_shape(cells)
+    solutions = cells.copy()
+    solvable = validate(cells)
+    valid = np.flatnonzero(solvable)
+    propagated, dead = propagate(cells[valid])
+    solvable[valid[dead]] = False
+    alive = ~dead
+    solutions[valid[alive]] = propagated[alive]
+
+    for index in np.flatnonzero(solvable & (solutions == 0).any(axis=1)):
+        puzzle = bytearray(solutions[index])
+        if solve_cells(puzzle, engine, **options):
+            solutions[index] = np.frombuffer(puzzle, dtype=np.uint8)
+        else:
+            solvable[index] = False
+            solutions[index] = cells[index]
+    return solutions, solvable
@@ -4,13 +4,17 @@ from contextlib import contextmanager
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from fastapi_server.api.dependencies import get_db
+from fastapi_server.api.dependencies import get_async_db
 from fastapi_server.core.config import BASE_DIR
 from fastapi_server.db.base import Base
 from fastapi_server.main import app
 from fastapi_server.models import User
+from fastapi_server.services.auth_cache import auth_cache
+from fastapi_server.services.sudoku import solution_cache
+from fastapi_server.services.users_count import users_count
 from tests.test_data.users import USERS
 
 
@@ -23,6 +27,10 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine
 )
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{TEST_DB_PATH}")
+TestingAsyncSessionLocal = sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 
 @contextmanager
@@ -35,19 +43,22 @@ def test_db():
         db.close()
 
 
-def get_test_db():
-    """Database dependency for override"""
-    try:
-        db = TestingSessionLocal()
+async def get_test_async_db():
+    """Async database dependency for override"""
+    async with TestingAsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 @pytest.fixture
 def client():
-    """Client fixture with overrides database dependency"""
-    app.dependency_overrides[get_db] = get_test_db
+    """
+    Client fixture with overrides database dependency, empty solution cache,
+    cache of authenticated users and count of users
+    """
+    app.dependency_overrides[get_async_db] = get_test_async_db
+    solution_cache.clear()
+    auth_cache.clear()
+    users_count.invalidate()
     with TestClient(app) as client:
         yield client
 
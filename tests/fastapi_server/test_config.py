@@ -0,0 +1,31 @@
+import pytest
+from pydantic import ValidationError
+
+from fastapi_server.core.config import Settings
+
+
+@pytest.mark.parametrize('uri, async_uri, expected', [
+    ('sqlite:///app.db', None, 'sqlite+aiosqlite:///app.db'),
+    ('sqlite:////var/app.db', '', 'sqlite+aiosqlite:////var/app.db'),
+    (
+        'postgresql+psycopg2://user@host/app', None,
+        'postgresql+asyncpg://user@host/app'
+    ),
+    (
+        'sqlite:///app.db', 'sqlite+aiosqlite:///other.db',
+        'sqlite+aiosqlite:///other.db'
+    ),
+])
+def test_async_database_uri(monkeypatch, uri, async_uri, expected):
+    monkeypatch.delenv('SQL_ALCHEMY_ASYNC_DATABASE_URI', raising=False)
+    settings = Settings(
+        SQL_ALCHEMY_DATABASE_URI=uri,
+        SQL_ALCHEMY_ASYNC_DATABASE_URI=async_uri
+    )
+    assert settings.SQL_ALCHEMY_ASYNC_DATABASE_URI == expected
+
+
+def test_async_database_uri_unknown_dialect(monkeypatch):
+    monkeypatch.delenv('SQL_ALCHEMY_ASYNC_DATABASE_URI', raising=False)
+    with pytest.raises(ValidationError):
+        Settings(SQL_ALCHEMY_DATABASE_URI='oracle://user@host/app')
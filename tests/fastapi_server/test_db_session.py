@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import create_engine
+
+from fastapi_server.core.config import settings
+from fastapi_server.db.session import set_sqlite_pragmas, sqlite_pragmas
+
+
+def test_sqlite_pragmas(monkeypatch):
+    assert sqlite_pragmas() == {}
+    monkeypatch.setattr(settings, 'SQLITE_JOURNAL_MODE', 'WAL')
+    monkeypatch.setattr(settings, 'SQLITE_BUSY_TIMEOUT_MS', 1000)
+    assert sqlite_pragmas() == {'journal_mode': 'WAL', 'busy_timeout': 1000}
+
+
+@pytest.mark.parametrize('pragmas, expected', [
+    ({}, {'journal_mode': 'delete', 'synchronous': 2, 'busy_timeout': 5000}),
+    (
+        {'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'busy_timeout': 250},
+        {'journal_mode': 'wal', 'synchronous': 1, 'busy_timeout': 250}
+    ),
+])
+def test_set_sqlite_pragmas(tmp_path, pragmas, expected):
+    engine = create_engine(f'sqlite:///{tmp_path / "test.db"}')
+    set_sqlite_pragmas(engine, pragmas)
+    with engine.connect() as connection:
+        for name, value in expected.items():
+            assert connection.exec_driver_sql(
+                f'PRAGMA {name}'
+            ).scalar() == value
+    engine.dispose()
@@ -1,8 +1,13 @@
+import asyncio
+import threading
+
 import pytest  # noqa
 from fastapi import status
 from fastapi.testclient import TestClient
 
 from fastapi_server.core.config import settings
+from fastapi_server.services import password_pool as password_pool_module
+from fastapi_server.services.password_pool import PasswordPool
 from tests.test_data.users import (
     TOKEN_USER_0, TOKEN_USER_1, TOKEN_USER_2, USERS, WRONG_TOKEN,
     EXPIRED_TOKEN_0
@@ -82,3 +87,45 @@ def test_login_token_test(
         assert response_json['is_active'] is user_dict['is_active']
         assert response_json['is_superuser'] is user_dict['is_superuser']
         assert response_json['id'] == user_dict['id']
+
+
+def test_login_password_pool(users_data, client: TestClient, monkeypatch):
+    threads = []
+    verify_password = password_pool_module.verify_password
+
+    def verify(plain_password, hashed_password):
+        threads.append(threading.current_thread().name)
+        return verify_password(plain_password, hashed_password)
+
+    monkeypatch.setattr(password_pool_module, 'verify_password', verify)
+    response = client.post(
+        url=f'{settings.API_V1_STR}/login/access-token',
+        data={'username': 'adam.nowak@poczta.pl', 'password': 'password'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(threads) == 1
+    assert threads[0].startswith('password')
+
+
+def test_login_slot():
+    running = []
+    most_running = []
+
+    async def login(pool):
+        async with pool.login_slot():
+            running.append(1)
+            most_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+    async def logins():
+        pool = PasswordPool(workers=1, max_logins=2)
+        pool.start()
+        try:
+            await asyncio.gather(*(login(pool) for _ in range(5)))
+        finally:
+            pool.shutdown()
+
+    asyncio.run(logins())
+    assert len(most_running) == 5
+    assert max(most_running) == 2
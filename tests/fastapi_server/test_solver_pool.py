@@ -0,0 +1,84 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from fastapi_server.services.solver_pool import (
+    SolverPool, SolverPoolBusy, SolverPoolTimeout
+)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_timeout_terminates_workers():
+    pool = SolverPool(
+        workers=1, max_queue=10, timeout=0.5, max_tasks_per_worker=100,
+        start_method='fork'
+    )
+    pool.start()
+    try:
+        # Starts the worker process
+        assert run(pool.run(abs, -1)) == 1
+        processes = list(pool._executor._processes.values())
+        with pytest.raises(SolverPoolTimeout):
+            run(pool.run(time.sleep, 60))
+        for process in processes:
+            process.join(5)
+            assert not process.is_alive()
+        # The new executor works
+        assert run(pool.run(abs, -2)) == 2
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.parametrize('tasks, busy', [(3, False), (4, True)])
+def test_max_queue_counts_puzzles(tasks, busy):
+    pool = SolverPool(
+        workers=0, max_queue=3, timeout=1, max_tasks_per_worker=100
+    )
+    if busy:
+        with pytest.raises(SolverPoolBusy):
+            run(pool.run(abs, -1, tasks=tasks))
+    else:
+        assert run(pool.run(abs, -1, tasks=tasks)) == 1
+    assert pool.pending == 0
+
+
+def test_broken_again_is_busy():
+    pool = SolverPool(
+        workers=1, max_queue=10, timeout=5, max_tasks_per_worker=100,
+        start_method='fork'
+    )
+    pool.start()
+    try:
+        # The worker dies in the call and in its retry
+        with pytest.raises(SolverPoolBusy):
+            run(pool.run(os._exit, 1))
+        assert pool.pending == 0
+        assert run(pool.run(abs, -1)) == 1
+    finally:
+        pool.shutdown()
+
+
+def test_recycle_counts_tasks():
+    pool = SolverPool(
+        workers=1, max_queue=10, timeout=5, max_tasks_per_worker=4,
+        start_method='fork'
+    )
+    pool.start()
+    try:
+        executor = pool._executor
+        assert run(pool.run(abs, -1, tasks=3)) == 1
+        assert pool.submitted == 3
+        assert pool._executor is executor
+        assert run(pool.run(abs, -1, tasks=3)) == 1
+        assert pool.submitted == 6
+        assert run(pool.run(abs, -1)) == 1
+        # Replaced after 6 of 4 tasks per worker
+        assert pool._executor is not executor
+        assert pool.submitted == 1
+    finally:
+        pool.shutdown()
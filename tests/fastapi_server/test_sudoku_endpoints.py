@@ -1,8 +1,18 @@
+import asyncio
+
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from fastapi_server.api.api_v1.endpoints import sudoku as sudoku_endpoints
 from fastapi_server.core.config import settings
+from fastapi_server.services.sudoku import (
+    PACKED_ERROR, PACKED_SOLVABLE, PACKED_UNSOLVABLE
+)
+from fastapi_server.services.solver_pool import solver_pool
+from fastapi_server.services.sudoku import solution_cache
+from sudoku_solver.codec import pack
+from sudoku_solver.pipeline import parse_cells
 from tests.test_data.users import (
     TOKEN_USER_0, TOKEN_USER_1, TOKEN_USER_2, EXPIRED_TOKEN_0, WRONG_TOKEN,
 )
@@ -149,7 +159,8 @@ from tests.test_data.users import (
             'sudoku': (
                 '666....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3..2..'
                 '7...74..68...5..8...'
-            )
+            ),
+            'error': 'Digit 6 repeats in the same row: r1c1 and r1c2'
         }
 
     )
@@ -168,3 +179,551 @@ def test_solve_sudoku(
 
     assert response.status_code == http_status
     assert response.json() == resturn_value
+
+
+@pytest.mark.parametrize('engine, http_status', [
+    ('bitmask', status.HTTP_200_OK),
+    ('dlx', status.HTTP_200_OK),
+    ('unknown', status.HTTP_422_UNPROCESSABLE_ENTITY),
+])
+def test_solve_sudoku_engine(
+    users_data,
+    client: TestClient,
+    engine, http_status
+):
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku',
+        headers={'Authorization': f'bearer {TOKEN_USER_0}'},
+        json={
+            'sudoku': (
+                '..6....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3..2.'
+                '.7...74..68...5..8...'
+            ),
+            'engine': engine
+        },
+        allow_redirects=True
+    )
+
+    assert response.status_code == http_status
+    if http_status == status.HTTP_200_OK:
+        assert response.json() == {
+            'solvable': True,
+            'sudoku': (
+                '396274518721859346584361927973185462648932751152647839839526'
+                '174217493685465718293'
+            )
+        }
+
+
+@pytest.mark.parametrize('engine', ['bitmask', 'dlx'])
+@pytest.mark.parametrize('sudoku_str, limit, http_status, result', [
+    # Unique solution
+    (
+        '..6....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3..2..7..'
+        '.74..68...5..8...',
+        2, status.HTTP_200_OK, {'solvable': True, 'solutions': 1}
+    ),
+    # Many solutions
+    ('.' * 81, 5, status.HTTP_200_OK, {'solvable': True, 'solutions': 5}),
+    # Valid grid without solution
+    (
+        '12345678.........9' + '.' * 63,
+        2, status.HTTP_200_OK, {'solvable': False, 'solutions': 0}
+    ),
+    # Invalid grid
+    (
+        '11' + '.' * 79,
+        2, status.HTTP_200_OK, {
+            'solvable': False,
+            'solutions': 0,
+            'error': 'Digit 1 repeats in the same row: r1c1 and r1c2'
+        }
+    ),
+    # Limit out of range
+    ('.' * 81, 0, status.HTTP_422_UNPROCESSABLE_ENTITY, None),
+    (
+        '.' * 81,
+        settings.SUDOKU_MAX_SOLUTIONS_LIMIT + 1,
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        None
+    ),
+])
+def test_count_sudoku_solutions(
+    users_data,
+    client: TestClient,
+    engine, sudoku_str, limit, http_status, result
+):
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku',
+        headers={'Authorization': f'bearer {TOKEN_USER_0}'},
+        json={
+            'sudoku': sudoku_str,
+            'engine': engine,
+            'solutions_limit': limit
+        },
+        allow_redirects=True
+    )
+
+    assert response.status_code == http_status
+    if http_status == status.HTTP_200_OK:
+        response_json = response.json()
+        assert response_json['solvable'] is result['solvable']
+        assert response_json['solutions'] == result['solutions']
+        assert response_json['nodes'] >= 0
+        assert response_json.get('error') == result.get('error')
+        if result['solvable']:
+            assert '.' not in response_json['sudoku']
+
+
+@pytest.mark.parametrize('token, batch, http_status, results', [
+    # Results in the input order with per-item errors
+    (
+        TOKEN_USER_0,
+        {
+            'sudokus': [
+                '315......4.26.5....7.4..1.9...351.2...6.9.4..1572...3......'
+                '387..8.9...6...41.72..',
+                'too_short_string',
+                '666....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3..2..'
+                '7...74..68...5..8...',
+                'not_allowed47..1.....9.5..6.21.3748.8...9.2..3.7...6....624..'
+                '7.75........3....82.',
+                '..6....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3..2..'
+                '7...74..68...5..8...',
+            ],
+        },
+        status.HTTP_200_OK,
+        [
+            {
+                'solvable': True,
+                'sudoku': (
+                    '315879642492615387678432159849351726236798415157246938'
+                    '921563874783924561564187293'
+                )
+            },
+            {
+                'solvable': False,
+                'sudoku': 'too_short_string',
+                'error': 'ensure this value has 81 characters'
+            },
+            {
+                'solvable': False,
+                'sudoku': (
+                    '666....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3.'
+                    '.2..7...74..68...5..8...'
+                ),
+                'error': 'Digit 6 repeats in the same row: r1c1 and r1c2'
+            },
+            {
+                'solvable': False,
+                'sudoku': (
+                    'not_allowed47..1.....9.5..6.21.3748.8...9.2..3.7...6....6'
+                    '24..7.75........3....82.'
+                ),
+                'error': 'string does not match regex "^[\\d\\.]+$"'
+            },
+            {
+                'solvable': True,
+                'sudoku': (
+                    '396274518721859346584361927973185462648932751152647839'
+                    '839526174217493685465718293'
+                )
+            },
+        ]
+    ),
+    # Options are applied to every item
+    (
+        TOKEN_USER_2,
+        {
+            'sudokus': ['.' * 81, '12345678.........9' + '.' * 63],
+            'engine': 'dlx',
+            'solutions_limit': 2
+        },
+        status.HTTP_200_OK,
+        [
+            {'solvable': True, 'solutions': 2},
+            {'solvable': False, 'solutions': 0},
+        ]
+    ),
+    # Empty batch
+    (
+        TOKEN_USER_0,
+        {'sudokus': []},
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        None
+    ),
+    # Too big batch
+    (
+        TOKEN_USER_0,
+        {'sudokus': ['.' * 81] * (settings.SUDOKU_BATCH_MAX_SIZE + 1)},
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        None
+    ),
+    # Inactive user
+    (TOKEN_USER_1, {'sudokus': ['.' * 81]}, status.HTTP_403_FORBIDDEN, None),
+    # Expired token
+    (
+        EXPIRED_TOKEN_0,
+        {'sudokus': ['.' * 81]},
+        status.HTTP_401_UNAUTHORIZED,
+        None
+    ),
+])
+def test_solve_sudoku_batch(
+    users_data,
+    client: TestClient,
+    token, batch, http_status, results
+):
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku/batch',
+        headers={'Authorization': f'bearer {token}'},
+        json=batch
+    )
+
+    assert response.status_code == http_status
+    if http_status == status.HTTP_200_OK:
+        response_results = response.json()['results']
+        assert len(response_results) == len(results)
+        for response_result, result in zip(response_results, results):
+            for key, value in result.items():
+                assert response_result[key] == value
+
+
+@pytest.mark.parametrize('url, data', [
+    (f'{settings.API_V1_STR}/sudoku', {'sudoku': '.' * 81}),
+    (f'{settings.API_V1_STR}/sudoku/batch', {'sudokus': ['.' * 81] * 3}),
+])
+@pytest.mark.parametrize('pool_attribute, value, detail', [
+    ('max_queue', 0, 'Solver is busy, try again later'),
+    ('timeout', 0, 'Solving took too long'),
+])
+def test_solve_sudoku_solver_unavailable(
+    users_data,
+    client: TestClient,
+    monkeypatch,
+    url, data, pool_attribute, value, detail
+):
+    monkeypatch.setattr(solver_pool, pool_attribute, value)
+    response = client.post(
+        url=url,
+        headers={'Authorization': f'bearer {TOKEN_USER_0}'},
+        json=data,
+        allow_redirects=True
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json() == {'detail': detail}
+
+
+def test_solve_sudoku_cached(users_data, client: TestClient, monkeypatch):
+    sudoku_str = (
+        '..6....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3..2..7..'
+        '.74..68...5..8...'
+    )
+    solution = (
+        '396274518721859346584361927973185462648932751152647839839526'
+        '174217493685465718293'
+    )
+    url = f'{settings.API_V1_STR}/sudoku'
+    headers = {'Authorization': f'bearer {TOKEN_USER_0}'}
+
+    response = client.post(
+        url=url, headers=headers, json={'sudoku': sudoku_str},
+        allow_redirects=True
+    )
+    assert response.json() == {'solvable': True, 'sudoku': solution}
+    assert (solution_cache.hits, solution_cache.misses) == (0, 1)
+
+    # Cached results do not use the solver pool, zeros equal dots
+    monkeypatch.setattr(solver_pool, 'max_queue', 0)
+    response = client.post(
+        url=url, headers=headers,
+        json={'sudoku': sudoku_str.replace('.', '0')},
+        allow_redirects=True
+    )
+    assert response.json() == {'solvable': True, 'sudoku': solution}
+    response = client.post(
+        url=f'{url}/batch', headers=headers,
+        json={'sudokus': [sudoku_str, 'too_short_string']}
+    )
+    assert response.json()['results'][0] == {
+        'solvable': True, 'sudoku': solution
+    }
+    assert (solution_cache.hits, solution_cache.misses) == (2, 1)
+
+    # Options are part of the key
+    response = client.post(
+        url=url, headers=headers,
+        json={'sudoku': sudoku_str, 'solutions_limit': 2},
+        allow_redirects=True
+    )
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+def test_solve_sudoku_equivalent_cached(
+    users_data,
+    client: TestClient,
+    monkeypatch
+):
+    sudoku_str = (
+        '..6....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3..2..7..'
+        '.74..68...5..8...'
+    )
+    solution = (
+        '396274518721859346584361927973185462648932751152647839839526'
+        '174217493685465718293'
+    )
+    # Digits relabeled (d -> d % 9 + 1) and the grid transposed
+    relabel = str.maketrans('123456789', '234567891')
+    rows = [solution[row * 9:row * 9 + 9] for row in range(9)]
+    transposed = ''.join(''.join(column) for column in zip(*rows))
+    givens = [sudoku_str[row * 9:row * 9 + 9] for row in range(9)]
+    equivalent = ''.join(''.join(column) for column in zip(*givens))
+    url = f'{settings.API_V1_STR}/sudoku'
+    headers = {'Authorization': f'bearer {TOKEN_USER_0}'}
+
+    client.post(
+        url=url, headers=headers, json={'sudoku': sudoku_str},
+        allow_redirects=True
+    )
+    monkeypatch.setattr(solver_pool, 'max_queue', 0)
+    response = client.post(
+        url=url, headers=headers,
+        json={'sudoku': equivalent.translate(relabel)},
+        allow_redirects=True
+    )
+    assert response.json() == {
+        'solvable': True, 'sudoku': transposed.translate(relabel)
+    }
+    response = client.post(
+        url=f'{url}/batch', headers=headers,
+        json={'sudokus': [equivalent, sudoku_str.translate(relabel)]}
+    )
+    assert [result['sudoku'] for result in response.json()['results']] == [
+        transposed, solution.translate(relabel)
+    ]
+    assert (solution_cache.hits, solution_cache.misses) == (3, 1)
+
+
+@pytest.mark.parametrize('path, data', [
+    ('', {'sudoku': '.' * 81}),
+    ('/batch', {'sudokus': ['.' * 81, 'too_short_string']}),
+])
+def test_solve_sudoku_cache_off_event_loop(
+    users_data,
+    client: TestClient,
+    monkeypatch,
+    path, data
+):
+    # Checks of sudokus and the cache (SQLite tier) must not block the loop
+    loops = []
+
+    def without_loop(func):
+        def wrapper(*args):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return func(*args)
+        return wrapper
+
+    for name in ('prepare_sudoku_strs', 'complete_sudoku_strs'):
+        func = getattr(sudoku_endpoints, name)
+        monkeypatch.setattr(sudoku_endpoints, name, without_loop(func))
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku{path}',
+        headers={'Authorization': f'bearer {TOKEN_USER_0}'},
+        json=data,
+        allow_redirects=True
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert loops == [None, None]
+
+
+@pytest.mark.parametrize('limit_setting, value, detail', [
+    (
+        'SOLVER_MAX_NODES', 5,
+        'Search exceeded the budget of 5 nodes'
+    ),
+    ('SOLVER_TIME_LIMIT_SECONDS', 0, 'Search exceeded the time limit'),
+])
+def test_solve_sudoku_search_aborted(
+    users_data,
+    client: TestClient,
+    monkeypatch,
+    limit_setting, value, detail
+):
+    # Needs more than `CHECK_INTERVAL` nodes to reach the deadline check
+    sudoku_str = (
+        '........8..3...4...9..2..6.....79.......612...6.5.2.7...8...5...1'
+        '.....2.4.5.....3'
+    )
+    monkeypatch.setattr(settings, limit_setting, value)
+    headers = {'Authorization': f'bearer {TOKEN_USER_0}'}
+
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku',
+        headers=headers,
+        json={'sudoku': sudoku_str},
+        allow_redirects=True
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json() == {'detail': f'Sudoku is too hard: {detail}'}
+
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku/batch',
+        headers=headers,
+        json={'sudokus': [sudoku_str]}
+    )
+    assert response.json()['results'] == [
+        {'sudoku': sudoku_str, 'solvable': False, 'error': detail}
+    ]
+    # Aborted searches are not cached
+    assert len(solution_cache) == 0
+
+
+@pytest.mark.parametrize('engine', ['bitmask', 'dlx'])
+def test_solve_sudoku_stats(users_data, client: TestClient, engine):
+    sudoku_str = (
+        '..6....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3..2..7..'
+        '.74..68...5..8...'
+    )
+    solution = (
+        '396274518721859346584361927973185462648932751152647839839526'
+        '174217493685465718293'
+    )
+    url = f'{settings.API_V1_STR}/sudoku'
+    headers = {'Authorization': f'bearer {TOKEN_USER_0}'}
+
+    response = client.post(
+        url=url, headers=headers, params={'stats': True},
+        json={'sudoku': sudoku_str, 'engine': engine},
+        allow_redirects=True
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response_json = response.json()
+    assert response_json['sudoku'] == solution
+    stats = response_json['stats']
+    assert set(stats) == {
+        'nodes', 'guesses', 'forced', 'backtracks', 'max_depth', 'solutions',
+        'time'
+    }
+    assert stats['solutions'] == 1
+    assert stats['nodes'] >= 1
+    assert stats['time'] >= 0
+    # Statistics are not cached, results without them do not include them
+    assert len(solution_cache) == 0
+    response = client.post(
+        url=url, headers=headers,
+        json={'sudoku': sudoku_str, 'engine': engine},
+        allow_redirects=True
+    )
+    assert 'stats' not in response.json()
+
+
+def packed(sudoku_str):
+    return pack(parse_cells(sudoku_str))
+
+
+@pytest.mark.parametrize('engine', ['bitmask', 'dlx'])
+def test_solve_sudoku_batch_packed(users_data, client: TestClient, engine):
+    sudoku_str = (
+        '..6....1.721.59.4....3..9..9...8.46.6.8..27..1526.7.39.3..2..7..'
+        '.74..68...5..8...'
+    )
+    solution = (
+        '396274518721859346584361927973185462648932751152647839839526'
+        '174217493685465718293'
+    )
+    conflict = '11' + '.' * 79
+    unsolvable = '.' * 9 + '1' + '.' * 7 + '234567890' + '.' * 55
+    out_of_range = b'\xff' * 41
+    data = (
+        packed(sudoku_str) + packed(conflict) + out_of_range +
+        packed(unsolvable)
+    )
+
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku/batch/packed',
+        params={'engine': engine},
+        headers={
+            'Authorization': f'bearer {TOKEN_USER_0}',
+            'Content-Type': 'application/octet-stream',
+        },
+        data=data
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'] == 'application/octet-stream'
+    assert response.content == (
+        bytes([PACKED_SOLVABLE]) + packed(solution) +
+        bytes([PACKED_ERROR]) + packed(conflict) +
+        bytes([PACKED_ERROR]) + out_of_range +
+        bytes([PACKED_UNSOLVABLE]) + packed(unsolvable)
+    )
+
+
+@pytest.mark.parametrize('data, content_type, http_status', [
+    (b'', 'application/octet-stream', status.HTTP_422_UNPROCESSABLE_ENTITY),
+    (
+        b'\x00' * 40, 'application/octet-stream',
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    ),
+    (
+        b'\x00' * 41 * (settings.SUDOKU_BATCH_MAX_SIZE + 1),
+        'application/octet-stream',
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    ),
+    (
+        (b'\x00' * 41 for _ in range(settings.SUDOKU_BATCH_MAX_SIZE + 1)),
+        'application/octet-stream',
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    ),
+    (b'\x00' * 41, 'application/json', status.HTTP_415_UNSUPPORTED_MEDIA_TYPE),
+])
+def test_solve_sudoku_batch_packed_wrong_body(
+    users_data,
+    client: TestClient,
+    data, content_type, http_status
+):
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku/batch/packed',
+        headers={
+            'Authorization': f'bearer {TOKEN_USER_0}',
+            'Content-Type': content_type,
+        },
+        data=data
+    )
+
+    assert response.status_code == http_status
+
+
+@pytest.mark.parametrize('content_type', [
+    'application/octet-stream; charset=binary',
+    'Application/Octet-Stream',
+])
+def test_solve_sudoku_batch_packed_content_type_parameters(
+    users_data, client: TestClient, content_type
+):
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku/batch/packed',
+        headers={
+            'Authorization': f'bearer {TOKEN_USER_0}',
+            'Content-Type': content_type,
+        },
+        data=b'\x00' * 41
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.content) == 42
+
+
+def test_solve_sudoku_batch_packed_unauthorized(client: TestClient):
+    response = client.post(
+        url=f'{settings.API_V1_STR}/sudoku/batch/packed',
+        headers={'Content-Type': 'application/octet-stream'},
+        data=b'\x00' * 41
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -4,6 +4,7 @@ from fastapi.testclient import TestClient
 
 from fastapi_server import crud
 from fastapi_server.core.config import settings
+from fastapi_server.services.auth_cache import auth_cache
 from tests.conftest import test_db
 from tests.test_data.users import (
     EXPIRED_TOKEN_0, TOKEN_USER_0, TOKEN_USER_1, TOKEN_USER_2, WRONG_TOKEN,
@@ -38,6 +39,52 @@ def test_get_users(
         assert len(response_json) == data_count
 
 
+@pytest.mark.parametrize('after_id, limit, ids, next_after_id', [
+    (None, 2, [1, 2], '2'),
+    (2, 2, [3], None),
+    (0, 3, [1, 2, 3], '3'),
+    (3, 2, [], None),
+])
+def test_get_users_keyset(
+    users_data,
+    client: TestClient,
+    after_id, limit, ids, next_after_id
+):
+    response = client.get(
+        url=f'{settings.API_V1_STR}/users',
+        params={'after_id': after_id, 'limit': limit},
+        headers={'Authorization': f'bearer {TOKEN_USER_0}'}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    response_json = response.json()
+    assert [user['id'] for user in response_json] == ids
+    assert all('hashed_password' not in user for user in response_json)
+    assert response.headers.get('X-Next-After-Id') == next_after_id
+    assert 'X-Total-Count' not in response.headers
+
+
+def test_get_users_count(users_data, client: TestClient):
+    url = f'{settings.API_V1_STR}/users'
+    headers = {'Authorization': f'bearer {TOKEN_USER_2}'}
+    params = {'limit': 1, 'with_count': True}
+
+    response = client.get(url, params=params, headers=headers)
+    assert response.headers['X-Total-Count'] == str(len(USERS))
+
+    # Count is cached until users are created or removed
+    with test_db() as db:
+        db.delete(crud.user.get(db, 1))
+        db.commit()
+    response = client.get(url, params=params, headers=headers)
+    assert response.headers['X-Total-Count'] == str(len(USERS))
+
+    response = client.delete(url=f'{url}/2', headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    response = client.get(url, params=params, headers=headers)
+    assert response.headers['X-Total-Count'] == str(len(USERS) - 2)
+
+
 @pytest.mark.parametrize('token, status_code, id, user_data', [
     (TOKEN_USER_0, status.HTTP_200_OK, 1, USERS[0]),
     (TOKEN_USER_0, status.HTTP_200_OK, 2, USERS[1]),
@@ -298,3 +345,55 @@ def test_remove_user(
 
     else:
         assert response.json()['detail'] == detail
+
+
+def test_authenticated_user_cached(
+    users_data,
+    client: TestClient,
+    monkeypatch
+):
+    url = f'{settings.API_V1_STR}/users/'
+    headers = {'Authorization': f'bearer {TOKEN_USER_0}'}
+
+    assert client.get(url, headers=headers).status_code == status.HTTP_200_OK
+    assert (auth_cache.hits, auth_cache.misses) == (0, 1)
+
+    # Cached token skips the lookup of its user
+    async def get_user(db, id):
+        raise AssertionError('User should be cached')
+    monkeypatch.setattr(crud.user, 'get_async', get_user)
+    assert client.get(url, headers=headers).status_code == status.HTTP_200_OK
+    assert (auth_cache.hits, auth_cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize('method, json, http_status, detail', [
+    (
+        'put',
+        {'email': USERS[0]['email'], 'is_active': False},
+        status.HTTP_403_FORBIDDEN,
+        'User is not active'
+    ),
+    ('delete', None, status.HTTP_404_NOT_FOUND, 'User from token not found'),
+])
+def test_authenticated_user_cache_invalidated(
+    users_data,
+    client: TestClient,
+    method, json, http_status, detail
+):
+    url = f'{settings.API_V1_STR}/users/'
+    headers = {'Authorization': f'bearer {TOKEN_USER_0}'}
+    assert client.get(url, headers=headers).status_code == status.HTTP_200_OK
+    assert len(auth_cache) == 1
+
+    response = client.request(
+        method,
+        url=f'{settings.API_V1_STR}/users/{USERS[0]["id"]}',
+        headers={'Authorization': f'bearer {TOKEN_USER_2}'},
+        json=json
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # Changed user is loaded again
+    response = client.get(url, headers=headers)
+    assert response.status_code == http_status
+    assert response.json()['detail'] == detail
@@ -0,0 +1,288 @@
+import inspect
+import sys
+import pytest
+from copy import deepcopy
+
+from sudoku_solver.bitmask import (
+    BitmaskSolver, ROW_MAJOR, MINIMUM_REMAINING_VALUES, grid_masks
+)
+from sudoku_solver.solver import (
+    sudoku_str_to_grid, InvalidSudokuGrid, SearchAborted
+)
+from sudoku_solver.tables import PEERS
+from tests.test_data.sudoku_grids import (
+    ones, ones_3x9, ones_9x5, zeros, grid1, grid2, grid2_result,
+    difficult_case_grid, difficult_case_grid_result, unsolvable_grid,
+    adversarial_grid, adversarial_grid_result
+)
+
+
+@pytest.mark.parametrize('grid, cell, candidates', [
+    (zeros, 0, 0b111111111),
+    (grid2, 9, 0b000001111),
+    (unsolvable_grid, 8, 0b000000000),
+])
+def test_candidates(grid, cell, candidates):
+    assert BitmaskSolver(grid).candidates(cell) == candidates
+
+
+def test_assign_and_undo_restores_masks():
+    solver = BitmaskSolver(deepcopy(grid2))
+    rows, columns, boxes = solver.rows[:], solver.columns[:], solver.boxes[:]
+
+    solver.assign(1, 1)
+    solver.assign(2, 2)
+    assert solver.candidates(3) & 0b11 == 0
+
+    solver.undo(0)
+    assert solver.cells[1] == solver.cells[2] == 0
+    assert (solver.rows, solver.columns, solver.boxes) == (
+        rows, columns, boxes
+    )
+
+
+def test_counts_and_degrees_are_maintained_incrementally():
+    solver = BitmaskSolver(deepcopy(difficult_case_grid))
+    solver.assign(0, 6)
+    solver.assign(1, 2)
+    solver.assign(79, 1)
+    solver.undo(2)
+
+    for cell in range(81):
+        if solver.cells[cell]:
+            continue
+        assert solver.counts[cell] == bin(solver.candidates(cell)).count('1')
+        assert solver.degrees[cell] == sum(
+            1 for peer in PEERS[cell] if not solver.cells[peer]
+        )
+
+
+@pytest.mark.parametrize('cell_order, cell', [
+    (ROW_MAJOR, 1),
+    (MINIMUM_REMAINING_VALUES, 6),
+])
+def test_select_cell(cell_order, cell):
+    solver = BitmaskSolver(deepcopy(grid2), cell_order=cell_order)
+    assert solver.select_cell() == cell
+
+
+def test_select_position():
+    solver = BitmaskSolver(deepcopy(grid2), cell_order=ROW_MAJOR)
+    cell, position = solver.select_position(0)
+    assert (cell, position) == (1, 0)
+    # The scan resumes after the given position
+    assert solver.select_position(position + 1) == (
+        solver.empties[1], 1
+    )
+    empties = len(solver.empties)
+    assert solver.select_position(empties) == (None, empties)
+
+
+def test_unknown_cell_order():
+    with pytest.raises(ValueError):
+        BitmaskSolver(deepcopy(grid2), cell_order='random')
+
+
+@pytest.mark.parametrize('grid, consistent', [
+    (ones, False),
+    (zeros, True),
+    (grid2, True),
+])
+def test_consistent(grid, consistent):
+    assert BitmaskSolver(grid).consistent is consistent
+
+
+@pytest.mark.parametrize('sudoku_grid, result_grid, is_solved', [
+    (difficult_case_grid, difficult_case_grid_result, True),
+    (adversarial_grid, adversarial_grid_result, True),
+    (unsolvable_grid, unsolvable_grid, False),
+    (ones, ones, False),
+])
+@pytest.mark.parametrize('cell_order', [ROW_MAJOR, MINIMUM_REMAINING_VALUES])
+def test_solve(sudoku_grid, result_grid, is_solved, cell_order):
+    grid = deepcopy(sudoku_grid)
+    assert BitmaskSolver(grid, cell_order).solve() is is_solved
+    assert grid == result_grid
+
+
+def test_row_major_finds_lexicographically_smallest_solution():
+    # grid2 has many solutions
+    grid = deepcopy(grid2)
+    assert BitmaskSolver(grid, ROW_MAJOR).solve()
+    assert grid == grid2_result
+
+
+@pytest.mark.parametrize('grid, limit, count', [
+    (difficult_case_grid, None, 1),
+    (difficult_case_grid, 2, 1),
+    (grid1, 2, 2),
+    (grid2, 10, 10),
+    (zeros, 1, 1),
+    (unsolvable_grid, 2, 0),
+    (ones, 2, 0),
+])
+@pytest.mark.parametrize('cell_order', [ROW_MAJOR, MINIMUM_REMAINING_VALUES])
+def test_count_solutions(grid, limit, count, cell_order):
+    puzzle = deepcopy(grid)
+    solver = BitmaskSolver(puzzle, cell_order)
+    assert solver.count_solutions(limit) == count
+    assert (solver.solution is not None) is bool(count)
+    # Search state is restored and grid is untouched
+    assert solver.trail == []
+    assert solver.cells == [value for row in grid for value in row]
+    assert puzzle == grid
+
+
+def test_count_solutions_resumes_search():
+    first = BitmaskSolver(deepcopy(grid2))
+    first.count_solutions(1)
+    ten = BitmaskSolver(deepcopy(grid2))
+    ten.count_solutions(10)
+    # The first solution is the same one and later solutions cost less than
+    # restarting the search for each of them
+    assert first.solution == ten.solution
+    assert ten.nodes < 10 * first.nodes
+
+
+@pytest.mark.parametrize('grid, unique', [
+    (difficult_case_grid, True),
+    (adversarial_grid, True),
+    (grid2, False),
+    (unsolvable_grid, False),
+])
+def test_is_unique(grid, unique):
+    assert BitmaskSolver(deepcopy(grid)).is_unique() is unique
+
+
+def test_easy_grid_is_solved_by_propagation_only():
+    solver = BitmaskSolver(sudoku_str_to_grid(
+        '315......4.26.5....7.4..1.9...351.2...6.9.4..1572...3......387..8.9..'
+        '.6...41.72..'
+    ))
+    assert solver.solve()
+    assert solver.nodes == 1
+
+
+def test_mrv_visits_fewer_nodes_on_adversarial_grid():
+    row_major = BitmaskSolver(deepcopy(adversarial_grid), ROW_MAJOR)
+    mrv = BitmaskSolver(deepcopy(adversarial_grid), MINIMUM_REMAINING_VALUES)
+    assert row_major.solve() and mrv.solve()
+    assert mrv.nodes < row_major.nodes
+
+
+def large_grid(box_size, step=3):
+    """Solved board with given box size with every `step`-th cell cleared"""
+    size = box_size * box_size
+    return [
+        [
+            0 if (row * size + column) % step == 0 else
+            (box_size * (row % box_size) + row // box_size + column) % size + 1
+            for column in range(size)
+        ]
+        for row in range(size)
+    ]
+
+
+def is_solution(grid, puzzle):
+    size = len(grid)
+    box_size = int(size ** 0.5)
+    digits = set(range(1, size + 1))
+    boxes = [
+        [
+            grid[row + x][column + y]
+            for x in range(box_size) for y in range(box_size)
+        ]
+        for row in range(0, size, box_size)
+        for column in range(0, size, box_size)
+    ]
+    return (
+        all(set(row) == digits for row in grid) and
+        all(set(column) == digits for column in zip(*grid)) and
+        all(set(box) == digits for box in boxes) and
+        all(
+            puzzle[row][column] in (0, grid[row][column])
+            for row in range(size) for column in range(size)
+        )
+    )
+
+
+@pytest.mark.parametrize('puzzle', [
+    large_grid(4),
+    large_grid(5),
+    [[0] * 16 for _ in range(16)],
+])
+@pytest.mark.parametrize('cell_order', [ROW_MAJOR, MINIMUM_REMAINING_VALUES])
+def test_solve_large_boards(puzzle, cell_order):
+    grid = deepcopy(puzzle)
+    assert BitmaskSolver(grid, cell_order).solve()
+    assert is_solution(grid, puzzle)
+
+
+@pytest.mark.parametrize('size, cell_order', [
+    (9, ROW_MAJOR),
+    (16, MINIMUM_REMAINING_VALUES),
+    (25, MINIMUM_REMAINING_VALUES),
+])
+def test_solve_empty_boards_default_cell_order(size, cell_order):
+    grid = [[0] * size for _ in range(size)]
+    solver = BitmaskSolver(grid, time_limit=20)
+    assert solver.cell_order == cell_order
+    assert solver.solve()
+    assert is_solution(grid, [[0] * size for _ in range(size)])
+
+
+def test_search_does_not_recurse():
+    grid = [[0] * 25 for _ in range(25)]
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + 50)
+    try:
+        assert BitmaskSolver(grid, MINIMUM_REMAINING_VALUES).solve()
+    finally:
+        sys.setrecursionlimit(limit)
+    assert is_solution(grid, [[0] * 25 for _ in range(25)])
+
+
+@pytest.mark.parametrize('options', [
+    {'max_nodes': 10},
+    {'time_limit': 0},
+])
+@pytest.mark.parametrize('method', ['solve', 'count_solutions', 'is_unique'])
+def test_search_aborted(options, method):
+    grid = deepcopy(difficult_case_grid)
+    solver = BitmaskSolver(grid, **options)
+    with pytest.raises(SearchAborted):
+        getattr(solver, method)()
+    assert grid == difficult_case_grid
+    assert solver.cells == [value for row in grid for value in row]
+    assert not solver.trail
+
+
+def test_node_budget_is_enough():
+    solver = BitmaskSolver(deepcopy(difficult_case_grid))
+    assert solver.solve()
+    grid = deepcopy(difficult_case_grid)
+    assert BitmaskSolver(grid, max_nodes=solver.nodes).solve()
+    assert grid == difficult_case_grid_result
+
+
+def test_grid_masks_seed_solver():
+    *masks, conflict = grid_masks(difficult_case_grid)
+    assert conflict is None
+    solver = BitmaskSolver(difficult_case_grid)
+    assert masks == [solver.rows, solver.columns, solver.boxes]
+
+    grid = deepcopy(difficult_case_grid)
+    seeded = BitmaskSolver(grid, masks=masks)
+    assert seeded.counts == solver.counts
+    assert seeded.solve()
+    assert grid == difficult_case_grid_result
+    # Solver works on copies of the masks
+    assert masks == list(grid_masks(difficult_case_grid)[:3])
+
+
+@pytest.mark.parametrize('grid', [
+    ones_3x9, ones_9x5, [[1] * 8] * 8, [], bytearray(80), bytearray(9)
+])
+def test_wrong_dimension(grid):
+    with pytest.raises(InvalidSudokuGrid):
+        BitmaskSolver(grid)
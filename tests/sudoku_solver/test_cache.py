@@ -0,0 +1,97 @@
+import sqlite3
+
+import pytest
+
+from sudoku_solver.cache import SolutionCache, normalize_sudoku_str
+from sudoku_solver.solver import InvalidSudokuString
+
+
+class FakeClock:
+    """Clock moved forward manually"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize('sudoku_str, normalized', [
+    ('.' * 81, '.' * 81),
+    ('0' * 81, '.' * 81),
+    ('10.' * 27, '1..' * 27),
+])
+def test_normalize_sudoku_str(sudoku_str, normalized):
+    assert normalize_sudoku_str(sudoku_str) == normalized
+
+
+def test_normalize_sudoku_str_invalid():
+    with pytest.raises(InvalidSudokuString):
+        normalize_sudoku_str('too_short')
+
+
+def test_wrong_size():
+    with pytest.raises(ValueError):
+        SolutionCache(maxsize=0)
+
+
+def test_hits_and_misses():
+    cache = SolutionCache()
+    assert cache.get('a') is None
+    assert cache.get('a', 'default') == 'default'
+    cache.set('a', {'solvable': True})
+    assert cache.get('a') == {'solvable': True}
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert 'a' in cache and 'b' not in cache
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_lru_eviction():
+    cache = SolutionCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    # `a` becomes the most recently used, so `b` is evicted
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_ttl():
+    clock = FakeClock()
+    cache = SolutionCache(ttl=10, clock=clock)
+    cache.set('a', 1)
+    clock.now += 9
+    assert cache.get('a') == 1
+    clock.now += 1
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_persistent_tier(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    clock = FakeClock()
+    cache = SolutionCache(maxsize=1, ttl=10, path=path, clock=clock)
+    cache.set('a', {'sudoku': '1' * 81, 'solvable': True})
+    cache.set('b', {'sudoku': '2' * 81, 'solvable': True})
+    # Evicted from memory, found in the database
+    assert cache.get('a') == {'sudoku': '1' * 81, 'solvable': True}
+    cache.close()
+
+    # Survives restart until expiration
+    restarted = SolutionCache(ttl=10, path=path, clock=clock)
+    assert restarted.get('b') == {'sudoku': '2' * 81, 'solvable': True}
+    clock.now += 10
+    assert restarted.get('a') is None
+    restarted.close()
+
+    # Expired entries are removed on start
+    SolutionCache(path=path, clock=clock).close()
+    with sqlite3.connect(path) as connection:
+        count = connection.execute('SELECT COUNT(*) FROM solutions')
+        assert count.fetchone() == (0,)
@@ -0,0 +1,80 @@
+import pytest
+from copy import deepcopy
+
+from sudoku_solver.canonical import Transform, canonicalize
+from sudoku_solver.solver import (
+    InvalidSudokuGrid, is_valid_sudoku_grid, solve_sudoku
+)
+from tests.test_data.sudoku_grids import (
+    ones_3x9, ones_9x5, zeros, grid1, grid2, difficult_case_grid,
+    adversarial_grid
+)
+
+
+# Bands swap, rows swap in the first band, stacks rotation, columns swap in
+# the last stack and digits shift
+SHUFFLE = Transform(
+    False,
+    [3, 5, 4, 0, 1, 2, 6, 7, 8],
+    [3, 4, 5, 6, 7, 8, 2, 1, 0],
+    [0, 2, 3, 4, 5, 6, 7, 8, 9, 1]
+)
+TRANSPOSE = Transform(True, list(range(9)), list(range(9)), list(range(10)))
+
+
+@pytest.mark.parametrize('transform', [SHUFFLE, TRANSPOSE])
+def test_transform_inverse(transform):
+    grid = deepcopy(difficult_case_grid)
+    transformed = transform.apply(grid)
+    assert grid == difficult_case_grid
+    assert transformed != grid
+    assert is_valid_sudoku_grid(transformed)
+    assert transform.inverse().apply(transformed) == grid
+    assert transform.inverse().inverse() == transform
+
+
+@pytest.mark.parametrize('grid', [
+    zeros, grid1, grid2, difficult_case_grid, adversarial_grid
+])
+def test_canonicalize(grid):
+    canonical, transform = canonicalize(grid)
+    assert transform.apply(grid) == canonical
+    assert transform.inverse().apply(canonical) == grid
+
+
+@pytest.mark.parametrize('grid', [difficult_case_grid, adversarial_grid])
+@pytest.mark.parametrize('transforms', [
+    [SHUFFLE],
+    [TRANSPOSE],
+    [SHUFFLE, TRANSPOSE, SHUFFLE],
+])
+def test_canonicalize_equivalent(grid, transforms):
+    equivalent = grid
+    for transform in transforms:
+        equivalent = transform.apply(equivalent)
+    assert canonicalize(equivalent)[0] == canonicalize(grid)[0]
+
+
+def test_canonical_solution():
+    grid = SHUFFLE.apply(difficult_case_grid)
+    canonical, transform = canonicalize(grid)
+    assert solve_sudoku(canonical)
+    solution = transform.inverse().apply(canonical)
+    expected = deepcopy(grid)
+    assert solve_sudoku(expected)
+    assert solution == expected
+
+
+def test_canonicalize_large():
+    grid = [[0] * 16 for _ in range(16)]
+    grid[0][:4] = [5, 6, 7, 8]
+    grid[15][15] = 16
+    canonical, transform = canonicalize(grid)
+    assert transform.inverse().apply(canonical) == grid
+    assert sum(1 for row in canonical for value in row if value) == 5
+
+
+@pytest.mark.parametrize('grid', [ones_3x9, ones_9x5])
+def test_canonicalize_wrong_dimension(grid):
+    with pytest.raises(InvalidSudokuGrid):
+        canonicalize(grid)
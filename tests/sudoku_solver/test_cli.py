@@ -0,0 +1,88 @@
+import pytest
+
+from sudoku_solver.cli import (
+    ABORTED, INVALID, NO_SOLUTION, SOLVED, UNSOLVABLE, main, read_chunks,
+    solve_chunks, solve_lines
+)
+from sudoku_solver.solver import grid_to_sudoku_str
+from tests.test_data.sudoku_grids import (
+    difficult_case_grid, difficult_case_grid_result, unsolvable_grid
+)
+
+sudoku = grid_to_sudoku_str(difficult_case_grid)
+solution = grid_to_sudoku_str(difficult_case_grid_result)
+unsolvable = grid_to_sudoku_str(unsolvable_grid)
+
+
+@pytest.mark.parametrize('line, output, status', [
+    (sudoku, f'{sudoku},{solution}', SOLVED),
+    (unsolvable, f'{unsolvable},{NO_SOLUTION}', UNSOLVABLE),
+    ('1' * 81, f'{"1" * 81},{NO_SOLUTION}', UNSOLVABLE),
+    ('abc', f'abc,{NO_SOLUTION}', INVALID),
+    ('a' * 81, f'{"a" * 81},{NO_SOLUTION}', INVALID),
+])
+def test_solve_lines(line, output, status):
+    assert solve_lines([line]) == [(output, status)]
+
+
+def test_solve_lines_aborted():
+    assert solve_lines(['.' * 81], max_nodes=1) == [
+        (f'{"." * 81},{NO_SOLUTION}', ABORTED)
+    ]
+
+
+@pytest.mark.parametrize('chunk_size, chunks', [
+    (1, [['a'], ['b'], ['c']]),
+    (2, [['a', 'b'], ['c']]),
+    (5, [['a', 'b', 'c']]),
+])
+def test_read_chunks(chunk_size, chunks):
+    lines = iter(['a\n', '\n', '  b \n', 'c'])
+    assert list(read_chunks(lines, chunk_size)) == chunks
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_solve_chunks_keeps_order(jobs):
+    chunks = [[sudoku], ['x'], [unsolvable, sudoku], ['y'], [sudoku]]
+    results = list(solve_chunks(iter(chunks), jobs))
+    assert [[status for _, status in chunk] for chunk in results] == [
+        [SOLVED], [INVALID], [UNSOLVABLE, SOLVED], [INVALID], [SOLVED]
+    ]
+
+
+@pytest.mark.parametrize('args', [
+    [],
+    ['--jobs', '2', '--chunk-size', '1'],
+    ['--engine', 'dlx', '--chunk-size', '2'],
+])
+def test_main(tmp_path, capsys, args):
+    path = tmp_path / 'sudokus.txt'
+    path.write_text(f'{sudoku}\n\n{unsolvable}\nabc\n{sudoku}\n')
+    assert main([str(path), *args]) == 0
+
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [
+        f'{sudoku},{solution}', f'{unsolvable},{NO_SOLUTION}',
+        f'abc,{NO_SOLUTION}', f'{sudoku},{solution}'
+    ]
+    assert '4 sudokus' in err
+    assert '2 solved, 1 unsolvable, 1 invalid, 0 aborted' in err
+
+
+def test_main_output_file(tmp_path, capsys):
+    source = tmp_path / 'sudokus.txt'
+    target = tmp_path / 'solutions.csv'
+    source.write_text(f'{sudoku}\n')
+    assert main([str(source), '--output', str(target)]) == 0
+    assert target.read_text() == f'{sudoku},{solution}\n'
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize('args', [
+    ['--jobs', '0'],
+    ['--chunk-size', '0'],
+    ['--engine', 'unknown'],
+])
+def test_main_wrong_arguments(args):
+    with pytest.raises(SystemExit):
+        main(args)
@@ -0,0 +1,83 @@
+import pytest
+
+from sudoku_solver.codec import (
+    PACKED_SIZE, pack, pack_sparse, unpack, unpack_sparse
+)
+from sudoku_solver.solver import InvalidSudokuGrid
+from tests.test_data.sudoku_grids import (
+    ones, zeros, grid1, grid2, grid2_result, difficult_case_grid
+)
+
+
+def flat(grid):
+    """Flat cells of the grid"""
+    return bytearray(value for row in grid for value in row)
+
+
+@pytest.mark.parametrize('grid', [
+    ones, zeros, grid1, grid2, grid2_result, difficult_case_grid
+])
+def test_pack(grid):
+    data = pack(flat(grid))
+    assert len(data) == PACKED_SIZE
+    assert unpack(data) == flat(grid)
+
+
+def test_pack_layout():
+    cells = bytearray(range(1, 10)) * 9
+    data = pack(cells)
+    assert data[:5] == bytes([0x12, 0x34, 0x56, 0x78, 0x91])
+    # The last cell in the high nibble of the last byte
+    assert data[-1] == 0x90
+
+
+@pytest.mark.parametrize('grid, size', [
+    (zeros, 11),
+    (ones, 52),
+    (grid1, 14),
+    (difficult_case_grid, 22),
+])
+def test_pack_sparse(grid, size):
+    data = pack_sparse(flat(grid))
+    assert len(data) == size
+    assert unpack_sparse(data) == flat(grid)
+
+
+@pytest.mark.parametrize('cells', [
+    bytearray(80),
+    bytearray(82),
+    bytearray([10]) + bytearray(80),
+])
+@pytest.mark.parametrize('encode', [pack, pack_sparse])
+def test_pack_wrong_cells(encode, cells):
+    with pytest.raises(InvalidSudokuGrid):
+        encode(cells)
+
+
+@pytest.mark.parametrize('data', [
+    bytes(40),
+    bytes(42),
+    b'\xa0' + bytes(40),
+    # Padding nibble is not empty
+    bytes(40) + b'\x01',
+])
+def test_unpack_wrong_data(data):
+    with pytest.raises(InvalidSudokuGrid):
+        unpack(data)
+
+
+@pytest.mark.parametrize('data', [
+    bytes(10),
+    # Bits after the 81st cell are set
+    bytes(10) + b'\x01',
+    # Missing givens
+    b'\x80' + bytes(10),
+    # Given is not a digit
+    b'\x80' + bytes(10) + b'\x00',
+    b'\x80' + bytes(10) + b'\xa0',
+    # Too many givens
+    b'\x80' + bytes(10) + b'\x10\x10',
+])
+def test_unpack_sparse_wrong_data(data):
+    with pytest.raises(InvalidSudokuGrid):
+        unpack_sparse(data)
@@ -0,0 +1,170 @@
+import pickle
+import pytest
+
+from sudoku_solver.cli import NO_SOLUTION, main
+from sudoku_solver.dataset import Dataset
+from sudoku_solver.pipeline import parse_cells
+from sudoku_solver.solver import InvalidSudokuString, grid_to_sudoku_str
+from tests.test_data.sudoku_grids import (
+    difficult_case_grid, difficult_case_grid_result, grid2, grid2_result,
+    unsolvable_grid
+)
+
+sudokus = [grid_to_sudoku_str(grid) for grid in (difficult_case_grid, grid2)]
+solutions = [
+    grid_to_sudoku_str(grid)
+    for grid in (difficult_case_grid_result, grid2_result)
+]
+
+
+@pytest.fixture
+def puzzles_path(tmp_path):
+    path = tmp_path / 'puzzles.txt'
+    path.write_text(''.join(f'{sudoku}\n' for sudoku in sudokus * 3))
+    return path
+
+
+@pytest.fixture
+def solutions_path(tmp_path):
+    path = tmp_path / 'solutions.csv'
+    path.write_text(''.join(
+        f'{sudoku},{solution}\n'
+        for sudoku, solution in zip(sudokus, solutions)
+    ))
+    return path
+
+
+def test_puzzles(puzzles_path):
+    with Dataset(puzzles_path) as dataset:
+        assert len(dataset) == 6
+        assert dataset.record_size == 82
+        assert not dataset.has_solutions
+        assert [bytes(record).decode() for record in dataset] == sudokus * 3
+        assert bytes(dataset[-1]).decode() == sudokus[1]
+        assert bytes(dataset.puzzle(2)).decode() == sudokus[0]
+        assert dataset.solution(2) is None
+        assert dataset.cells(1) == parse_cells(sudokus[1])
+        assert dataset.offset(3) == 246
+
+
+def test_solutions(solutions_path):
+    with Dataset(solutions_path) as dataset:
+        assert len(dataset) == 2
+        assert dataset.record_size == 164
+        assert dataset.has_solutions
+        for index in range(2):
+            assert bytes(dataset.puzzle(index)).decode() == sudokus[index]
+            assert bytes(dataset.solution(index)).decode() == solutions[index]
+
+
+def test_cli_output(tmp_path, capsys):
+    unsolvable = grid_to_sudoku_str(unsolvable_grid)
+    source = tmp_path / 'sudokus.txt'
+    target = tmp_path / 'solutions.csv'
+    source.write_text(f'{sudokus[0]}\n{unsolvable}\n{sudokus[1]}\n')
+    assert main([str(source), '--output', str(target)]) == 0
+
+    with Dataset(target) as dataset:
+        assert dataset.has_solutions
+        assert [
+            bytes(dataset.puzzle(index)).decode() for index in range(3)
+        ] == [sudokus[0], unsolvable, sudokus[1]]
+        assert [
+            bytes(dataset.solution(index)).decode() for index in range(3)
+        ] == [solutions[0], NO_SOLUTION, solutions[1]]
+
+
+def test_records_are_zero_copy(puzzles_path):
+    with Dataset(puzzles_path) as dataset:
+        record = dataset[0]
+        assert isinstance(record, memoryview)
+        assert record.obj is dataset.buffer().obj
+        record.release()
+
+
+def test_last_record_without_newline(tmp_path):
+    path = tmp_path / 'puzzles.txt'
+    path.write_text(f'{sudokus[0]}\n{sudokus[1]}')
+    with Dataset(path) as dataset:
+        assert len(dataset) == 2
+        assert bytes(dataset[1]).decode() == sudokus[1]
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_text('')
+    with Dataset(path) as dataset:
+        assert len(dataset) == 0
+        assert list(dataset) == []
+        assert dataset.shards(4) == []
+
+
+@pytest.mark.parametrize('content', [
+    'abc\n',
+    f'{sudokus[0]}\n{sudokus[1]}\n.\n',
+    f'{sudokus[0]}x\n',
+])
+def test_not_fixed_width(tmp_path, content):
+    path = tmp_path / 'puzzles.txt'
+    path.write_text(content)
+    with pytest.raises(InvalidSudokuString):
+        Dataset(path)
+
+
+@pytest.mark.parametrize('index', [6, -7])
+def test_index_out_of_range(puzzles_path, index):
+    with Dataset(puzzles_path) as dataset:
+        with pytest.raises(IndexError):
+            dataset[index]
+
+
+def test_invalid_record(tmp_path):
+    path = tmp_path / 'puzzles.txt'
+    path.write_text('x' * 81 + '\n')
+    with Dataset(path) as dataset:
+        with pytest.raises(InvalidSudokuString):
+            dataset.cells(0)
+
+
+@pytest.mark.parametrize('count, shards', [
+    (1, [range(0, 6)]),
+    (4, [range(0, 2), range(2, 4), range(4, 5), range(5, 6)]),
+    (8, [range(index, index + 1) for index in range(6)]),
+])
+def test_shards(puzzles_path, count, shards):
+    with Dataset(puzzles_path) as dataset:
+        assert dataset.shards(count) == shards
+        records = [
+            bytes(record)
+            for shard in dataset.shards(count)
+            for record in dataset.records(shard.start, shard.stop)
+        ]
+        assert records == [bytes(record) for record in dataset]
+
+
+@pytest.mark.parametrize('count', [0, -1])
+def test_shards_wrong_count(puzzles_path, count):
+    with Dataset(puzzles_path) as dataset:
+        with pytest.raises(ValueError):
+            dataset.shards(count)
+
+
+def test_pickle(puzzles_path):
+    with Dataset(puzzles_path) as dataset:
+        copy = pickle.loads(pickle.dumps(dataset))
+    with copy:
+        assert len(copy) == 6
+        assert bytes(copy[4]).decode() == sudokus[0]
+
+
+def test_from_dataset(tmp_path):
+    vectorized = pytest.importorskip('sudoku_solver.vectorized')
+    path = tmp_path / 'puzzles.txt'
+    path.write_text(f'{sudokus[0]}\n{"x" * 81}\n{sudokus[1]}')
+    with Dataset(path) as dataset:
+        cells = vectorized.from_dataset(dataset)
+        assert cells.shape == (3, 81)
+        assert bytes(cells[0]) == parse_cells(sudokus[0])
+        assert bytes(cells[2]) == parse_cells(sudokus[1])
+        assert vectorized.validate(cells).tolist() == [True, False, True]
+        assert vectorized.from_dataset(dataset, 1, 2).shape == (1, 81)
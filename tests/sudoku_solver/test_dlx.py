@@ -0,0 +1,88 @@
+import pytest
+from copy import deepcopy
+
+from sudoku_solver.dlx import DLXSolver
+from sudoku_solver.solver import InvalidSudokuGrid, SearchAborted
+from tests.test_data.sudoku_grids import (
+    ones, ones_3x9, ones_9x5, zeros, grid1, grid2, difficult_case_grid,
+    difficult_case_grid_result, adversarial_grid, adversarial_grid_result,
+    unsolvable_grid
+)
+
+
+@pytest.mark.parametrize('sudoku_grid, result_grid, is_solved', [
+    (difficult_case_grid, difficult_case_grid_result, True),
+    (adversarial_grid, adversarial_grid_result, True),
+    (unsolvable_grid, unsolvable_grid, False),
+    (ones, ones, False),
+])
+def test_solve(sudoku_grid, result_grid, is_solved):
+    grid = deepcopy(sudoku_grid)
+    assert DLXSolver(grid).solve() is is_solved
+    assert grid == result_grid
+
+
+@pytest.mark.parametrize('grid, limit, count', [
+    (difficult_case_grid, None, 1),
+    (difficult_case_grid, 2, 1),
+    (grid1, 2, 2),
+    (grid2, 10, 10),
+    (zeros, 1, 1),
+    (unsolvable_grid, 2, 0),
+    (ones, 2, 0),
+])
+def test_count_solutions(grid, limit, count):
+    solver = DLXSolver(deepcopy(grid))
+    assert solver.count_solutions(limit) == count
+    assert (solver.solution is not None) is bool(count)
+
+
+@pytest.mark.parametrize('grid, unique', [
+    (difficult_case_grid, True),
+    (adversarial_grid, True),
+    (grid2, False),
+    (unsolvable_grid, False),
+])
+def test_is_unique(grid, unique):
+    assert DLXSolver(deepcopy(grid)).is_unique() is unique
+
+
+def test_search_restores_matrix():
+    solver = DLXSolver(deepcopy(grid2))
+    links = deepcopy((solver.left, solver.right, solver.up, solver.down))
+    sizes = solver.size[:]
+
+    assert solver.count_solutions(5) == 5
+    assert (solver.left, solver.right, solver.up, solver.down) == links
+    assert solver.size == sizes
+    assert solver.count_solutions(5) == 5
+
+
+@pytest.mark.parametrize('options', [
+    {'max_nodes': 10},
+    {'time_limit': 0},
+])
+def test_search_aborted_restores_matrix(options):
+    grid = deepcopy(difficult_case_grid)
+    solver = DLXSolver(grid, **options)
+    links = deepcopy((solver.left, solver.right, solver.up, solver.down))
+    sizes = solver.size[:]
+
+    with pytest.raises(SearchAborted):
+        solver.solve()
+    assert (solver.left, solver.right, solver.up, solver.down) == links
+    assert solver.size == sizes
+    assert not solver.partial
+    assert grid == difficult_case_grid
+
+
+def test_count_solutions_does_not_modify_grid():
+    grid = deepcopy(grid2)
+    DLXSolver(grid).count_solutions(2)
+    assert grid == grid2
+
+
+@pytest.mark.parametrize('grid', [ones_3x9, ones_9x5, bytearray(80)])
+def test_wrong_dimension(grid):
+    with pytest.raises(InvalidSudokuGrid):
+        DLXSolver(grid)
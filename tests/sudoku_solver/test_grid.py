@@ -0,0 +1,136 @@
+import pytest
+import sys
+from copy import deepcopy
+
+from sudoku_solver.canonical import canonicalize
+from sudoku_solver.grid import Grid
+from sudoku_solver.solver import (
+    InvalidSudokuGrid, InvalidSudokuString, BITMASK, DLX, count_solutions,
+    find_conflict, grid_to_sudoku_str, is_safe, is_unique,
+    is_valid_sudoku_grid, solve_sudoku
+)
+from tests.test_data.sudoku_grids import (
+    ones, zeros, grid1, difficult_case_grid, difficult_case_grid_result
+)
+
+
+DIFFICULT_STR = grid_to_sudoku_str(difficult_case_grid)
+
+
+def test_from_str_round_trip():
+    grid = Grid.from_str(DIFFICULT_STR.replace('.', '0'))
+    assert grid.to_str() == DIFFICULT_STR
+    assert grid == difficult_case_grid
+    assert grid.to_rows() == difficult_case_grid
+    assert grid_to_sudoku_str(grid) == DIFFICULT_STR
+
+
+@pytest.mark.parametrize('sudoku_str', ['1' * 15, 'zaq' * 27])
+def test_from_str_invalid(sudoku_str):
+    with pytest.raises(InvalidSudokuString):
+        Grid.from_str(sudoku_str)
+
+
+@pytest.mark.parametrize('cells', [bytes(80), bytes(9), [1] * 82])
+def test_wrong_dimension(cells):
+    with pytest.raises(InvalidSudokuGrid):
+        Grid(cells)
+
+
+def test_from_rows_wrong_dimension():
+    with pytest.raises(InvalidSudokuGrid):
+        Grid.from_rows([[0] * 27] * 3)
+
+
+def test_empty_grid():
+    assert Grid() == zeros
+    large = Grid(box_size=4)
+    assert len(large) == 16
+    assert len(large.cells) == 256
+
+
+def test_indexing():
+    grid = Grid.from_rows(difficult_case_grid)
+    assert grid[0][8] == grid[0, 8] == 8
+    assert list(grid[-1]) == difficult_case_grid[-1]
+    grid[0][0] = 1
+    grid[1, 1] = 2
+    assert grid.cells[:11] == bytes([1, 0, 0, 0, 0, 0, 0, 0, 8, 0, 2])
+    with pytest.raises(IndexError):
+        grid[9]
+
+
+@pytest.mark.parametrize('index', [(0, 9), (9, 0), (-1, 0), (0, -1)])
+def test_cell_index_out_of_range(index):
+    grid = Grid.from_rows(difficult_case_grid)
+    with pytest.raises(IndexError):
+        grid[index]
+    with pytest.raises(IndexError):
+        grid[index] = 1
+    assert grid == difficult_case_grid
+
+
+def test_copy_and_view():
+    grid = Grid.from_rows(grid1)
+    copy = grid.copy()
+    copy[0, 2] = 9
+    assert grid == grid1
+    assert copy != grid
+
+    view = grid.view()
+    view[2] = 9
+    assert grid[0, 2] == 9
+    assert bytes(view) == bytes(grid.cells)
+
+
+@pytest.mark.parametrize('box_size', [2, 3, 4])
+def test_view(box_size):
+    grid = Grid(box_size=box_size)
+    view = grid.view()
+    assert not view.readonly
+    assert view.format == 'B'
+    assert view.nbytes == box_size ** 4
+    view[-1] = 1
+    assert grid[-1][-1] == 1
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason='buffer protocol needs Python 3.12+'
+)
+def test_buffer_protocol():
+    grid = Grid.from_rows(grid1)
+    view = memoryview(grid)
+    view[2] = 9
+    assert grid[0, 2] == 9
+
+
+def test_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Grid().name = 'grid'
+
+
+@pytest.mark.parametrize('row, column, value', [
+    (0, 0, 8), (0, 0, 4), (0, 0, 1), (4, 4, 6), (4, 4, 3),
+])
+def test_is_safe(row, column, value):
+    grid = Grid.from_rows(difficult_case_grid)
+    assert grid.is_safe(row, column, value) is is_safe(
+        difficult_case_grid, row, column, value
+    )
+
+
+@pytest.mark.parametrize('engine', [BITMASK, DLX])
+def test_solver_functions_accept_grid(engine):
+    grid = Grid.from_str(DIFFICULT_STR)
+    assert is_valid_sudoku_grid(grid)
+    assert find_conflict(Grid.from_rows(ones))[0] == 'row'
+    assert is_unique(grid, engine)
+    assert count_solutions(grid.copy(), 2, engine) == 1
+    assert solve_sudoku(grid, engine)
+    assert grid == difficult_case_grid_result
+
+
+def test_canonicalize_accepts_grid():
+    assert canonicalize(Grid.from_rows(difficult_case_grid)) == canonicalize(
+        deepcopy(difficult_case_grid)
+    )
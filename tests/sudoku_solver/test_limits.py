@@ -0,0 +1,48 @@
+import pytest
+
+from sudoku_solver.limits import CHECK_INTERVAL, SearchLimits
+from sudoku_solver.solver import SearchAborted
+
+
+class FakeClock:
+    """Clock moved forward manually"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_no_limits():
+    limits = SearchLimits()
+    assert limits.deadline is None
+    assert limits.next_check == float('inf')
+
+
+def test_node_budget():
+    limits = SearchLimits(max_nodes=10)
+    assert limits.next_check == 11
+    limits.check(10)
+    with pytest.raises(SearchAborted, match='budget of 10 nodes'):
+        limits.check(11)
+
+
+def test_time_limit():
+    clock = FakeClock()
+    limits = SearchLimits(time_limit=2, clock=clock)
+    assert limits.deadline == 102
+    assert limits.next_check == CHECK_INTERVAL
+
+    clock.now += 1
+    limits.check(CHECK_INTERVAL)
+    assert limits.next_check == 2 * CHECK_INTERVAL
+    clock.now += 1
+    with pytest.raises(SearchAborted, match='time limit'):
+        limits.check(2 * CHECK_INTERVAL)
+
+
+def test_next_check_does_not_skip_node_budget():
+    limits = SearchLimits(max_nodes=CHECK_INTERVAL + 10, time_limit=60)
+    limits.check(CHECK_INTERVAL)
+    assert limits.next_check == CHECK_INTERVAL + 11
@@ -0,0 +1,88 @@
+import pytest
+from contextlib import contextmanager
+
+from sudoku_solver.pipeline import (
+    format_cells, parse_bytes, parse_cells, solve_cells, solve_sudoku_str
+)
+from sudoku_solver.solver import (
+    InvalidSudokuGrid, InvalidSudokuString, BITMASK, DLX, grid_to_sudoku_str
+)
+from tests.test_data.sudoku_grids import (
+    ones, grid2, grid2_result, difficult_case_grid,
+    difficult_case_grid_result, adversarial_grid, adversarial_grid_result,
+    unsolvable_grid
+)
+
+
+@contextmanager
+def does_not_raise():
+    yield
+
+
+def flat(grid):
+    """Flat cells of the grid"""
+    return bytearray(value for row in grid for value in row)
+
+
+@pytest.mark.parametrize('sudoku_str, cells, expectation', [
+    ('.' * 81, bytearray(81), does_not_raise()),
+    ('0' * 81, bytearray(81), does_not_raise()),
+    ('123456789' * 9, bytearray(range(1, 10)) * 9, does_not_raise()),
+    # Other decimal characters are accepted like by `sudoku_str_to_grid`
+    ('٣' + '.' * 80, bytearray([3]) + bytearray(80), does_not_raise()),
+    ('1' * 15, None, pytest.raises(InvalidSudokuString)),
+    ('zaq' * 27, None, pytest.raises(InvalidSudokuString)),
+    ('.' * 80 + 'é', None, pytest.raises(InvalidSudokuString)),
+])
+def test_parse_cells(sudoku_str, cells, expectation):
+    with expectation:
+        assert parse_cells(sudoku_str) == cells
+
+
+@pytest.mark.parametrize('data, cells, expectation', [
+    (b'.' * 81, bytearray(81), does_not_raise()),
+    (memoryview(b'123456789' * 9), bytearray(range(1, 10)) * 9,
+     does_not_raise()),
+    (b'1' * 82, None, pytest.raises(InvalidSudokuString)),
+    (b'.' * 80 + b',', None, pytest.raises(InvalidSudokuString)),
+])
+def test_parse_bytes(data, cells, expectation):
+    with expectation:
+        assert parse_bytes(data) == cells
+
+
+@pytest.mark.parametrize('grid', [ones, grid2, difficult_case_grid])
+def test_format_cells(grid):
+    sudoku_str = grid_to_sudoku_str(grid)
+    assert format_cells(flat(grid)) == sudoku_str
+    assert parse_cells(sudoku_str) == flat(grid)
+
+
+def test_format_cells_wrong_dimension():
+    with pytest.raises(InvalidSudokuGrid):
+        format_cells(bytearray(27))
+
+
+@pytest.mark.parametrize('engine', [BITMASK, DLX])
+@pytest.mark.parametrize('grid, result, is_solved', [
+    (grid2, grid2_result, True),
+    (difficult_case_grid, difficult_case_grid_result, True),
+    (adversarial_grid, adversarial_grid_result, True),
+    (unsolvable_grid, unsolvable_grid, False),
+    (ones, ones, False),
+])
+def test_solve_cells(engine, grid, result, is_solved):
+    cells = flat(grid)
+    assert solve_cells(cells, engine) is is_solved
+    if engine == BITMASK or grid is not grid2:
+        assert cells == flat(result)
+
+
+@pytest.mark.parametrize('grid, result, is_solved', [
+    (difficult_case_grid, difficult_case_grid_result, True),
+    (ones, ones, False),
+])
+def test_solve_sudoku_str(grid, result, is_solved):
+    assert solve_sudoku_str(grid_to_sudoku_str(grid).replace('.', '0')) == (
+        grid_to_sudoku_str(result), is_solved
+    )
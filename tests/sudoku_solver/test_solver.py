@@ -1,21 +1,31 @@
 import pytest
 from contextlib import contextmanager
+from copy import deepcopy
 
 from sudoku_solver.solver import (
     is_valid_column,
     is_valid_row,
     is_valid_boxes,
     is_valid_sudoku_grid,
+    find_conflict,
     grid_to_sudoku_str,
     sudoku_str_to_grid,
     is_safe,
     solve_sudoku,
+    create_solver,
+    count_solutions,
+    is_unique,
     InvalidSudokuString,
-    InvalidSudokuGrid
+    InvalidSudokuGrid,
+    BITMASK,
+    DLX
 )
+from sudoku_solver.bitmask import BitmaskSolver
+from sudoku_solver.dlx import DLXSolver
 from tests.test_data.sudoku_grids import (
     ones, zeros, ones_3x9, ones_9x5, valid_rows, valid_cols, valid_boxes,
-    grid1, grid2, grid2_result, difficult_case_grid, difficult_case_grid_result
+    grid1, grid2, grid2_result, difficult_case_grid,
+    difficult_case_grid_result, unsolvable_grid
 )
 
 
@@ -70,6 +80,39 @@ def test_is_valid_sudoku_grid(grid, result):
     assert is_valid_sudoku_grid(grid) is result
 
 
+def grid_with(values, size=9):
+    """Empty grid with given values placed in (row, column) cells"""
+    grid = [[0] * size for _ in range(size)]
+    for (row, column), value in values.items():
+        grid[row][column] = value
+    return grid
+
+
+@pytest.mark.parametrize('grid, conflict', [
+    (zeros, None),
+    (difficult_case_grid, None),
+    (grid_with({}, 16), None),
+    (ones, ('row', 1, (0, 0), (0, 1))),
+    (grid_with({(0, 4): 5, (8, 4): 5}), ('column', 5, (0, 4), (8, 4))),
+    (grid_with({(0, 0): 3, (1, 1): 3}), ('box', 3, (0, 0), (1, 1))),
+    (grid_with({(4, 4): 10}), ('range', 10, (4, 4), (4, 4))),
+    # The first conflicting cell in reading order
+    (
+        grid_with({(2, 0): 7, (2, 8): 7, (1, 3): 4, (1, 5): 4}),
+        ('row', 4, (1, 3), (1, 5))
+    ),
+])
+def test_find_conflict(grid, conflict):
+    assert find_conflict(grid) == conflict
+    assert is_valid_sudoku_grid(grid) is (conflict is None)
+
+
+@pytest.mark.parametrize('grid', [ones_3x9, ones_9x5])
+def test_find_conflict_wrong_dimension(grid):
+    with pytest.raises(InvalidSudokuGrid):
+        find_conflict(grid)
+
+
 @pytest.mark.parametrize('grid, sudoku_str, expectation', [
     (None, "1"*15, pytest.raises(InvalidSudokuString)),
     (zeros, "."*81, does_not_raise()),
@@ -115,6 +158,63 @@ def test_is_safe(grid, x, y, val, result):
     (difficult_case_grid, difficult_case_grid_result, True)
 ])
 def test_solving_sudoku_workflow(sudoku_grid, result_grid, is_solved):
-    result = sudoku_grid.copy()
+    result = deepcopy(sudoku_grid)
     assert solve_sudoku(result) == is_solved
     assert result == result_grid
+
+
+@pytest.mark.parametrize('engine', [BITMASK, DLX])
+def test_solving_sudoku_engines(engine):
+    result = deepcopy(difficult_case_grid)
+    assert solve_sudoku(result, engine=engine)
+    assert result == difficult_case_grid_result
+
+
+@pytest.mark.parametrize('engine, options, solver_class, expectation', [
+    (BITMASK, {}, BitmaskSolver, does_not_raise()),
+    (BITMASK, {'cell_order': 'mrv'}, BitmaskSolver, does_not_raise()),
+    (DLX, {}, DLXSolver, does_not_raise()),
+    ('unknown', {}, None, pytest.raises(ValueError)),
+])
+def test_create_solver(engine, options, solver_class, expectation):
+    with expectation:
+        assert isinstance(
+            create_solver(deepcopy(grid2), engine, **options), solver_class
+        )
+
+
+@pytest.mark.parametrize('engine', [BITMASK, DLX])
+@pytest.mark.parametrize('sudoku_grid, limit, count, result_grid', [
+    (difficult_case_grid, 2, 1, difficult_case_grid_result),
+    (grid1, 3, 3, None),
+    (unsolvable_grid, 2, 0, unsolvable_grid),
+])
+def test_count_solutions(engine, sudoku_grid, limit, count, result_grid):
+    grid = deepcopy(sudoku_grid)
+    assert count_solutions(grid, limit, engine) == count
+    if result_grid:
+        assert grid == result_grid
+    else:
+        assert is_valid_sudoku_grid(grid)
+        assert all(value for row in grid for value in row)
+
+
+@pytest.mark.parametrize('engine', [BITMASK, DLX])
+@pytest.mark.parametrize('limit', [0, -1])
+def test_count_solutions_wrong_limit(engine, limit):
+    grid = deepcopy(difficult_case_grid)
+    with pytest.raises(ValueError):
+        count_solutions(grid, limit, engine)
+    assert grid == difficult_case_grid
+
+
+@pytest.mark.parametrize('engine', [BITMASK, DLX])
+@pytest.mark.parametrize('sudoku_grid, unique', [
+    (difficult_case_grid, True),
+    (grid1, False),
+    (unsolvable_grid, False),
+])
+def test_is_unique(engine, sudoku_grid, unique):
+    grid = deepcopy(sudoku_grid)
+    assert is_unique(grid, engine) is unique
+    assert grid == sudoku_grid
@@ -0,0 +1,95 @@
+import pytest
+from copy import deepcopy
+
+from sudoku_solver.solver import ENGINES, create_solver
+from sudoku_solver.stats import SearchStats, timed
+from tests.test_data.sudoku_grids import (
+    difficult_case_grid, grid2, ones, unsolvable_grid
+)
+
+
+@pytest.mark.parametrize('engine', sorted(ENGINES))
+@pytest.mark.parametrize('grid, limit, solutions', [
+    (difficult_case_grid, None, 1),
+    (grid2, 10, 10),
+    (unsolvable_grid, 2, 0),
+    (ones, 2, 0),
+])
+def test_search_stats(engine, grid, limit, solutions):
+    stats = SearchStats()
+    solver = create_solver(deepcopy(grid), engine, stats=stats)
+    assert solver.count_solutions(limit) == solutions
+
+    assert stats.solutions == solutions
+    assert stats.nodes == solver.nodes
+    assert stats.guesses <= stats.nodes
+    assert stats.max_depth <= 81
+    assert stats.time >= 0
+    if solutions > 1:
+        assert stats.guesses > 0
+
+
+@pytest.mark.parametrize('engine', sorted(ENGINES))
+def test_search_stats_last_candidate_is_forced(engine):
+    # Two solutions differing by swapped 1 and 2 in the top-left rectangle
+    grid = [
+        [0, 0, 3, 4, 5, 6, 7, 8, 9],
+        [4, 5, 6, 7, 8, 9, 1, 2, 3],
+        [7, 8, 9, 1, 2, 3, 4, 5, 6],
+        [0, 0, 4, 3, 6, 5, 8, 9, 7],
+        [3, 6, 5, 8, 9, 7, 2, 1, 4],
+        [8, 9, 7, 2, 1, 4, 3, 6, 5],
+        [5, 3, 1, 6, 4, 2, 9, 7, 8],
+        [6, 4, 2, 9, 7, 8, 5, 3, 1],
+        [9, 7, 8, 5, 3, 1, 6, 4, 2],
+    ]
+    stats = SearchStats()
+    assert create_solver(grid, engine, stats=stats).count_solutions() == 2
+
+    assert stats.guesses == 1
+    assert stats.forced == 7
+
+
+@pytest.mark.parametrize('engine', sorted(ENGINES))
+def test_search_stats_disabled(engine):
+    grid = deepcopy(difficult_case_grid)
+    solver = create_solver(grid, engine)
+    assert solver.solve()
+    assert solver.stats is None
+
+    stats = SearchStats()
+    stats_solver = create_solver(
+        deepcopy(difficult_case_grid), engine, stats=stats
+    )
+    assert stats_solver.solve()
+    assert stats_solver.nodes == solver.nodes
+
+
+def test_search_stats_accumulate():
+    stats = SearchStats()
+    for _ in range(2):
+        create_solver(deepcopy(difficult_case_grid), stats=stats).solve()
+    once = SearchStats()
+    create_solver(deepcopy(difficult_case_grid), stats=once).solve()
+    assert stats.nodes == 2 * once.nodes
+    assert stats.solutions == 2
+    assert stats.max_depth == once.max_depth
+
+
+def test_to_dict():
+    stats = SearchStats()
+    stats.nodes = 3
+    assert stats.to_dict() == {
+        'nodes': 3, 'guesses': 0, 'forced': 0, 'backtracks': 0,
+        'max_depth': 0, 'solutions': 0, 'time': 0.0,
+    }
+    assert repr(stats).startswith('SearchStats(nodes=3, ')
+
+
+def test_timed():
+    stats = SearchStats()
+    with timed(stats):
+        pass
+    assert stats.time > 0
+    with timed(None):
+        pass
@@ -0,0 +1,86 @@
+import pytest
+
+from sudoku_solver.solver import InvalidSudokuGrid, is_safe
+from sudoku_solver.tables import (
+    BOX_OF, PEER_POSITIONS, PEERS, UNITS, build_tables, cells_tables,
+    grid_tables, size_positions
+)
+from tests.test_data.sudoku_grids import ones_3x9, ones_9x5, zeros
+
+
+@pytest.mark.parametrize('box_size, peers', [
+    (2, 7),
+    (3, 20),
+    (4, 39),
+])
+def test_build_tables(box_size, peers):
+    size = box_size * box_size
+    row_of, column_of, box_of, units, cell_peers = build_tables(box_size)
+    assert len(units) == 3 * size
+    assert sorted(cell for unit in units for cell in unit) == sorted(
+        list(range(size * size)) * 3
+    )
+    assert all(len(unit) == size for unit in units)
+    assert all(len(cell_peers[cell]) == peers for cell in range(size * size))
+    for cell in range(size * size):
+        assert cell in units[row_of[cell]]
+        assert cell in units[size + column_of[cell]]
+        assert cell in units[2 * size + box_of[cell]]
+        assert cell not in cell_peers[cell]
+
+
+@pytest.mark.parametrize('cell, box', [
+    (0, 0), (8, 2), (30, 4), (54, 6), (80, 8),
+])
+def test_box_of(cell, box):
+    assert BOX_OF[cell] == box
+    assert cell in UNITS[18 + box]
+
+
+def test_tables_are_shared():
+    assert grid_tables(zeros) is cells_tables(bytes(81))
+    assert grid_tables(zeros)[4] is PEERS
+    assert cells_tables(bytes(256)) is cells_tables(bytearray(256))
+
+
+@pytest.mark.parametrize('grid', [ones_3x9, ones_9x5, [[0] * 8] * 8])
+def test_grid_tables_wrong_dimension(grid):
+    with pytest.raises(InvalidSudokuGrid):
+        grid_tables(grid)
+
+
+@pytest.mark.parametrize('size', [4, 9, 16])
+def test_size_positions(size):
+    unit_positions, peer_positions = size_positions(size)
+    _, _, _, units, peers = cells_tables(bytes(size * size))
+    assert unit_positions == [
+        [divmod(cell, size) for cell in unit] for unit in units
+    ]
+    assert peer_positions == [
+        [divmod(peer, size) for peer in cell_peers] for cell_peers in peers
+    ]
+
+
+def test_size_positions_shared():
+    assert size_positions(9)[1] is PEER_POSITIONS
+
+
+@pytest.mark.parametrize('size', [0, 3, 8])
+def test_size_positions_wrong_size(size):
+    with pytest.raises(InvalidSudokuGrid):
+        size_positions(size)
+
+
+@pytest.mark.parametrize('row, column, value, result', [
+    (0, 0, 1, False),
+    (0, 3, 1, False),
+    (1, 2, 1, True),
+    (1, 1, 1, False),
+    (2, 2, 2, True),
+    (3, 0, 1, False),
+])
+def test_is_safe_4x4(row, column, value, result):
+    grid = [[0] * 4 for _ in range(4)]
+    grid[0][0] = 1
+    grid[2][3] = 1
+    assert is_safe(grid, row, column, value) is result
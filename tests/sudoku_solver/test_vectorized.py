@@ -0,0 +1,130 @@
+import pytest
+
+from sudoku_solver import codec
+from sudoku_solver.solver import (
+    InvalidSudokuGrid, is_valid_sudoku_grid, solve_sudoku, sudoku_str_to_grid
+)
+from tests.test_data.sudoku_grids import (
+    ones, zeros, valid_rows, valid_cols, valid_boxes, grid1, grid2,
+    grid2_result, unsolvable_grid
+)
+
+np = pytest.importorskip('numpy')
+vectorized = pytest.importorskip('sudoku_solver.vectorized')
+
+# Solved by naked and hidden singles only
+easy_grid = sudoku_str_to_grid(
+    '..98..7.41..5..6...3...7.9.5.27.8.3..81.5...664.123.5....24.3..9..6.18..'
+    '..5..9.2.'
+)
+
+
+def to_array(*grids):
+    return np.array(
+        [[value for row in grid for value in row] for grid in grids],
+        dtype=np.uint8
+    )
+
+
+def test_validate():
+    grids = [
+        ones, zeros, valid_rows, valid_cols, valid_boxes, grid1, grid2,
+        unsolvable_grid
+    ]
+    assert vectorized.validate(to_array(*grids)).tolist() == [
+        is_valid_sudoku_grid(grid) for grid in grids
+    ]
+
+
+def test_validate_out_of_range():
+    cells = to_array(zeros)
+    cells[0, 40] = 10
+    assert vectorized.validate(cells).tolist() == [False]
+
+
+@pytest.mark.parametrize('cells', [
+    np.zeros(81, dtype=np.uint8),
+    np.zeros((2, 80), dtype=np.uint8),
+    np.zeros((1, 9, 9), dtype=np.uint8),
+])
+def test_wrong_shape(cells):
+    with pytest.raises(InvalidSudokuGrid):
+        vectorized.validate(cells)
+    with pytest.raises(InvalidSudokuGrid):
+        vectorized.solve(cells)
+
+
+def test_candidates():
+    masks = vectorized.candidates(to_array(valid_rows))
+    assert not masks.any()
+    masks = vectorized.candidates(to_array(zeros))
+    assert (masks == 0b111111111).all()
+
+
+def test_propagate():
+    cells = to_array(easy_grid, grid2)
+    propagated, dead = vectorized.propagate(cells)
+    assert dead.tolist() == [False, False]
+    assert (propagated[0] > 0).all()
+    assert vectorized.validate(propagated).all()
+    # Sent array is not modified
+    assert (cells == to_array(easy_grid, grid2)).all()
+
+
+def test_propagate_dead():
+    grid = [row[:] for row in zeros]
+    grid[0] = [0, 1, 2, 3, 4, 5, 6, 7, 8]
+    grid[1][0] = 9
+    _, dead = vectorized.propagate(to_array(grid))
+    assert dead.tolist() == [True]
+
+
+def test_solve():
+    grids = [easy_grid, grid2, ones, unsolvable_grid, zeros]
+    cells = to_array(*grids)
+    solutions, solvable = vectorized.solve(cells)
+
+    expected = []
+    for grid in grids:
+        grid = [row[:] for row in grid]
+        expected.append(solve_sudoku(grid))
+    assert solvable.tolist() == expected
+    assert solutions[1].tolist() == to_array(grid2_result)[0].tolist()
+    for index, is_solvable in enumerate(expected):
+        if is_solvable:
+            assert (solutions[index] > 0).all()
+            assert vectorized.validate(solutions[index:index + 1])[0]
+            givens = cells[index] > 0
+            assert (solutions[index][givens] == cells[index][givens]).all()
+        else:
+            assert (solutions[index] == cells[index]).all()
+
+
+def test_solve_chunks(monkeypatch):
+    monkeypatch.setattr(vectorized, 'CHUNK_SIZE', 2)
+    cells = to_array(easy_grid, ones, easy_grid, zeros, easy_grid)
+    solutions, solvable = vectorized.solve(cells)
+    assert solvable.tolist() == [True, False, True, True, True]
+    assert (solutions[0] == solutions[2]).all()
+    assert (solutions[0] == solutions[4]).all()
+
+
+def test_pack():
+    cells = to_array(easy_grid, grid2, grid2_result, zeros, ones)
+    packed = vectorized.pack(cells)
+    assert packed.shape == (5, codec.PACKED_SIZE)
+    for row, data in zip(cells, packed):
+        assert bytes(data) == codec.pack(bytearray(row))
+    assert (vectorized.unpack(packed) == cells).all()
+
+
+def test_pack_out_of_range():
+    cells = to_array(zeros)
+    cells[0, 0] = 10
+    with pytest.raises(InvalidSudokuGrid):
+        vectorized.pack(cells)
+
+
+def test_unpack_wrong_shape():
+    with pytest.raises(InvalidSudokuGrid):
+        vectorized.unpack(np.zeros((1, 40), dtype=np.uint8))
@@ -118,3 +118,41 @@ difficult_case_grid_result = [
     [9, 1, 6, 3, 5, 4, 8, 2, 7],
     [4, 7, 5, 2, 8, 6, 9, 1, 3]
 ]
+
+# Valid grid (no duplicates) without solution - no digit fits top right cell
+unsolvable_grid = [
+    [1, 2, 3, 4, 5, 6, 7, 8, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 9],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0]
+]
+
+# Few clues in the top rows - expensive for row-major cell selection
+adversarial_grid = [
+    [0, 9, 0, 0, 0, 0, 4, 0, 0],
+    [0, 0, 8, 5, 0, 0, 0, 1, 0],
+    [0, 0, 1, 0, 0, 0, 0, 6, 8],
+    [0, 0, 0, 1, 0, 0, 0, 3, 0],
+    [0, 0, 0, 0, 4, 5, 7, 0, 0],
+    [0, 5, 0, 0, 0, 7, 0, 0, 0],
+    [0, 7, 0, 0, 9, 0, 2, 0, 0],
+    [0, 0, 3, 6, 0, 0, 0, 0, 0],
+    [8, 0, 0, 0, 0, 0, 0, 0, 0]
+]
+
+adversarial_grid_result = [
+    [7, 9, 6, 3, 1, 8, 4, 5, 2],
+    [4, 3, 8, 5, 2, 6, 9, 1, 7],
+    [5, 2, 1, 9, 7, 4, 3, 6, 8],
+    [2, 8, 7, 1, 6, 9, 5, 3, 4],
+    [3, 6, 9, 8, 4, 5, 7, 2, 1],
+    [1, 5, 4, 2, 3, 7, 8, 9, 6],
+    [6, 7, 5, 4, 9, 1, 2, 8, 3],
+    [9, 4, 3, 6, 8, 2, 1, 7, 5],
+    [8, 1, 2, 7, 5, 3, 6, 4, 9]
+]